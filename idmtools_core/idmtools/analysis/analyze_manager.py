@@ -12,7 +12,8 @@ from logging import getLogger, DEBUG
 from typing import NoReturn, List, Dict, Tuple, Optional, TYPE_CHECKING
 from tqdm import tqdm
 from idmtools import IdmConfigParser
-from idmtools.analysis.map_worker_entry import map_item
+from idmtools.analysis.map_result_cache import MapResultCache
+from idmtools.analysis.map_worker_entry import map_item, map_batch
 from idmtools.core import NoPlatformException
 from idmtools.core.enums import ItemType
 from idmtools.core.interfaces.ientity import IEntity
@@ -74,7 +75,8 @@ class AnalyzeManager:
                  partial_analyze_ok: bool = False, max_items: Optional[int] = None, verbose: bool = True,
                  force_manager_working_directory: bool = False,
                  exclude_ids: List[str] = None, analyze_failed_items: bool = False,
-                 max_workers: Optional[int] = None, executor_type: str = 'process'):
+                 max_workers: Optional[int] = None, executor_type: str = 'process', batch_size: Optional[int] = None,
+                 cache_map_results: bool = False, force_remap: bool = False, map_cache: MapResultCache = None):
         """
         Initialize the AnalyzeManager.
 
@@ -92,6 +94,10 @@ class AnalyzeManager:
             analyze_failed_items (bool, optional): Allows analyzing of failed items. Useful when you are trying to aggregate items that have failed. Defaults to False.
             max_workers (int, optional): Set the max workers. If not provided, falls back to the configuration item *max_threads*. If max_workers is not set in configuration, defaults to CPU count
             executor_type: (str): Whether to use process or thread pooling. Process pooling is more efficient but threading might be required in some environments
+            batch_size (int, optional): How many items are sent to a worker at once. If not provided, falls back to the configuration item *map_batch_size*. If map_batch_size is not set in configuration, it is derived from the number of items and workers
+            cache_map_results (bool, optional): Persist the map results of each item/analyzer and reuse them in later runs. Defaults to False.
+            force_remap (bool, optional): Ignore previously cached map results and map every item again. Defaults to False.
+            map_cache (MapResultCache, optional): Cache to use for map results. Implies cache_map_results. Defaults to a MapResultCache in the cache_directory.
         """
         super().__init__()
         if working_dir is None:
@@ -121,6 +127,17 @@ class AnalyzeManager:
         if logger.isEnabledFor(DEBUG):
             logger.debug(f'AnalyzeManager set to {self.max_processes}')
 
+        if batch_size is None:
+            # check for batch size on platform, then in common
+            if self.platform and hasattr(self.platform, '_config_block') and IdmConfigParser.get_option(self.platform._config_block, "map_batch_size", None):
+                self.configuration['map_batch_size'] = int(IdmConfigParser.get_option(self.platform._config_block, "map_batch_size", None))
+            elif IdmConfigParser().get_option('COMMON', 'map_batch_size', None):
+                self.configuration['map_batch_size'] = int(IdmConfigParser().get_option('COMMON', 'map_batch_size'))
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be greater or equal to one")
+        # None means the batch size is derived from the number of items at analysis time
+        self.batch_size = batch_size if batch_size is not None else self.configuration.get('map_batch_size', None)
+
         # Should we continue analyzing even when we encounter an error?
         self.continue_on_error = False
 
@@ -166,9 +183,19 @@ class AnalyzeManager:
 
         self._items = dict()  # filled in later by _get_items_to_analyze
 
+        # accumulators of the streaming analyzers (see IAnalyzer.reduce_partial) and how many items they folded
+        self._accumulators = dict()
+        self._partial_counts = dict()
+
         self.analyzers = analyzers or list()
         self.verbose = verbose
 
+        # persistent cache of map results
+        if map_cache is None and cache_map_results:
+            map_cache = MapResultCache()
+        self.map_cache = map_cache
+        self.force_remap = force_remap
+
     def __check_for_platform_from_context(self, platform) -> 'IPlatform':  # noqa: F821
         """
         Try to determine platform of current object from self or current platform.
@@ -280,6 +307,10 @@ class AnalyzeManager:
         # make sure each analyzer in self.analyzers has a unique uid
         self._update_analyzer_uids()
 
+        if self.map_cache is not None:
+            for analyzer in self.analyzers:
+                self.map_cache.register(analyzer)
+
     def _print_configuration(self, n_items: int, n_processes: int) -> NoReturn:
         """
         Display some information about an ongoing analysis.
@@ -302,6 +333,8 @@ class AnalyzeManager:
                                      f'cache: {on_off(hasattr(analyzer, "cache"))}')
             if hasattr(analyzer, 'need_dir_map'):
                 user_logger.log(VERBOSE, f' | (Directory map: {on_off(analyzer.need_dir_map)}')
+        if self.map_cache is not None:
+            user_logger.log(VERBOSE, f' | Map results cache: {self.map_cache._cache_directory} (force remap: {on_off(self.force_remap)})')
         user_logger.log(VERBOSE, f' | Pool of {n_processes} analyzing process(es)')
 
     def _run_and_wait_for_mapping(self, executor) -> Tuple[Dict, bool]:
@@ -314,35 +347,166 @@ class AnalyzeManager:
         Returns:
             False if an exception occurred processing **.map** on any item; otherwise True (succeeded).
 
+        Notes:
+            Data of streaming analyzers is folded through :meth:`IAnalyzer.reduce_partial` as soon as an item is
+            mapped, so only the data of the other analyzers is kept in the returned results.
+
+            Items are sent to the workers in chunks of :meth:`_get_batch_size` items.
         """
         # add items to process (map)
         n_items = len(self._items)
+        batch_size = self._get_batch_size(n_items)
         logger.debug(f"Number of items for analysis: {n_items}")
-        logger.debug("Mapping the items for analysis")
+        logger.debug(f"Mapping the items for analysis in batches of {batch_size}")
         futures = dict()
         results = dict()
         status = True
+        streaming_analyzers = {analyzer.uid: analyzer for analyzer in self.analyzers if analyzer.streaming}
+        self._accumulators = {uid: None for uid in streaming_analyzers}
+        self._partial_counts = {uid: 0 for uid in streaming_analyzers}
+
+        def collect(item, data):
+            if streaming_analyzers:
+                data = self._reduce_partial(streaming_analyzers, item, data)
+                if not data:
+                    return
+            results[item] = data
+
         # create status bar and then queue our futures
         with tqdm(total=len(self._items)) as progress:
+            # items waiting to be submitted, grouped by the analyzers which still have to map them
+            pending = dict()
+
+            def submit(analyzer_uids, batch):
+                uids = list(analyzer_uids) if len(analyzer_uids) < len(self.analyzers) else None
+                future = executor.submit(map_batch, [i for i, _, _ in batch], uids)
+                future.add_done_callback(lambda p, n=len(batch): progress.update(n))
+                futures[future] = batch
+
             for i in self._items.values():
-                future = executor.submit(map_item, i)
-                future.add_done_callback(lambda p: progress.update())
-                futures[future] = i
+                cached_data, missing = self._get_cached_map_results(i)
+                if not missing:
+                    collect(i, cached_data)
+                    progress.update()
+                    continue
+                key = tuple(analyzer.uid for analyzer in missing)
+                pending.setdefault(key, []).append((i, cached_data, missing))
+                if len(pending[key]) >= batch_size:
+                    submit(key, pending.pop(key))
+            for key, batch in pending.items():
+                submit(key, batch)
+            pending.clear()
 
             # wait on our futures to complete, catch exceptions, and aggregate results
             for future in as_completed(futures.keys()):
+                # drop our reference as soon as possible so the mapped data can be released
+                batch = futures.pop(future)
                 if future.exception():
                     status = False
                     ex = future.exception()
                     user_logger.error(ex)
                     if not self.continue_on_error:
                         raise ex
-                else:
-                    results[futures[future]] = future.result()
+                    continue
+                batch_results, batch_errors = future.result()
+                for item, cached_data, missing in batch:
+                    if item.uid in batch_errors:
+                        status = False
+                        ex = batch_errors[item.uid]
+                        user_logger.error(ex)
+                        if not self.continue_on_error:
+                            raise ex
+                        continue
+                    data = batch_results.pop(item.uid)
+                    self._cache_map_results(item, data, missing)
+                    cached_data.update(data)
+                    collect(item, cached_data)
 
         logger.debug(f"Result fetching status: : {status}")
         return results, status
 
+    def _get_batch_size(self, n_items: int) -> int:
+        """
+        Determine how many items are sent to a worker at once.
+
+        Args:
+            n_items: The number of items to map.
+
+        Returns:
+            The configured batch size or, if not set, enough to give each worker about four chunks (up to 64 items).
+        """
+        if self.batch_size is not None:
+            return self.batch_size
+        return max(1, min(64, n_items // (max(self.max_processes, 1) * 4)))
+
+    def _get_cached_map_results(self, item: IEntity) -> Tuple[Dict, List[IAnalyzer]]:
+        """
+        Lookup the map results of an item in the map cache.
+
+        Args:
+            item: The item to lookup.
+
+        Returns:
+            The analyzer uid keyed cached data and the analyzers which still have to map the item.
+        """
+        if self.map_cache is None or self.force_remap:
+            return dict(), list(self.analyzers)
+        data = dict()
+        missing = []
+        for analyzer in self.analyzers:
+            cached = self.map_cache.get(item, analyzer)
+            if cached is None:
+                missing.append(analyzer)
+            elif cached[0]:
+                data[analyzer.uid] = cached[1]
+        return data, missing
+
+    def _cache_map_results(self, item: IEntity, data: Dict, analyzers: List[IAnalyzer]) -> NoReturn:
+        """
+        Save the map results of an item to the map cache.
+
+        Args:
+            item: The item that was mapped.
+            data: The analyzer uid keyed mapped data.
+            analyzers: The analyzers which mapped the item. Analyzers without data filtered out the item.
+
+        Returns:
+            None
+        """
+        if self.map_cache is None:
+            return
+        for analyzer in analyzers:
+            if analyzer.uid in data:
+                self.map_cache.set(item, analyzer, data[analyzer.uid])
+            else:
+                self.map_cache.set(item, analyzer, None, mapped=False)
+
+    def _reduce_partial(self, analyzers: Dict[str, IAnalyzer], item: IEntity, data: Dict) -> Dict:
+        """
+        Fold the mapped data of an item into the accumulators of the streaming analyzers.
+
+        Args:
+            analyzers: Streaming analyzers keyed by uid.
+            item: The item the data was mapped from.
+            data: The analyzer uid keyed mapped data of the item.
+
+        Returns:
+            The mapped data of the non-streaming analyzers.
+        """
+        for uid, analyzer in analyzers.items():
+            if uid not in data:
+                continue
+            try:
+                self._accumulators[uid] = analyzer.reduce_partial(self._accumulators[uid], item, data.pop(uid))
+                self._partial_counts[uid] += 1
+            except Exception as ex:
+                user_logger.error(f'Reduce for Analyzer {uid} failed')
+                user_logger.exception(ex)
+                user_logger.error("See log for details")
+                if not self.continue_on_error:
+                    sys.exit(-1)
+        return data
+
     def _run_and_wait_for_reducing(self, executor, results) -> dict:
         """
         Run and manage the reduce call on the combined item results (by analyzer).
@@ -363,6 +527,21 @@ class AnalyzeManager:
         with tqdm(total=len(self.analyzers), desc="Running Analyzer Reduces") as progress:
             # for each analyzer, queue our futures
             for analyzer in self.analyzers:
+                if analyzer.streaming:
+                    # streaming analyzers already reduced their data while mapping
+                    if self._partial_counts.get(analyzer.uid, 0) == 0:
+                        user_logger.warning(f"Note: {analyzer.uid} has no simulation data to analyze. Please verify the filter or map function of the analyzer.")
+                    try:
+                        finalize_results[analyzer.uid] = analyzer.finalize(self._accumulators.get(analyzer.uid))
+                    except Exception as ex:
+                        user_logger.error(f'Reduce for Analyzer {analyzer.uid} failed')
+                        user_logger.exception(ex)
+                        user_logger.error("See log for details")
+                        if not self.continue_on_error:
+                            sys.exit(-1)
+                    progress.update()
+                    continue
+
                 logger.debug(f"Gather data for {analyzer.uid}")
                 item_data_for_analyzer = {}
                 for item, data in results.items():
@@ -471,6 +650,7 @@ class AnalyzeManager:
 
         for analyzer in self.analyzers:
             analyzer.results = finalize_results[analyzer.uid]
+        self._accumulators = dict()
 
         logger.debug("Destroying analyzers")
         for analyzer in self.analyzers:
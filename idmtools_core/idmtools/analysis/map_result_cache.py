@@ -0,0 +1,179 @@
+"""idmtools analyzer map results cache.
+
+MapResultCache persists the output of :meth:`IAnalyzer.map` across runs so re-analyzing finished items with an unchanged
+analyzer does not download and map the item again.
+
+Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
+"""
+import inspect
+import os
+import pickle
+from logging import getLogger, DEBUG
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+from idmtools import IdmConfigParser
+from idmtools.core import IDMTOOLS_USER_HOME
+from idmtools.core.cache_enabled import CacheEnabled, MAX_CACHE_SIZE
+from idmtools.core.interfaces.ientity import IEntity
+from idmtools.entities.ianalyzer import IAnalyzer
+from idmtools.utils.hashing import hash_obj
+
+logger = getLogger(__name__)
+
+MAP_RESULT_CACHE_NAME = 'analysis_map_results'
+# analyzer attributes which do not influence the output of map
+IGNORED_ANALYZER_ATTRIBUTES = ('results', 'working_dir')
+
+
+class MapResultCache(CacheEnabled):
+    """
+    Persistent cache of analyzer map results keyed on the item id and a hash of the analyzer.
+
+    The analyzer hash covers the analyzer class, its uid, its state(the arguments it was initialized with), its
+    filenames and the source of its map method, so changing only reduce keeps the cached results valid.
+    """
+
+    def __init__(self, directory: Union[str, Path] = None, size_limit: int = MAX_CACHE_SIZE,
+                 eviction_policy: str = 'least-recently-used'):
+        """
+        Initialize the MapResultCache.
+
+        Args:
+            directory: Location of the cache. Defaults to the *cache_directory* configuration option (or ~/.idmtools/cache)
+            size_limit: Maximum size of the cache in bytes. Least recently used results are evicted past this size
+            eviction_policy: Diskcache eviction policy
+        """
+        if directory is None:
+            directory = Path(IdmConfigParser.get_option(option="cache_directory",
+                                                        fallback=IDMTOOLS_USER_HOME.joinpath("cache")),
+                             MAP_RESULT_CACHE_NAME)
+        os.makedirs(directory, exist_ok=True)
+        self._cache = None
+        self._cache_directory = str(directory)
+        self.size_limit = size_limit
+        self.eviction_policy = eviction_policy
+        self._analyzer_keys: Dict[str, Optional[str]] = dict()
+
+    @property
+    def cache(self):
+        """
+        Allows fetches of cache and ensures it is initialized with our size limit and eviction policy.
+
+        Returns:
+            Cache
+        """
+        if self._cache is None:
+            self.initialize_cache(eviction_policy=self.eviction_policy, size_limit=self.size_limit)
+        return self._cache
+
+    def cleanup_cache(self):
+        """
+        Close the cache. Unlike other CacheEnabled objects, the cache directory is kept between runs.
+
+        Returns:
+            None
+        """
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+
+    @staticmethod
+    def analyzer_key(analyzer: IAnalyzer) -> Optional[str]:
+        """
+        Calculate the hash identifying the map results of an analyzer.
+
+        Args:
+            analyzer: Analyzer to hash
+
+        Returns:
+            Hash of the analyzer or None if the analyzer cannot be hashed (its results are then never cached)
+        """
+        cls = type(analyzer)
+        state = {k: v for k, v in vars(analyzer).items() if k not in IGNORED_ANALYZER_ATTRIBUTES}
+        try:
+            map_source = inspect.getsource(cls.map)
+        except (OSError, TypeError):
+            map_source = cls.map.__code__.co_code
+        try:
+            return hash_obj((f"{cls.__module__}.{cls.__qualname__}", analyzer.uid, state,
+                             sorted(analyzer.filenames), map_source))
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning(f"Map results of {analyzer.uid} will not be cached: {e}")
+            return None
+
+    def register(self, analyzer: IAnalyzer) -> Optional[str]:
+        """
+        Compute and remember the key of an analyzer. Should be called once the analyzer is initialized.
+
+        Args:
+            analyzer: Analyzer to register
+
+        Returns:
+            Hash of the analyzer
+        """
+        self._analyzer_keys[analyzer.uid] = self.analyzer_key(analyzer)
+        return self._analyzer_keys[analyzer.uid]
+
+    def _key(self, item: IEntity, analyzer: IAnalyzer) -> Optional[str]:
+        """
+        Key of the map result of an item for an analyzer.
+
+        Args:
+            item: Item that was mapped
+            analyzer: Analyzer that mapped the item
+
+        Returns:
+            Cache key or None if the analyzer results are not cached
+        """
+        if analyzer.uid not in self._analyzer_keys:
+            self.register(analyzer)
+        analyzer_key = self._analyzer_keys[analyzer.uid]
+        if analyzer_key is None:
+            return None
+        return f"{item.uid}-{analyzer_key}"
+
+    def get(self, item: IEntity, analyzer: IAnalyzer) -> Optional[Tuple[bool, Any]]:
+        """
+        Fetch the map result of an item for an analyzer.
+
+        Args:
+            item: Item to lookup
+            analyzer: Analyzer to lookup
+
+        Returns:
+            None when there is no cached result, otherwise a tuple of (mapped, data). mapped is False when the analyzer
+            filtered out the item
+        """
+        key = self._key(item, analyzer)
+        if key is None:
+            return None
+        return self.cache.get(key, retry=True)
+
+    def set(self, item: IEntity, analyzer: IAnalyzer, data: Any, mapped: bool = True) -> None:
+        """
+        Store the map result of an item for an analyzer.
+
+        Args:
+            item: Item that was mapped
+            analyzer: Analyzer that mapped the item
+            data: Map results
+            mapped: False when the analyzer filtered out the item
+
+        Returns:
+            None
+        """
+        key = self._key(item, analyzer)
+        if key is None:
+            return
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(f"Caching map result of {analyzer.uid} for {item.uid}")
+        self.cache.set(key, (mapped, data), retry=True)
+
+    def clear(self) -> None:
+        """
+        Remove all cached map results.
+
+        Returns:
+            None
+        """
+        self.cache.clear(retry=True)
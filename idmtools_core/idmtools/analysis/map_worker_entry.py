@@ -9,7 +9,7 @@ import itertools
 from logging import getLogger, DEBUG
 from idmtools.core.interfaces.ientity import IEntity
 from idmtools.utils.file_parser import FileParser
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, List, Tuple
 from idmtools.core.interfaces.iitem import IItem
 from idmtools.entities.ianalyzer import TAnalyzerList
 
@@ -19,12 +19,13 @@ if TYPE_CHECKING:  # pragma: no cover
 logger = getLogger(__name__)
 
 
-def map_item(item: IItem) -> Dict[str, Dict]:
+def map_item(item: IItem, analyzer_uids: List[str] = None) -> Dict[str, Dict]:
     """
     Initialize some worker-global values; a worker process entry point for analyzer item-mapping.
 
     Args:
         item: The item (often simulation) to process.
+        analyzer_uids: Restrict the mapping to the analyzers with those uids. Defaults to all analyzers.
 
     Returns:
         Dict[str, Dict]
@@ -35,12 +36,38 @@ def map_item(item: IItem) -> Dict[str, Dict]:
         logger.debug(f"Init item {item.uid} in worker")
     analyzers = map_item.analyzers
     platform = map_item.platform
+    if analyzer_uids is not None:
+        analyzers = [a for a in analyzers if a.uid in analyzer_uids]
 
     if item.platform is None:
         item.platform = platform
     return _get_mapped_data_for_item(item, analyzers, platform)
 
 
+def map_batch(items: List[IItem], analyzer_uids: List[str] = None) -> Tuple[Dict[str, Dict], Dict[str, Exception]]:
+    """
+    A worker process entry point mapping a chunk of items in one call.
+
+    Submitting chunks reduces the number of tasks sent to the pool and lets objects shared by the items (experiment,
+    platform) be pickled once per chunk instead of once per item.
+
+    Args:
+        items: The items to process.
+        analyzer_uids: Restrict the mapping to the analyzers with those uids. Defaults to all analyzers.
+
+    Returns:
+        The mapped data keyed by item uid and the exceptions raised keyed by item uid
+    """
+    results = dict()
+    errors = dict()
+    for item in items:
+        try:
+            results[item.uid] = map_item(item, analyzer_uids)
+        except Exception as e:
+            errors[item.uid] = e
+    return results, errors
+
+
 def _get_mapped_data_for_item(item: IEntity, analyzers: TAnalyzerList, platform: 'IPlatform') -> Dict[str, Dict]:
     """
     Get mapped data from an item.
@@ -82,7 +109,7 @@ def _get_mapped_data_for_item(item: IEntity, analyzers: TAnalyzerList, platform:
             # If the analyzer needs the parsed data, parse
             if analyzer.parse:
                 logger.debug(f'Parsing content for {analyzer.uid}')
-                data = {filename: FileParser.parse(filename, content) for filename, content in file_data.items() if filename in analyzer.filenames}
+                data = {filename: FileParser.parse(filename, content, analyzer.file_columns.get(filename)) for filename, content in file_data.items() if filename in analyzer.filenames}
             else:
                 # If the analyzer doesnt wish to parse, give the raw data
                 data = {filename: content for filename, content in file_data.items() if filename in analyzer.filenames}
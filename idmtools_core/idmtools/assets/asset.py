@@ -11,12 +11,13 @@ from functools import partial
 from io import BytesIO
 from logging import getLogger, DEBUG
 from pathlib import PurePosixPath
-from typing import TypeVar, Union, List, Callable, Any, Optional, Generator, BinaryIO
+from typing import TypeVar, Union, List, Callable, Any, Optional, Generator, BinaryIO, ClassVar
 import backoff
 import requests
 from idmtools import IdmConfigParser
 from idmtools.utils.file import file_content_to_generator, content_generator
-from idmtools.utils.hashing import calculate_md5, calculate_md5_stream
+from idmtools.assets.checksum_cache import calculate_file_checksum
+from idmtools.utils.hashing import calculate_md5_stream
 
 logger = getLogger(__name__)
 
@@ -46,6 +47,8 @@ class Asset:
     #: Checksum of asset. Only required for existing assets
     checksum: InitVar[Any] = None
     _checksum: Optional[str] = field(default=None, init=False)
+    #: Number of times an asset already compared or hashed was renamed. Indexes of assets are rebuilt when it changes
+    key_changes: ClassVar[int] = 0
 
     def __post_init__(self, content, checksum):
         """
@@ -156,7 +159,7 @@ class Asset:
             None
         """
         self._filename = filename if not isinstance(filename, property) and filename else None
-        self._key = None
+        self._reset_key()
 
     @property
     def relative_path(self):  # noqa: F811
@@ -182,7 +185,7 @@ class Asset:
             None
         """
         self._relative_path = relative_path.strip(" \\/") if not isinstance(relative_path, property) and relative_path else None
-        self._key = None
+        self._reset_key()
 
     @property
     def bytes(self):
@@ -296,6 +299,17 @@ class Asset:
             self._key = self.filename, self.relative_path
         return self._key
 
+    def _reset_key(self):
+        """
+        Reset the asset key after a rename.
+
+        Returns:
+            None
+        """
+        if getattr(self, '_key', None) is not None:
+            Asset.key_changes += 1
+        self._key = None
+
     def __hash__(self):
         """
         Hash of Asset item.
@@ -396,7 +410,7 @@ class Asset:
         """
         if not self._checksum:
             if self.absolute_path:
-                self._checksum = calculate_md5(self.absolute_path)
+                self._checksum = calculate_file_checksum(self.absolute_path)
             elif self.content is not None:
                 self._checksum = calculate_md5_stream(io.BytesIO(self.bytes))
         return self._checksum
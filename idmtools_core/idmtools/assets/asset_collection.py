@@ -5,10 +5,11 @@ Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
 import copy
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from logging import getLogger
 from os import PathLike
-from typing import List, NoReturn, TypeVar, Union, Any, Dict, TYPE_CHECKING
+from typing import List, NoReturn, TypeVar, Union, Any, Dict, Optional, TYPE_CHECKING
 from idmtools.assets import Asset, TAssetList
 from idmtools.assets import TAssetFilterList
 from idmtools.assets.errors import DuplicatedAssetError
@@ -21,6 +22,8 @@ from idmtools.utils.filters.asset_filters import default_asset_file_filter
 from idmtools.utils.info import get_doc_base_url
 
 IGNORE_DIRECTORIES = ['.git', '.svn', '.venv', '.idea', '.Rproj.user', '$RECYCLE.BIN', '__pycache__']
+# Below this number of files, checksums are calculated serially
+MIN_PARALLEL_CHECKSUMS = 8
 
 if TYPE_CHECKING:  # pragma: no cover
     from idmtools.entities.iplatform import IPlatform
@@ -28,6 +31,80 @@ if TYPE_CHECKING:  # pragma: no cover
 user_logger = getLogger('user')
 
 
+class AssetList(list):
+    """
+    List of the assets of a collection, counting the changes made to it so the index of the collection is kept in sync.
+    """
+    #: Number of changes made to the list
+    version: int = 0
+
+    def _changed(self):
+        self.version += 1
+
+    def __setitem__(self, key, value):
+        """Set an item."""
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        """Delete an item."""
+        super().__delitem__(key)
+        self._changed()
+
+    def __iadd__(self, other):
+        """Extend the list."""
+        result = super().__iadd__(other)
+        self._changed()
+        return result
+
+    def __imul__(self, other):
+        """Repeat the list."""
+        result = super().__imul__(other)
+        self._changed()
+        return result
+
+    def append(self, item):
+        """Append an item."""
+        super().append(item)
+        self._changed()
+
+    def extend(self, items):
+        """Extend the list."""
+        super().extend(items)
+        self._changed()
+
+    def insert(self, index, item):
+        """Insert an item."""
+        super().insert(index, item)
+        self._changed()
+
+    def pop(self, index=-1):
+        """Remove and return an item."""
+        item = super().pop(index)
+        self._changed()
+        return item
+
+    def remove(self, item):
+        """Remove an item."""
+        super().remove(item)
+        self._changed()
+
+    def clear(self):
+        """Remove all items."""
+        super().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        """Sort the list."""
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self):
+        """Reverse the list."""
+        super().reverse()
+        self._changed()
+
+
 @dataclass(repr=False)
 class AssetCollection(IEntity):
     """
@@ -38,6 +115,12 @@ class AssetCollection(IEntity):
     assets: List[Asset] = field(default=None)
     #: ItemType so platform knows how to handle item properly
     item_type: ItemType = field(default=ItemType.ASSETCOLLECTION, compare=False)
+    #: Index of the assets by key(filename and relative path), so duplicates are found without scanning the collection
+    _asset_index: Optional[Dict[Asset, int]] = field(default=None, init=False, compare=False, metadata=dict(pickle_ignore=True))
+    #: Assets list, its version and the asset renames when the index was built. The index is rebuilt when any changes
+    _indexed_assets: Optional[List[Asset]] = field(default=None, init=False, compare=False, metadata=dict(pickle_ignore=True))
+    _indexed_version: int = field(default=0, init=False, compare=False, metadata=dict(pickle_ignore=True))
+    _indexed_key_changes: int = field(default=0, init=False, compare=False, metadata=dict(pickle_ignore=True))
 
     def __init__(self, assets: Union[List[str], TAssetList, 'AssetCollection'] = None, tags=None):
         """
@@ -47,6 +130,10 @@ class AssetCollection(IEntity):
         tags: dict: tags associated with asset collection
         """
         super().__init__()
+        self._asset_index = None
+        self._indexed_assets = None
+        self._indexed_version = 0
+        self._indexed_key_changes = 0
         if tags is None:
             tags = {}
         self.item_type = ItemType.ASSETCOLLECTION
@@ -61,6 +148,21 @@ class AssetCollection(IEntity):
 
         self.tags = self.tags or tags
 
+    def __setattr__(self, name, value):
+        """
+        Set an attribute. Plain lists of assets are stored as an :class:`AssetList`, which tracks the changes made to it.
+
+        Args:
+            name: Attribute name
+            value: Attribute value
+
+        Returns:
+            None
+        """
+        if name == 'assets' and type(value) is list:
+            value = AssetList(value)
+        super().__setattr__(name, value)
+
     @classmethod
     def from_id(cls, item_id: str, platform: 'IPlatform' = None, as_copy: bool = False,  # noqa E821
                 **kwargs) -> 'AssetCollection':
@@ -84,17 +186,25 @@ class AssetCollection(IEntity):
     @classmethod
     def from_directory(cls, assets_directory: str, recursive: bool = True, flatten: bool = False,
                        filters: 'TAssetFilterList' = None, filters_mode: FilterMode = FilterMode.OR,  # noqa: F821
-                       relative_path: str = None) -> 'TAssetCollection':
+                       relative_path: str = None, calculate_checksums: bool = False,
+                       max_workers: int = None) -> 'TAssetCollection':
         """
         Fill up an :class:`AssetCollection` from the specified directory.
 
         See :meth:`~AssetCollection.assets_from_directory` for arguments.
 
+        Args:
+            calculate_checksums: Calculate the checksums of the assets found, in parallel
+            max_workers: Maximum number of files hashed at the same time
+
         Returns:
             A created :class:`AssetCollection` object.
         """
         assets = cls.assets_from_directory(assets_directory, recursive, flatten, filters, filters_mode, relative_path)
-        return cls(assets=assets)
+        ac = cls(assets=assets)
+        if calculate_checksums:
+            ac.calculate_checksums(max_workers)
+        return ac
 
     @staticmethod
     def assets_from_directory(assets_directory: Union[str, PathLike], recursive: bool = True, flatten: bool = False,
@@ -125,21 +235,23 @@ class AssetCollection(IEntity):
         Returns:
             A list of assets.
         """
-        if isinstance(assets_directory, PathLike):
-            assets_directory = str(assets_directory)
-        found_assets = []
-        for entry in scan_directory(assets_directory, recursive, IGNORE_DIRECTORIES if not no_ignore else None):
-            relative_path = os.path.relpath(os.path.dirname(entry.path), assets_directory)
-            found_assets.append(Asset(absolute_path=os.path.abspath(entry.path),
-                                      relative_path=None if relative_path == "." else relative_path,
-                                      filename=entry.name))
-
-        # Apply the default filter
-        found_assets = list(filter(default_asset_file_filter, found_assets))
-
-        # Operations on assets (filter, flatten, force relative_path)
+        assets_directory = os.path.abspath(str(assets_directory))
+        # relative path of each directory scanned, computed once per directory
+        relative_paths = {}
         assets = []
-        for asset in found_assets:
+        for entry in scan_directory(assets_directory, recursive, IGNORE_DIRECTORIES if not no_ignore else None):
+            directory = os.path.dirname(entry.path)
+            relative_path = relative_paths.get(directory)
+            if relative_path is None:
+                relative_path = relative_paths[directory] = os.path.relpath(directory, assets_directory)
+            asset = Asset(absolute_path=entry.path, relative_path=None if relative_path == "." else relative_path,
+                          filename=entry.name)
+
+            # Apply the default filter
+            if not default_asset_file_filter(asset):
+                continue
+
+            # Operations on assets (filter, flatten, force relative_path)
             if filters:
                 results = [f(asset) for f in filters]
                 if filters_mode == FilterMode.OR and not any(results):
@@ -168,17 +280,31 @@ class AssetCollection(IEntity):
 
     def add_directory(self, assets_directory: Union[str, PathLike], recursive: bool = True, flatten: bool = False,
                       filters: 'TAssetFilterList' = None, filters_mode: FilterMode = FilterMode.OR,  # noqa: F821
-                      relative_path: str = None, no_ignore: bool = False):
+                      relative_path: str = None, no_ignore: bool = False, calculate_checksums: bool = False,
+                      max_workers: int = None):
         """
         Retrieve assets from the specified directory and add them to the collection.
 
-        See :meth:`~AssetCollection.assets_from_directory` for arguments.
+        Args:
+            assets_directory: The root directory of the assets.
+            recursive: True to recursively traverse the subdirectory.
+            flatten: Put all the files in root regardless of whether they were in a subdirectory or not.
+            filters: A list of filters to apply to the assets.
+            filters_mode: When given multiple filters, either OR or AND the results.
+            relative_path: Prefix a relative path to the path created from the root directory.
+            no_ignore: Should we not ignore common directories(.git, .svn. etc)
+            calculate_checksums: Calculate the checksums of the assets added, in parallel
+            max_workers: Maximum number of files hashed at the same time
+
+        See :meth:`~AssetCollection.assets_from_directory` for details on the arguments.
         """
         if isinstance(assets_directory, PathLike):
             assets_directory = str(assets_directory)
         assets = AssetCollection.assets_from_directory(assets_directory, recursive, flatten, filters, filters_mode, relative_path, no_ignore)
         for asset in assets:
             self.add_asset(asset)
+        if calculate_checksums:
+            self.calculate_checksums(max_workers)
 
     def is_editable(self, error=False) -> bool:
         """
@@ -216,15 +342,17 @@ class AssetCollection(IEntity):
         if isinstance(asset, (str, PathLike)):
             asset = Asset(absolute_path=str(asset), **kwargs)
         # do a simple check first
-        if asset in self.assets:
+        index = self.find_index_of_asset(asset)
+        if index is not None:
             if fail_on_duplicate:
-                if not fail_on_deep_comparison or self.find_index_of_asset(asset, deep_compare=True) is None:
+                if not fail_on_deep_comparison or not self.assets[index].deep_equals(asset):
                     raise DuplicatedAssetError(("File with same paths but different content provided", asset) if fail_on_deep_comparison else asset)
             else:
                 # The equality not considering the content of the asset, even if it is already present
-                # nothing guarantees that the content is the same. So remove and add the fresh one.
-                self.assets.remove(asset)
-        self.assets.append(asset)
+                # nothing guarantees that the content is the same. So replace it with the fresh one.
+                self._replace_asset(index, asset)
+                return
+        self._append_asset(asset)
 
     def __add__(self, other: Union[TAssetList, 'AssetCollection', Asset]) -> 'AssetCollection':
         """
@@ -285,9 +413,9 @@ class AssetCollection(IEntity):
         if index is not None:
             if fail_on_deep_comparison and not tasset.deep_equals(self.assets[index]):
                 raise ValueError(f"Contents of file {asset.short_remote_path()} being replaced differs. To prevent unexpected behaviour, please review script or disable deep checks")
-            self.assets[index] = tasset
+            self._replace_asset(index, tasset)
         else:
-            self.assets.append(tasset)
+            self._append_asset(tasset)
 
     def get_one(self, **kwargs):
         """
@@ -460,12 +588,65 @@ class AssetCollection(IEntity):
             Index number if found.
             None if not found.
         """
-        for idx, asset in enumerate(self.assets):
-            if deep_compare and asset.deep_equals(other):
-                return idx
-            elif not deep_compare and asset == other:
-                return idx
-        return None
+        index = self._get_asset_index().get(other)
+        if index is not None and not (index < len(self.assets) and self.assets[index] == other):
+            # the assets were changed without the index knowing, e.g. an asset was renamed before being hashed
+            self._asset_index = None
+            index = self._get_asset_index().get(other)
+        if index is None or (deep_compare and not self.assets[index].deep_equals(other)):
+            return None
+        return index
+
+    def _get_asset_index(self) -> Dict[Asset, int]:
+        """
+        Get the index of the assets by key, rebuilding it when the assets changed since it was built.
+
+        Changes to assets not stored in an :class:`AssetList` cannot be tracked, so their index is rebuilt every time.
+
+        Returns:
+            Index of the first asset with each key
+        """
+        version = getattr(self.assets, 'version', None)
+        if self._asset_index is None or self._indexed_assets is not self.assets or version is None \
+                or self._indexed_version != version or self._indexed_key_changes != Asset.key_changes:
+            self._indexed_key_changes = Asset.key_changes
+            index = {}
+            for idx, asset in enumerate(self.assets):
+                index.setdefault(asset, idx)
+            self._asset_index = index
+            self._indexed_assets = self.assets
+            self._indexed_version = version
+        return self._asset_index
+
+    def _append_asset(self, asset: Asset) -> None:
+        """
+        Append an asset to the collection, keeping the index up to date.
+
+        Args:
+            asset: Asset to append
+
+        Returns:
+            None
+        """
+        index = self._get_asset_index()
+        index.setdefault(asset, len(self.assets))
+        self.assets.append(asset)
+        self._indexed_version = getattr(self.assets, 'version', None)
+
+    def _replace_asset(self, index: int, asset: Asset) -> None:
+        """
+        Replace an asset by an asset with the same key, keeping the index up to date.
+
+        Args:
+            index: Position of the asset replaced
+            asset: New asset
+
+        Returns:
+            None
+        """
+        self._get_asset_index()
+        self.assets[index] = asset
+        self._indexed_version = getattr(self.assets, 'version', None)
 
     def pre_creation(self, platform: 'IPlatform') -> None:
         """
@@ -486,6 +667,27 @@ class AssetCollection(IEntity):
             self.tags = get_default_tags()
         IItem.pre_creation(self, platform)
 
+    def calculate_checksums(self, max_workers: int = None) -> None:
+        """
+        Calculate the checksums of the file assets which do not have one yet.
+
+        Files are hashed in parallel, through the checksum cache, so unchanged files are not read again. Checksums stay
+        lazy otherwise: this is called by the platforms which need them, for example before uploading a collection.
+
+        Args:
+            max_workers: Maximum number of files hashed at the same time
+
+        Returns:
+            None
+        """
+        assets = [asset for asset in self.assets if not asset.checksum and asset.absolute_path]
+        if len(assets) < MIN_PARALLEL_CHECKSUMS:
+            for asset in assets:
+                asset.calculate_checksum()
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(Asset.calculate_checksum, assets))
+
     def set_tags(self, tags: Dict[str, Any]):
         """
         Set the tags on the asset collection.
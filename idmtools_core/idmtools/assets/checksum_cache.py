@@ -0,0 +1,172 @@
+"""idmtools asset checksum cache.
+
+ChecksumCache persists the md5 checksums of asset files across runs, keyed on the absolute path, size, modification
+time and inode of the file, so unchanged asset files are hashed only once.
+
+Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
+"""
+import os
+import threading
+import time
+from logging import getLogger, DEBUG
+from pathlib import Path
+from typing import Optional, Union
+from idmtools import IdmConfigParser
+from idmtools.core import IDMTOOLS_USER_HOME, TRUTHY_VALUES
+from idmtools.core.cache_enabled import CacheEnabled
+from idmtools.utils.hashing import calculate_md5
+
+logger = getLogger(__name__)
+
+CHECKSUM_CACHE_NAME = 'asset_checksums'
+# Files smaller than this are hashed directly, as hashing them is about as fast as a cache lookup
+MIN_CACHED_FILE_SIZE = 2 ** 20
+# Checksums are small: 128MB holds millions of them
+CHECKSUM_CACHE_SIZE = 2 ** 27
+# Files modified more recently than this are not cached: a write within the modification time resolution of the file
+# system would not change the key
+RECENTLY_MODIFIED_NS = 2 * 10 ** 9
+
+_checksum_cache = None
+_checksum_cache_lock = threading.Lock()
+
+
+class ChecksumCache(CacheEnabled):
+    """
+    Persistent cache of file checksums keyed on the file stat.
+    """
+
+    def __init__(self, directory: Union[str, Path] = None, size_limit: int = CHECKSUM_CACHE_SIZE):
+        """
+        Initialize the ChecksumCache.
+
+        Args:
+            directory: Location of the cache. Defaults to the *cache_directory* configuration option (or ~/.idmtools/cache)
+            size_limit: Maximum size of the cache in bytes. Least recently used checksums are evicted past this size
+        """
+        if directory is None:
+            directory = Path(IdmConfigParser.get_option(option="cache_directory",
+                                                        fallback=IDMTOOLS_USER_HOME.joinpath("cache")),
+                             CHECKSUM_CACHE_NAME)
+        os.makedirs(directory, exist_ok=True)
+        self._cache = None
+        self._cache_directory = str(directory)
+        self.size_limit = size_limit
+
+    @property
+    def cache(self):
+        """
+        Allows fetches of cache and ensures it is initialized with our size limit.
+
+        Returns:
+            Cache
+        """
+        if self._cache is None:
+            self.initialize_cache(eviction_policy='least-recently-used', size_limit=self.size_limit)
+        return self._cache
+
+    def cleanup_cache(self):
+        """
+        Close the cache. Unlike other CacheEnabled objects, the cache directory is kept between runs.
+
+        Returns:
+            None
+        """
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+
+    @staticmethod
+    def key(path: str, stat: os.stat_result) -> str:
+        """
+        Key of the checksum of a file.
+
+        Args:
+            path: Absolute path of the file
+            stat: Stat of the file
+
+        Returns:
+            Cache key
+        """
+        return f"{path}|{stat.st_size}|{stat.st_mtime_ns}|{stat.st_ino}"
+
+    def checksum(self, filename: Union[str, Path]) -> str:
+        """
+        Get the md5 checksum of a file, hashing it only if it changed since its checksum was cached.
+
+        Args:
+            filename: File to hash
+
+        Returns:
+            md5 checksum
+        """
+        path = os.path.abspath(filename)
+        stat = os.stat(path)
+        if stat.st_size < MIN_CACHED_FILE_SIZE:
+            return calculate_md5(path)
+        key = self.key(path, stat)
+        try:
+            checksum = self.cache.get(key, retry=True)
+        except Exception as e:
+            # e.g. the cache directory is not writable. Hash the file directly
+            logger.debug(f"Could not read the checksum cache: {e}")
+            return calculate_md5(path)
+        if checksum is not None:
+            if logger.isEnabledFor(DEBUG):
+                logger.debug(f"Using cached checksum of {path}")
+            return checksum
+        checksum = calculate_md5(path)
+        # the file may have changed while it was read
+        if self.key(path, os.stat(path)) == key and time.time_ns() - stat.st_mtime_ns > RECENTLY_MODIFIED_NS:
+            try:
+                self.cache.set(key, checksum, retry=True)
+            except Exception as e:
+                logger.debug(f"Could not write the checksum cache: {e}")
+        return checksum
+
+    def clear(self) -> None:
+        """
+        Remove all cached checksums.
+
+        Returns:
+            None
+        """
+        self.cache.clear(retry=True)
+
+
+def get_checksum_cache() -> Optional[ChecksumCache]:
+    """
+    Get the checksum cache shared by all assets.
+
+    Returns:
+        ChecksumCache or None if the *checksum_cache* configuration option is off
+    """
+    global _checksum_cache
+    if IdmConfigParser.get_option(None, "checksum_cache", 'on').lower() not in TRUTHY_VALUES:
+        return None
+    if _checksum_cache is None:
+        with _checksum_cache_lock:
+            if _checksum_cache is None:
+                _checksum_cache = ChecksumCache()
+    return _checksum_cache
+
+
+def calculate_file_checksum(filename: Union[str, Path]) -> str:
+    """
+    Calculate the md5 checksum of a file, through the checksum cache when it is enabled.
+
+    Args:
+        filename: File to hash
+
+    Returns:
+        md5 checksum
+    """
+    try:
+        cache = get_checksum_cache()
+    except OSError as e:
+        # e.g. the cache directory cannot be created
+        logger.debug(f"Could not open the checksum cache: {e}")
+        cache = None
+    if cache is None:
+        return calculate_md5(filename)
+    return cache.checksum(filename)
@@ -4,7 +4,7 @@ idmtools builders package.
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
 # flake8: noqa F821
-from idmtools.builders.simulation_builder import SimulationBuilder
+from idmtools.builders.simulation_builder import SimulationBuilder, SweepAxis
 from idmtools.builders.sweep_arm import SweepArm, ArmType, TSweepFunction
 from idmtools.builders.arm_simulation_builder import ArmSimulationBuilder
 from idmtools.builders.csv_simulation_builder import CsvExperimentBuilder
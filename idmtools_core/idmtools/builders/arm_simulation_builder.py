@@ -122,6 +122,37 @@ class ArmSimulationBuilder:
         for arm in self.arms:
             yield from arm.functions
 
+    def __getitem__(self, index: int):
+        """
+        Get the sweep functions of a simulation from its index.
+        Args:
+            index: Index of the simulation, in iteration order
+        Returns:
+            Tuple of the sweep functions
+        """
+        if index < 0:
+            index += len(self)
+        for arm in self.arms:
+            if 0 <= index < arm.count:
+                return arm[index]
+            index -= arm.count
+        raise IndexError("Builder index out of range")
+
+    def shard(self, index: int, count: int):
+        """
+        Iterate over a contiguous part of the simulations, so simulations can be created by several workers.
+        Args:
+            index: Index of the shard, from 0 to count - 1
+            count: Total number of shards
+        Returns:
+            Iterator of the sweep functions of the simulations in the shard
+        """
+        if not 0 <= index < count:
+            raise ValueError(f"Shard index must be between 0 and {count - 1}")
+        total = len(self)
+        for i in range(index * total // count, (index + 1) * total // count):
+            yield self[i]
+
     def __len__(self):
         """
         Total simulations to be built by builder.
@@ -9,7 +9,7 @@ import pandas as pd
 from functools import partial
 from inspect import signature
 from itertools import product
-from typing import Callable, Any, Iterable, Union, Dict, Sized, NoReturn
+from typing import Callable, Any, Iterable, Union, Dict, Sized, NoReturn, Sequence, List, Tuple, Iterator
 from idmtools.entities.simulation import Simulation
 from idmtools.utils.collections import duplicate_list_of_generators
 
@@ -19,6 +19,74 @@ TSweepFunction = Union[
 ]
 
 
+class SweepAxis(Sequence):
+    """
+    Lazy sweep of a function over the cross-product of its parameter values.
+
+    Only the value vector of each parameter is kept. The partial of a combination is built on demand, either while
+    iterating or from its index, so large sweeps do not need to be expanded up front.
+    """
+
+    def __init__(self, function: TSweepFunction, parameters: Iterable[str], values: Iterable[Iterable]):
+        """
+        Constructor.
+
+        Args:
+            function: The sweep function
+            parameters: Names of the swept parameters
+            values: Value vector of each parameter
+        """
+        self.function = function
+        self.parameters = list(parameters)
+        self.values = [v if isinstance(v, (list, tuple, range, np.ndarray)) else list(v) for v in values]
+        self.__count = int(np.prod([len(v) for v in self.values]))
+
+    def _partial(self, combination: Iterable) -> partial:
+        return partial(self.function, **dict(zip(self.parameters, combination)))
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[partial, List[partial]]:
+        """
+        Build the partial of a combination from its index, using the same order as the cross-product iteration.
+
+        Args:
+            index: Index or slice of the combination
+
+        Returns:
+            partial or list of partials for slices
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Sweep index out of range: {index}")
+        combination = []
+        # the last parameter changes the fastest
+        for values in reversed(self.values):
+            index, i = divmod(index, len(values))
+            combination.append(values[i])
+        return self._partial(reversed(combination))
+
+    def __iter__(self) -> Iterator[partial]:
+        """
+        Iterate over the partials of all combinations.
+
+        Returns:
+            Iterator of partials
+        """
+        for combination in product(*self.values):
+            yield self._partial(combination)
+
+    def __len__(self):
+        """
+        Number of combinations.
+
+        Returns:
+            Count
+        """
+        return self.__count
+
+
 class SimulationBuilder:
     """
     Class that represents an experiment builder.
@@ -202,11 +270,7 @@ class SimulationBuilder:
                     f"Currently the callback has {len(required_params)} required parameters and callback has {len(remaining_parameters)} parameters but there were {len(values)} arguments passed.")
             else:
                 # Handle special case
-                generated_values = product(*_values)
-                self.sweeps.append(
-                    partial(function, **self._map_argument_array(list(remaining_parameters), v)) for v in
-                    generated_values)
-                self.count = np.prod(list(map(len, _values)))
+                self._add_sweep(SweepAxis(function, remaining_parameters, _values))
                 return
 
         if len(required_params) == 0 and len(values) > 1:
@@ -221,17 +285,10 @@ class SimulationBuilder:
         # 1. len(required_params) > 0 and len(required_params) == len(values)
         # 2. len(required_params) == 0 and len(remaining_parameters) == 1 and len(values) == 1
         # create sweeps using the multi-index
-        generated_values = product(*_values)
         if len(required_params) > 0:
-            self.sweeps.append(
-                partial(function, **self._map_argument_array(list(required_params), v)) for v in
-                generated_values)
+            self._add_sweep(SweepAxis(function, required_params, _values))
         else:
-            self.sweeps.append(
-                partial(function, **self._map_argument_array(list(remaining_parameters), v)) for v in
-                generated_values)
-
-        self.count = np.prod(list(map(len, _values)))
+            self._add_sweep(SweepAxis(function, remaining_parameters, _values))
 
     def case_kwargs(self, function: TSweepFunction, remaining_parameters, values) -> NoReturn:
         """
@@ -256,10 +313,18 @@ class SimulationBuilder:
 
         # validate each values in a dict
         _values = {key: self._validate_value(vals) for key, vals in values.items()}
-        generated_values = product(*_values.values())
-        self.sweeps.append(
-            partial(function, **self._map_argument_array(_values.keys(), v)) for v in generated_values)
-        self.count = np.prod(list(map(len, _values.values())))
+        self._add_sweep(SweepAxis(function, _values.keys(), _values.values()))
+
+    def _add_sweep(self, sweep: SweepAxis) -> NoReturn:
+        """
+        Add a sweep axis and update the count.
+        Args:
+            sweep: sweep to add
+        Returns:
+            No return
+        """
+        self.sweeps.append(sweep)
+        self.count = len(sweep)
 
     def add_multiple_parameter_sweep_definition(self, function: TSweepFunction, *args, **kwargs):
         """
@@ -327,13 +392,63 @@ class SimulationBuilder:
                            not isinstance(v, pd.DataFrame) and v == inspect.Parameter.empty}
         return required_params
 
+    def _is_lazy(self) -> bool:
+        """
+        Check if the combinations can be generated from their index.
+
+        Returns:
+            True when all sweeps are non-empty sequences
+        """
+        return len(self.sweeps) > 0 and all(isinstance(sweep, Sequence) and len(sweep) > 0 for sweep in self.sweeps)
+
+    def __getitem__(self, index: int) -> Tuple[partial, ...]:
+        """
+        Get the sweep functions of a simulation from its index without expanding the other combinations.
+
+        Args:
+            index: Index of the simulation, in iteration order
+
+        Returns:
+            Tuple of the sweep functions to apply to the simulation
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Builder index out of range: {index}")
+        functions = []
+        # like product, the last sweep changes the fastest
+        for sweep in reversed(self.sweeps):
+            index, i = divmod(index, len(sweep))
+            functions.append(sweep[i])
+        return tuple(reversed(functions))
+
+    def shard(self, index: int, count: int) -> Iterator[Tuple[partial, ...]]:
+        """
+        Iterate over a contiguous part of the simulations, so simulations can be created by several workers.
+
+        Args:
+            index: Index of the shard, from 0 to count - 1
+            count: Total number of shards
+
+        Returns:
+            Iterator of the sweep functions of the simulations in the shard
+        """
+        if not 0 <= index < count:
+            raise ValueError(f"Shard index must be between 0 and {count - 1}")
+        total = len(self)
+        for i in range(index * total // count, (index + 1) * total // count):
+            yield self[i]
+
     def __iter__(self):
         """
         Iterator of the simulation builder.
-        We duplicate the generators here so that we can loop over multiple times.
+        Sweeps are re-iterable sequences, but we duplicate sweeps added as plain generators so that we can loop over multiple times.
         Returns:
             The iterator
         """
+        if self._is_lazy():
+            yield from (self[i] for i in range(len(self)))
+            return
         old_sw, new_sw = duplicate_list_of_generators(self.sweeps)
 
         yield from product(*old_sw)
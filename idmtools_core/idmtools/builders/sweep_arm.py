@@ -73,6 +73,8 @@ class SweepArm(SimulationBuilder):
         Returns:
             functions
         """
+        if self._is_lazy():
+            return iter(self)
         old_sw, new_sw = tee(self.__functions, 2)
         self.__functions = new_sw
         return old_sw
@@ -92,6 +94,22 @@ class SweepArm(SimulationBuilder):
 
         self.__functions = result
 
+    def __getitem__(self, index: int) -> Tuple[partial, ...]:
+        """
+        Get the sweep functions of a simulation from its index.
+        Args:
+            index: Index of the simulation
+        Returns:
+            Tuple of the sweep functions
+        """
+        if self.type == ArmType.pair:
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError(f"Arm index out of range: {index}")
+            return tuple(sweep[index] for sweep in self.sweeps)
+        return super().__getitem__(index)
+
     def _update_count(self, values):
         """
         Update count of sweeps.
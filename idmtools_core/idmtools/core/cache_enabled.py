@@ -39,13 +39,14 @@ class CacheEnabled:
         """
         self.cleanup_cache()
 
-    def initialize_cache(self, shards: Optional[int] = None, eviction_policy=None):
+    def initialize_cache(self, shards: Optional[int] = None, eviction_policy=None, size_limit: Optional[int] = None):
         """
         Initialize cache.
 
         Args:
             shards (Optional[int], optional): How many shards. It is best to set this when multi-procressing Defaults to None.
             eviction_policy ([type], optional): See Diskcache docs. Defaults to None.
+            size_limit (Optional[int], optional): Maximum size of the cache in bytes. Defaults to MAX_CACHE_SIZE.
         """
         logger.debug(f"Initializing the cache with {shards or 0} shards and {eviction_policy or 'none'} policy.")
         if self._cache:
@@ -60,6 +61,10 @@ class CacheEnabled:
         else:
             logger.debug(f"Cache retrieved in {self._cache_directory}")
 
+        settings = dict()
+        if size_limit is not None:
+            settings['size_limit'] = size_limit
+
         # Create different cache depending on the options
         if shards:
             # set default timeout to grow with cpu count. In high thread environments, user hit timeouts
@@ -67,9 +72,11 @@ class CacheEnabled:
             if logger.isEnabledFor(DEBUG):
                 logger.debug(f"Setting cache timeout to {default_timeout}")
             self._cache = FanoutCache(self._cache_directory, shards=shards, timeout=default_timeout,
-                                      eviction_policy=eviction_policy)
+                                      eviction_policy=eviction_policy, **settings)
         else:
-            self._cache = Cache(self._cache_directory)
+            if eviction_policy:
+                settings['eviction_policy'] = eviction_policy
+            self._cache = Cache(self._cache_directory, **settings)
 
     def cleanup_cache(self):
         """
@@ -27,7 +27,8 @@ class IAnalyzer(metaclass=ABCMeta):
     """
 
     @abstractmethod
-    def __init__(self, uid=None, working_dir: Optional[str] = None, parse: bool = True, filenames: Optional[List[str]] = None):
+    def __init__(self, uid=None, working_dir: Optional[str] = None, parse: bool = True, filenames: Optional[List[str]] = None,
+                 file_columns: Optional[Dict[str, Any]] = None):
         """
         A constructor.
 
@@ -37,6 +38,8 @@ class IAnalyzer(metaclass=ABCMeta):
             parse: True to leverage the :class:`OutputParser`; False to get the raw
                 data in the :meth:`select_simulation_data`.
             filenames: The files for the analyzer to download.
+            file_columns: Optional mapping of filename to the columns(csv) or keys(json) to parse. See
+                :attr:`file_columns`.
         """
         self.parse = parse
         self.working_dir = working_dir
@@ -44,6 +47,7 @@ class IAnalyzer(metaclass=ABCMeta):
         self.results = None  # Store what finalize() is returning
         self._filenames = filenames or list()
         self._filenames = [f.replace("\\", '/') for f in self._filenames]
+        self.file_columns = file_columns
 
     @property
     def filenames(self):
@@ -71,6 +75,33 @@ class IAnalyzer(metaclass=ABCMeta):
         self._filenames = value or list()
         self._filenames = [f.replace("\\", '/') for f in self._filenames]
 
+    @property
+    def file_columns(self) -> Dict[str, Any]:
+        """
+        Returns the selection of data to parse per filename.
+
+        When parse is True, only the listed columns of a csv file (a list of columns or a mapping of column to dtype)
+        or the listed keys of a json file (top level keys or tuple paths to nested keys, for example
+        ("Channels", "Births")) are loaded. Files without a selection are loaded entirely.
+
+        Returns:
+            file columns
+        """
+        return getattr(self, '_file_columns', None) or dict()
+
+    @file_columns.setter
+    def file_columns(self, value: Optional[Dict[str, Any]]):
+        """
+        Set the file_columns property.
+
+        Args:
+            value: new file columns
+
+        Returns:
+            None
+        """
+        self._file_columns = {f.replace("\\", '/'): columns for f, columns in (value or dict()).items()}
+
     def initialize(self) -> NoReturn:
         """
         Call once after the analyzer has been added to the :class:`~idmtools.analysis.AnalyzeManager`.
@@ -129,6 +160,46 @@ class IAnalyzer(metaclass=ABCMeta):
         """
         pass
 
+    def reduce_partial(self, accumulator: Any, item: ANALYZABLE_ITEM, data: Any) -> Any:
+        """
+        Fold the :meth:`map` data of one item into an accumulator.
+
+        Implementing this method opts the analyzer into streaming mode: the :class:`~idmtools.analysis.analyze_manager.AnalyzeManager`
+        calls it as soon as each item is mapped instead of keeping all mapped data in memory for :meth:`reduce`. The
+        final result is then produced by :meth:`finalize`.
+
+        Args:
+            accumulator: The value returned by the previous call. None for the first item.
+            item: The item the data is associated with.
+            data: The selected data returned by :meth:`map` for the item.
+
+        Returns:
+            The updated accumulator.
+        """
+        raise NotImplementedError("reduce_partial is not implemented for this analyzer")
+
+    def finalize(self, accumulator: Any) -> Any:
+        """
+        Produce the result of a streaming analyzer from the accumulator built by :meth:`reduce_partial`.
+
+        Args:
+            accumulator: The value returned by the last :meth:`reduce_partial` call. None if no item was mapped.
+
+        Returns:
+            The analyzer results.
+        """
+        return accumulator
+
+    @property
+    def streaming(self) -> bool:
+        """
+        Whether the analyzer reduces incrementally through :meth:`reduce_partial`/:meth:`finalize`.
+
+        Returns:
+            True if the analyzer implements :meth:`reduce_partial`
+        """
+        return type(self).reduce_partial is not IAnalyzer.reduce_partial
+
     def destroy(self) -> NoReturn:
         """
         Call after the analysis is done.
@@ -143,7 +214,8 @@ class BaseAnalyzer(IAnalyzer, metaclass=ABCMeta):
     BaseAnalyzer to allow using previously used dtk-tools analyzers within idmtools.
     """
 
-    def __init__(self, uid=None, working_dir: Optional[str] = None, parse: bool = True, filenames: Optional[List[str]] = None):
+    def __init__(self, uid=None, working_dir: Optional[str] = None, parse: bool = True, filenames: Optional[List[str]] = None,
+                 file_columns: Optional[Dict[str, Any]] = None):
         """
         Constructor for Base Analyzer.
 
@@ -153,10 +225,11 @@ class BaseAnalyzer(IAnalyzer, metaclass=ABCMeta):
             parse: True to leverage the :class:`OutputParser`; False to get the raw
                 data in the :meth:`select_simulation_data`.
             filenames: The files for the analyzer to download.
+            file_columns: Optional mapping of filename to the columns(csv) or keys(json) to parse.
         """
         logger.warning('Base analyzer name will soon be deprecated in favor of IAnalyzer')
         # TODO: Make transition documentation so we can deprecat this
-        super().__init__(uid, working_dir, parse, filenames)
+        super().__init__(uid, working_dir, parse, filenames, file_columns)
 
 
 TAnalyzer = TypeVar("TAnalyzer", bound=IAnalyzer)
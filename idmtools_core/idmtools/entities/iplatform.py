@@ -7,7 +7,9 @@ Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
 import os
 import copy
+import time
 from abc import ABCMeta
+from contextlib import contextmanager
 from dataclasses import dataclass
 from dataclasses import fields, field
 from functools import partial
@@ -16,7 +18,8 @@ import pandas as pd
 from pathlib import PureWindowsPath, PurePath
 from itertools import groupby
 from logging import getLogger, DEBUG
-from typing import Dict, List, NoReturn, Type, TypeVar, Any, Union, Tuple, Set, Iterator, Callable, Optional
+from typing import Dict, List, NoReturn, Type, TypeVar, Any, Union, Tuple, Set, Iterator, Callable, Optional, \
+    ContextManager
 from idmtools.core.context import set_current_platform
 from idmtools import IdmConfigParser
 from idmtools.core import CacheEnabled, UnknownItemException, EntityContainer, UnsupportedPlatformType
@@ -46,6 +49,15 @@ from idmtools.utils.entities import validate_user_inputs_against_dataclass
 logger = getLogger(__name__)
 user_logger = getLogger('user')
 
+
+@contextmanager
+def _sleep_between_refreshes():
+    """
+    Default status tracking of IPlatform: sleep between two status refreshes.
+    """
+    yield time.sleep
+
+
 CALLER_LIST = ['_create_platform_from_block',  # create platform through Platform Factory
                'fetch',  # create platform through un-pickle
                'get',  # create platform through platform spec' get method
@@ -693,17 +705,32 @@ class IPlatform(IItem, CacheEnabled, metaclass=ABCMeta):
             :meth:`idmtools.entities.iplatform.IPlatform.__wait_until_done_progress_callback`
             :meth:`idmtools.entities.iplatform.IPlatform.wait_till_done`
         """
-        import time
         start_time = time.time()
-        while time.time() - start_time < timeout:
-            if logger.isEnabledFor(DEBUG):
-                logger.debug("Refreshing simulation status")
-            self.refresh_status(item)
-            if callback(item):
-                return
-            time.sleep(refresh_interval)
+        with self._track_status(item) as wait_for_change:
+            while time.time() - start_time < timeout:
+                if logger.isEnabledFor(DEBUG):
+                    logger.debug("Refreshing simulation status")
+                self.refresh_status(item)
+                if callback(item):
+                    return
+                wait_for_change(refresh_interval)
         raise TimeoutError(f"Timeout of {timeout} seconds exceeded")
 
+    def _track_status(self, item: Union[Experiment, IWorkflowItem, Suite]) -> ContextManager[Callable[[float], Any]]:
+        """
+        Context active while waiting on an item. It provides the function called between two status refreshes.
+
+        By default, we sleep for the refresh interval. Platforms able to detect status changes override this to wake up
+        as soon as the status of the item changes and to refresh only what changed.
+
+        Args:
+            item: Item being waited on
+
+        Returns:
+            Context manager yielding a function which takes the maximum time to wait in seconds
+        """
+        return _sleep_between_refreshes()
+
     def wait_till_done(self, item: IRunnableEntity, timeout: int = 60 * 60 * 24,
                        refresh_interval: int = 5, progress: bool = True):
         """
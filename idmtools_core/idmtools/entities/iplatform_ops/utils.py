@@ -5,13 +5,15 @@ Here we have mostly utilities to handle batch operations which tend to overlap a
 
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
-from concurrent.futures import as_completed, Future
+import time
+from concurrent.futures import Future, wait, FIRST_COMPLETED
 from concurrent.futures.process import ProcessPoolExecutor
 from concurrent.futures.thread import ThreadPoolExecutor
+from dataclasses import dataclass
 from functools import partial
 from logging import getLogger, DEBUG
 from os import cpu_count
-from typing import List, Union, Generator, Iterable, Callable, Any
+from typing import List, Union, Generator, Iterable, Callable, Any, Tuple
 from more_itertools import chunked
 from idmtools.core import EntityContainer
 from idmtools.entities.templated_simulation import TemplatedSimulations
@@ -22,6 +24,35 @@ user_logger = getLogger('user')
 EXECUTOR = None
 
 
+@dataclass
+class BatchMetrics:
+    """
+    Throughput of a batch created by batch_create_items.
+    """
+    #: Index of the batch
+    batch: int
+    #: Number of items in the batch
+    items: int
+    #: Seconds spent creating the items in the worker
+    run_time: float
+    #: Seconds between the submission of the batch and its completion
+    latency: float
+
+    @property
+    def throughput(self) -> float:
+        """
+        Items created per second by the worker.
+
+        Returns:
+            Items per second
+        """
+        return self.items / self.run_time if self.run_time > 0 else float(self.items)
+
+
+# Metrics of the batches of the last batch_create_items call
+BATCH_METRICS: List[BatchMetrics] = []
+
+
 def batch_items(items: Union[Iterable, Generator], batch_size=16):
     """
     Batch items.
@@ -63,12 +94,32 @@ def item_batch_worker_thread(create_func: Callable, items: Union[List], **kwargs
     return ret
 
 
+def timed_batch_worker(batch_worker_thread_func: Callable[[List], List], items: List) -> Tuple[List, float]:
+    """
+    Run a batch worker function and time it.
+
+    Args:
+        batch_worker_thread_func: Batch worker function
+        items: Items to create
+
+    Returns:
+        Results of the batch and the time it took in seconds
+    """
+    start = time.perf_counter()
+    result = batch_worker_thread_func(items)
+    return result, time.perf_counter() - start
+
+
 def batch_create_items(items: Union[Iterable, Generator], batch_worker_thread_func: Callable[[List], List] = None,
                        create_func: Callable[..., Any] = None, display_progress: bool = True,
                        progress_description: str = "Commissioning items", unit: str = None, **kwargs):
     """
     Batch create items. You must specify either batch_worker_thread_func or create_func.
 
+    Items are consumed lazily: at most max_pending_batches batches (the *max_pending_batches* configuration option,
+    twice the number of workers by default) are submitted but not completed at any time, so generators of items are
+    not expanded ahead of the workers. Metrics of each batch are kept in :data:`BATCH_METRICS`.
+
     Args:
         items: Items to create
         batch_worker_thread_func: Optional Function to execute. Should take a list and return a list
@@ -76,7 +127,9 @@ def batch_create_items(items: Union[Iterable, Generator], batch_worker_thread_fu
         display_progress: Enable progress bar
         progress_description: Description to show in progress bar
         unit: Unit for progress bar
-        **kwargs:
+        **kwargs: max_workers and batch_size override the configuration options of the same name.
+            max_pending_batches overrides the *max_pending_batches* configuration option. Other keyword arguments
+            are passed to create_func
 
     Returns:
         Batches crated results
@@ -86,6 +139,7 @@ def batch_create_items(items: Union[Iterable, Generator], batch_worker_thread_fu
     from idmtools.utils.collections import ExperimentParentIterator
 
     max_workers = kwargs.get('max_workers', None)
+    max_pending_batches = kwargs.pop('max_pending_batches', None)
 
     # Consider values from the block that Platform uses
     _batch_size = int(IdmConfigParser.get_option(None, "batch_size", fallback=16))
@@ -97,7 +151,7 @@ def batch_create_items(items: Union[Iterable, Generator], batch_worker_thread_fu
     if display_progress and not IdmConfigParser.is_progress_bar_disabled():
         from tqdm import tqdm
         extra_args = dict(unit=unit) if unit else dict()
-        prog = tqdm(desc="Initializing objects for creation", **extra_args)
+        prog = tqdm(desc=progress_description, **extra_args)
     else:
         prog = None
 
@@ -126,10 +180,31 @@ def batch_create_items(items: Union[Iterable, Generator], batch_worker_thread_fu
             raise ValueError("You must provide either an item create callback or a item batch worker thread callback to"
                              " perform batches")
         batch_worker_thread_func = partial(item_batch_worker_thread, create_func, **kwargs)
+    if max_pending_batches is None:
+        max_pending_batches = int(IdmConfigParser.get_option(None, "max_pending_batches",
+                                                             fallback=2 * getattr(EXECUTOR, '_max_workers', 8)))
+    max_pending_batches = max(1, max_pending_batches)
     if logger.isEnabledFor(DEBUG):
-        logger.debug(f'Batching creation by {_batch_size}')
+        logger.debug(f'Batching creation by {_batch_size} with at most {max_pending_batches} pending batches')
 
     futures = []
+    pending = set()
+    # batch index and submission time of the pending batches
+    submitted = dict()
+    BATCH_METRICS.clear()
+
+    def collect(done: Iterable[Future]):
+        for future in done:
+            result, run_time = future.result()
+            batch, submitted_at = submitted.pop(future)
+            metrics = BatchMetrics(batch=batch, items=len(result), run_time=run_time,
+                                   latency=time.perf_counter() - submitted_at)
+            BATCH_METRICS.append(metrics)
+            if logger.isEnabledFor(DEBUG):
+                logger.debug(f"Batch {batch}: created {metrics.items} items in {metrics.run_time:.3f}s "
+                             f"({metrics.throughput:.1f} items/s, {metrics.latency:.3f}s since submission)")
+            if prog is not None:
+                prog.update(metrics.items)
 
     total = 0
     parent = None
@@ -141,8 +216,9 @@ def batch_create_items(items: Union[Iterable, Generator], batch_worker_thread_fu
         i = items.items
     else:
         i = items
-    if display_progress and not IdmConfigParser.is_progress_bar_disabled() and hasattr(items, '__len__'):
+    if prog is not None and hasattr(items, '__len__'):
         prog.total = len(items)
+    start = time.perf_counter()
     for chunk in chunked(i, _batch_size):
         total += len(chunk)
         if parent:
@@ -150,36 +226,25 @@ def batch_create_items(items: Union[Iterable, Generator], batch_worker_thread_fu
                 c.parent = parent
         if logger.isEnabledFor(DEBUG):
             logger.debug(f"Submitting chunk: {len(chunk)}")
-        if display_progress and not IdmConfigParser.is_progress_bar_disabled():
-            prog.update(len(chunk))
-        futures.append(EXECUTOR.submit(batch_worker_thread_func, chunk))
+        future = EXECUTOR.submit(timed_batch_worker, batch_worker_thread_func, chunk)
+        submitted[future] = (len(futures), time.perf_counter())
+        futures.append(future)
+        pending.add(future)
+        # backpressure: wait for a batch to complete before pulling more items
+        while len(pending) >= max_pending_batches:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            collect(done)
+
+    done, _ = wait(pending)
+    collect(done)
+    if prog is not None:
+        prog.close()
 
     results = []
-    if display_progress and not IdmConfigParser.is_progress_bar_disabled():
-        prog.set_description(progress_description)
-        prog.reset(total)
-        results = show_progress_of_batch(prog, futures)
-    else:
-        for future in futures:
-            results.extend(future.result())
-
-    return results
-
+    for future in futures:
+        results.extend(future.result()[0])
+    elapsed = time.perf_counter() - start
+    if logger.isEnabledFor(DEBUG) and elapsed > 0:
+        logger.debug(f"Created {total} items in {len(futures)} batches in {elapsed:.3f}s ({total / elapsed:.1f} items/s)")
 
-def show_progress_of_batch(progress_bar: 'tqdm', futures: List[Future]) -> List:  # noqa: F821
-    """
-    Show progress bar for batch.
-
-    Args:
-        progress_bar: Progress bar
-        futures: List of futures that are still running/queued
-
-    Returns:
-        Returns results
-    """
-    results = []
-    for future in as_completed(futures):
-        result = future.result()
-        progress_bar.update(len(result))
-        results.extend(future.result())
     return results
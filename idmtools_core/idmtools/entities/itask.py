@@ -7,7 +7,7 @@ import copy
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass, field, fields
 from logging import getLogger
-from typing import Set, NoReturn, Union, Callable, List, TYPE_CHECKING, Dict
+from typing import Set, NoReturn, Union, Callable, List, TYPE_CHECKING, Dict, Optional
 from idmtools.assets import AssetCollection
 from idmtools.entities.command_line import CommandLine
 from idmtools.entities.platform_requirements import PlatformRequirements
@@ -43,6 +43,10 @@ class ITask(metaclass=ABCMeta):
     #: List of requirements needed by the task to run on an execution platform. This is stuff like Windows, Linux, GPU
     #  etc
     platform_requirements: Set[PlatformRequirements] = field(default_factory=set)
+    #: Number of cores the task uses. Local platforms reserve them when scheduling the task. Platform default when None
+    cores: Optional[int] = field(default=None)
+    #: Memory in MB the task uses. Local platforms reserve it when scheduling the task. Platform default when None
+    memory: Optional[int] = field(default=None)
 
     #: We provide hooks as list to allow more user scripting extensibility
     __pre_creation_hooks: List[TTaskHook] = field(default_factory=list)
@@ -6,9 +6,10 @@ the object is replaced with a proxy object with minimal information needed to wo
 
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
-from typing import Union
+from typing import Union, Optional, Set
 from dataclasses import dataclass, field
 from idmtools.entities import CommandLine
+from idmtools.entities.platform_requirements import PlatformRequirements
 
 
 @dataclass
@@ -19,6 +20,9 @@ class TaskProxy:
     command: Union[str, CommandLine] = field(default=None)
     is_docker: bool = False
     is_gpu: bool = False
+    cores: Optional[int] = None
+    memory: Optional[int] = None
+    platform_requirements: Set[PlatformRequirements] = field(default_factory=set)
 
     @staticmethod
     def from_task(task: 'ITask'):  # noqa: F821
@@ -33,5 +37,6 @@ class TaskProxy:
         """
         from idmtools.core.docker_task import DockerTask
         is_docker = isinstance(task, DockerTask)
-        item = TaskProxy(command=task.command, is_docker=is_docker, is_gpu=is_docker and task.use_nvidia_run)
+        item = TaskProxy(command=task.command, is_docker=is_docker, is_gpu=is_docker and task.use_nvidia_run,
+                         cores=task.cores, memory=task.memory, platform_requirements=task.platform_requirements)
         return item
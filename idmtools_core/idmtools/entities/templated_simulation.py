@@ -6,11 +6,16 @@ This is meant to be combined with builders.
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
 import copy
+import pickle
+from collections import deque
+from concurrent.futures.process import ProcessPoolExecutor
 from dataclasses import dataclass, field, fields, InitVar
 from functools import partial
 from itertools import chain
-from typing import Set, Generator, Dict, Any, List, TYPE_CHECKING
+from logging import getLogger, DEBUG
+from typing import Set, Generator, Dict, Any, List, Iterable, Tuple, Callable, Optional, TYPE_CHECKING
 from more_itertools import grouper
+from idmtools.assets import AssetCollection
 from idmtools.builders.simulation_builder import SimulationBuilder
 from idmtools.entities.itask import ITask
 from idmtools.entities.simulation import Simulation
@@ -20,8 +25,116 @@ from idmtools.utils.hashing import ignore_fields_in_dataclass_on_pickle
 if TYPE_CHECKING:  # pragma: no cover
     from idmtools.entities.experiment import Experiment
 
+logger = getLogger(__name__)
 
-def simulation_generator(builders, new_sim_func, additional_sims=None, batch_size=10):
+
+def apply_sweep_functions(simulation: Simulation, simulation_functions: Iterable[Callable]) -> Simulation:
+    """
+    Apply the sweep functions of a simulation and add the tags they return to it.
+
+    Args:
+        simulation: Simulation to update
+        simulation_functions: Sweep functions
+
+    Returns:
+        The updated simulation
+    """
+    tags = {}
+
+    for func in simulation_functions:
+        new_tags = func(simulation=simulation)
+        if new_tags:
+            tags.update(new_tags)
+
+    simulation.tags.update(tags)
+    return simulation
+
+
+def _apply_sweep_functions_batch(batch: List[Tuple[Simulation, AssetCollection, Iterable[Callable]]]) -> List[Tuple[Simulation, AssetCollection]]:
+    """
+    Worker process entry point applying the sweep functions of a batch of simulations.
+
+    Assets are passed along the simulations since they are not pickled with them.
+
+    Args:
+        batch: List of simulation, simulation assets and sweep functions
+
+    Returns:
+        List of the updated simulations and their assets
+    """
+    results = []
+    for simulation, assets, simulation_functions in batch:
+        simulation.assets = assets
+        apply_sweep_functions(simulation, simulation_functions)
+        results.append((simulation, simulation.assets))
+    return results
+
+
+def _parallel_simulation_generator(simulation_functions: Iterable, new_sim_func: Callable[[], Simulation],
+                                   batch_size: int, max_workers: int) -> Generator[Simulation, None, None]:
+    """
+    Generate simulations applying the sweep functions in a process pool.
+
+    Batches are submitted in order and at most two batches per worker are in flight, so simulations are yielded in the
+    same order as the serial generator while the next batches are being built.
+
+    Args:
+        simulation_functions: Sweep functions of each simulation
+        new_sim_func: Build new simulation callback
+        batch_size: Number of simulations sent to a worker at once
+        max_workers: Number of worker processes
+
+    Returns:
+        Generator for simulations
+    """
+    batches = (list(filter(None, groups)) for groups in grouper(simulation_functions, batch_size))
+    first_batch = next(batches, None)
+    if first_batch is None:
+        return
+    try:
+        pickle.dumps(first_batch)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        logger.warning(f"Sweep functions cannot be sent to worker processes, generating simulations serially: {e}")
+        for functions in chain(first_batch, chain.from_iterable(batches)):
+            yield apply_sweep_functions(new_sim_func(), functions)
+        return
+
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for batch in chain([first_batch], batches):
+            simulations = [new_sim_func() for _ in batch]
+            parents = [simulation.parent for simulation in simulations]
+            # the parent stays in this process
+            for simulation in simulations:
+                simulation.parent = None
+            work = [(simulation, simulation.assets, functions) for simulation, functions in zip(simulations, batch)]
+            pending.append((parents, pool.submit(_apply_sweep_functions_batch, work)))
+            if logger.isEnabledFor(DEBUG):
+                logger.debug(f"Submitted {len(batch)} simulations for generation")
+            while len(pending) > 2 * max_workers:
+                yield from _collect_generated_simulations(*pending.popleft())
+        while pending:
+            yield from _collect_generated_simulations(*pending.popleft())
+
+
+def _collect_generated_simulations(parents: List['Experiment'], future) -> Generator[Simulation, None, None]:
+    """
+    Wait for a batch of simulations generated in a worker process and restore their parent and assets.
+
+    Args:
+        parents: Parents of the simulations
+        future: Future of the batch
+
+    Returns:
+        Generator for simulations
+    """
+    for parent, (simulation, assets) in zip(parents, future.result()):
+        simulation.assets = assets
+        simulation.parent = parent
+        yield simulation
+
+
+def simulation_generator(builders, new_sim_func, additional_sims=None, batch_size=10, max_workers: Optional[int] = None):
     """
     Generates batches of simulations from the templated simulations.
 
@@ -30,6 +143,8 @@ def simulation_generator(builders, new_sim_func, additional_sims=None, batch_siz
         new_sim_func: Build new simulation callback
         additional_sims: Additional simulations
         batch_size: Batch size
+        max_workers: Number of processes applying the sweep functions. Simulations are generated in the main process
+            when it is not greater than 1. Sweep functions must be picklable to be applied in other processes
 
     Returns:
         Generator for simulations in batches
@@ -37,18 +152,12 @@ def simulation_generator(builders, new_sim_func, additional_sims=None, batch_siz
     if additional_sims is None:
         additional_sims = []
     # Then the builders
-    for groups in grouper(chain(*builders), batch_size):
-        for simulation_functions in filter(None, groups):
-            simulation = new_sim_func()
-            tags = {}
-
-            for func in simulation_functions:
-                new_tags = func(simulation=simulation)
-                if new_tags:
-                    tags.update(new_tags)
-
-            simulation.tags.update(tags)
-            yield simulation
+    if max_workers is not None and max_workers > 1:
+        yield from _parallel_simulation_generator(chain(*builders), new_sim_func, batch_size, max_workers)
+    else:
+        for groups in grouper(chain(*builders), batch_size):
+            for simulation_functions in filter(None, groups):
+                yield apply_sweep_functions(new_sim_func(), simulation_functions)
 
     yield from additional_sims
 
@@ -76,6 +185,8 @@ class TemplatedSimulations:
     base_task: ITask = field(default=None)
     parent: 'Experiment' = field(default=None)
     tags: InitVar[Dict] = None
+    #: Number of processes used to apply sweep functions. Defaults to the *generation_workers* configuration option
+    generation_workers: Optional[int] = field(default=None, compare=False)
     __extra_simulations: List[Simulation] = field(default_factory=list)
 
     def __post_init__(self, tags):
@@ -182,9 +293,22 @@ class TemplatedSimulations:
         Returns:
             Simulation iterator
         """
-        p = partial(simulation_generator, self.builders, self.new_simulation, self.__extra_simulations)
+        p = partial(simulation_generator, self.builders, self.new_simulation, self.__extra_simulations,
+                    max_workers=self._get_generation_workers())
         return ResetGenerator(p)
 
+    def _get_generation_workers(self) -> int:
+        """
+        Get the number of processes used to apply sweep functions.
+
+        Returns:
+            Number of workers
+        """
+        if self.generation_workers is not None:
+            return self.generation_workers
+        from idmtools.config import IdmConfigParser
+        return int(IdmConfigParser.get_option(None, "generation_workers", fallback=1))
+
     def extra_simulations(self) -> List[Simulation]:
         """
         Returns the extra simulations defined on template.
@@ -225,13 +349,15 @@ class TemplatedSimulations:
         """
         Return a new simulation object.
 
-        The simulation will be copied from the base simulation of the experiment.
+        The simulation will be copied from the base simulation of the experiment through the
+        :meth:`~idmtools.entities.itask.ITask.copy_simulation` hook of the base task, so tasks can share their
+        data with the base simulation until it is changed.
 
         Returns:
             The created simulation.
         """
         # TODO: the experiment should be frozen when the first simulation is created
-        sim = copy.deepcopy(self.base_simulation)
+        sim = self.base_simulation.task.copy_simulation(self.base_simulation)
         # Set UID=none to ensure it is regenerated
         sim._uid = None
         sim.assets = copy.deepcopy(self.base_simulation.assets)
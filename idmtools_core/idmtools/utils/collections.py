@@ -3,6 +3,7 @@ utilities for collections.
 
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
+import copy
 import typing
 from itertools import tee
 from typing import Tuple, List, Mapping, Union, Iterable, Generator
@@ -234,3 +235,126 @@ def duplicate_list_of_generators(lst: List[Generator]):
         new_sw.append(n)
         old_sw.append(o)
     return old_sw, new_sw
+
+
+# Values which are never copied when read from a CopyOnWriteDict
+IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None), frozenset)
+
+
+class CopyOnWriteDict(dict):
+    """
+    Dictionary sharing the values of a base dictionary until they are accessed.
+
+    Creating the dictionary only copies the top level of the base. Nested dictionaries are wrapped in a CopyOnWriteDict
+    and other mutable values are deep copied the first time they are read, so changes never reach the base dictionary
+    while untouched values stay shared. Copies made with dict(), {**d} or keyword unpacking read the values through
+    __getitem__ too. The base dictionary itself should not be modified in place afterwards.
+    """
+
+    def __init__(self, base: Mapping = None):
+        """
+        Constructor.
+
+        Args:
+            base: Dictionary to share values with
+        """
+        super().__init__(base or {})
+        self._owned = set()
+
+    def _own(self, key):
+        """
+        Make sure the value of a key is not shared with the base dictionary anymore.
+
+        Args:
+            key: Key to own
+
+        Returns:
+            Value of the key
+        """
+        value = super().__getitem__(key)
+        if key not in self._owned:
+            if isinstance(value, dict) and not isinstance(value, CopyOnWriteDict):
+                value = CopyOnWriteDict(value)
+            elif not isinstance(value, IMMUTABLE_TYPES):
+                value = copy.deepcopy(value)
+            super().__setitem__(key, value)
+            self._owned.add(key)
+        return value
+
+    def __getitem__(self, key):
+        """Get item, copying it from the base first."""
+        return self._own(key)
+
+    def __iter__(self):
+        """
+        Iterate over the keys.
+
+        Overriding it makes dict(), {**d} and keyword unpacking read the values through __getitem__ instead of
+        copying the shared values directly.
+        """
+        return super().__iter__()
+
+    def get(self, key, default=None):
+        """Get item or default, copying it from the base first."""
+        return self._own(key) if key in self else default
+
+    def items(self):
+        """Items, copying values from the base first."""
+        return [(key, self._own(key)) for key in self]
+
+    def values(self):
+        """Values, copying them from the base first."""
+        return [self._own(key) for key in self]
+
+    def setdefault(self, key, default=None):
+        """Set default, copying the existing value from the base first."""
+        if key in self:
+            return self._own(key)
+        self[key] = default
+        return default
+
+    def pop(self, key, *args):
+        """Pop item, copying it from the base first."""
+        if key in self:
+            self._own(key)
+            self._owned.discard(key)
+        return super().pop(key, *args)
+
+    def popitem(self):
+        """Pop last item, copying it from the base first."""
+        key = next(reversed(self))
+        return key, self.pop(key)
+
+    def __setitem__(self, key, value):
+        """Set item. Set values are never copied."""
+        super().__setitem__(key, value)
+        self._owned.add(key)
+
+    def update(self, *args, **kwargs):
+        """Update items. Set values are never copied."""
+        values = dict(*args, **kwargs)
+        super().update(values)
+        self._owned.update(values.keys())
+
+    def __ior__(self, other):
+        """In place merge."""
+        self.update(other)
+        return self
+
+    def copy(self):
+        """Shallow copy which is also copy on write."""
+        return CopyOnWriteDict(self)
+
+    def to_dict(self) -> dict:
+        """
+        Materialize as a plain dictionary without copying the values shared with the base.
+
+        Returns:
+            dict suitable for serialization
+        """
+        return {key: value.to_dict() if isinstance(value, CopyOnWriteDict) else value
+                for key, value in zip(self.keys(), super().values())}
+
+    def __reduce__(self):
+        """Pickle and deepcopy as a new copy on write dictionary over the materialized values."""
+        return self.__class__, (self.to_dict(),)
@@ -13,6 +13,8 @@ def scan_directory(basedir: str, recursive: bool = True, ignore_directories: Lis
     """
     Scan a directory recursively or not.
 
+    Ignored directories are pruned at any depth, without being scanned.
+
     Args:
         basedir: The root directory to start from.
         recursive: True to search the sub-folders recursively; False to stay in the root directory.
@@ -21,12 +23,18 @@ def scan_directory(basedir: str, recursive: bool = True, ignore_directories: Lis
     Returns:
         An iterator yielding all the files found.
     """
-    for entry in os.scandir(basedir):
-        if entry.is_file():
-            yield entry
-        elif recursive:
-            if ignore_directories is None or entry.name not in ignore_directories:
-                yield from scan_directory(entry.path)
+    ignore_directories = set(ignore_directories or [])
+    directories = [basedir]
+    while directories:
+        subdirectories = []
+        with os.scandir(directories.pop()) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    yield entry
+                elif recursive and entry.name not in ignore_directories and entry.is_dir():
+                    subdirectories.append(entry.path)
+        # scan the subdirectories in order, depth first
+        directories.extend(reversed(subdirectories))
 
 
 def file_content_to_generator(absolute_path, chunk_size=128) -> Generator[bytearray, None, None]:
@@ -6,7 +6,7 @@ Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 import json
 import os
 from logging import getLogger
-from typing import Dict
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 
 import pandas as pd
 
@@ -14,6 +14,16 @@ from io import StringIO, BytesIO
 
 logger = getLogger(__name__)
 
+# A selection of csv columns(optionally mapped to their dtype) or json keys. Json keys are either a top level key or a
+# tuple describing the path to a nested key, for example ("Channels", "Births")
+TFileColumns = Union[List[Union[str, Tuple[str, ...]]], Mapping[str, Union[str, type]]]
+
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
 
 class FileParser:
     """
@@ -21,13 +31,14 @@ class FileParser:
     """
 
     @classmethod
-    def parse(cls, filename, content=None):
+    def parse(cls, filename, content=None, columns: Optional[TFileColumns] = None):
         """
         Parse filename and load the content.
 
         Args:
             filename: Filename to load
             content: Content to load
+            columns: Optional selection of the columns(csv) or keys(json) to load. Other formats ignore it
 
         Returns:
             Content loaded
@@ -36,10 +47,10 @@ class FileParser:
         content = BytesIO(content)
 
         if file_extension == 'json':
-            return cls.load_json_file(filename, content)
+            return cls.load_json_file(filename, content, keys=columns)
 
         if file_extension == 'csv':
-            return cls.load_csv_file(filename, content)
+            return cls.load_csv_file(filename, content, columns=columns)
 
         if file_extension == 'xlsx':
             return cls.load_xlsx_file(filename, content)
@@ -53,18 +64,49 @@ class FileParser:
         return cls.load_raw_file(filename, content)
 
     @classmethod
-    def load_json_file(cls, filename, content) -> Dict:
+    def load_json_file(cls, filename, content, keys: Optional[List[Union[str, Tuple[str, ...]]]] = None) -> Dict:
         """
         Load JSON File.
 
         Args:
             filename: Filename to load
             content: Content
+            keys: Optional keys to keep. A key is either a top level key or a tuple path to a nested key. The
+                nesting of the document is preserved and missing keys are skipped
 
         Returns:
             JSOn as dict
         """
-        return json.load(content)
+        data = json.load(content)
+        if not keys or not isinstance(data, dict):
+            return data
+        return cls.select_json_keys(data, keys)
+
+    @staticmethod
+    def select_json_keys(data: Dict, keys: List[Union[str, Tuple[str, ...]]]) -> Dict:
+        """
+        Extract a selection of keys from a json document, dropping the rest of the document.
+
+        Args:
+            data: Json document
+            keys: Top level keys or tuple paths to nested keys
+
+        Returns:
+            Document only containing the selected keys
+        """
+        selected = dict()
+        for key in keys:
+            path = (key,) if isinstance(key, str) else tuple(key)
+            source, target = data, selected
+            for i, part in enumerate(path):
+                if not isinstance(source, dict) or part not in source:
+                    break
+                if i == len(path) - 1:
+                    target[part] = source[part]
+                else:
+                    source = source[part]
+                    target = target.setdefault(part, dict())
+        return selected
 
     @classmethod
     def load_raw_file(self, filename, content):
@@ -81,13 +123,14 @@ class FileParser:
         return content
 
     @classmethod
-    def load_csv_file(cls, filename, content) -> pd.DataFrame:
+    def load_csv_file(cls, filename, content, columns: Optional[TFileColumns] = None) -> pd.DataFrame:
         """
         Load csv file.
 
         Args:
             filename: Filename to load
             content: Content is loading
+            columns: Optional list of the columns to load or mapping of the columns to load to their dtype
 
         Returns:
             Loaded csv file
@@ -95,7 +138,22 @@ class FileParser:
         if not isinstance(content, StringIO) and not isinstance(content, BytesIO):
             content = StringIO(content)
 
-        csv_read = pd.read_csv(content, skipinitialspace=True)
+        options = dict(skipinitialspace=True)
+        if columns:
+            options['usecols'] = list(columns)
+            if isinstance(columns, Mapping):
+                options['dtype'] = dict(columns)
+            # pyarrow only pays off when few columns are parsed. It does not support skipinitialspace, so files with
+            # spaces after the delimiters are read again with the c engine when the columns do not match
+            if CSV_ENGINE == 'pyarrow':
+                position = content.tell()
+                try:
+                    return pd.read_csv(content, engine=CSV_ENGINE,
+                                       **{k: v for k, v in options.items() if k != 'skipinitialspace'})
+                except (ValueError, KeyError) as ex:
+                    logger.debug(f"Could not read {filename} with pyarrow, using the c engine: {ex}")
+                    content.seek(position)
+        csv_read = pd.read_csv(content, **options)
         return csv_read
 
     @classmethod
@@ -144,7 +202,7 @@ class FileParser:
         """
         try:
             from idmtools_platform_comps.utils.spatial_output import SpatialOutput
-            so = SpatialOutput.from_bytes(content.read(), 'Filtered' in filename)
+            so = SpatialOutput.from_bytes(content.getbuffer(), 'Filtered' in filename)
             return so.to_dict()
         except ImportError as ex:
             logger.exception(ex)
@@ -15,6 +15,8 @@ from logging import getLogger, Logger
 
 logger = getLogger(__name__)
 Pickler = pickle._Pickler
+# Read files in 1MB chunks when hashing them
+MD5_CHUNK_SIZE = 2 ** 20
 
 
 class _ConsistentSet(object):
@@ -197,7 +199,7 @@ def ignore_fields_in_dataclass_on_pickle(item):
     return state
 
 
-def calculate_md5(filename: str, chunk_size: int = 8192) -> str:
+def calculate_md5(filename: str, chunk_size: int = MD5_CHUNK_SIZE) -> str:
     """
     Calculate MD5.
 
@@ -1,10 +1,13 @@
 import copy
+import shutil
+import tempfile
 
 import allure
 import unittest
 from typing import Any
 import pytest
 from idmtools.analysis.analyze_manager import AnalyzeManager
+from idmtools.analysis.map_result_cache import MapResultCache
 from idmtools.analysis.download_analyzer import DownloadAnalyzer as SampleAnalyzer
 from idmtools.core.enums import EntityStatus, ItemType
 from idmtools.core.interfaces.iitem import IItem
@@ -35,6 +38,36 @@ class TestAnalyzeManager(unittest.TestCase):
         def reduce(self, all_data: dict) -> 'Any':
             pass
 
+    class StreamingCountAnalyzer(IAnalyzer):
+        def __init__(self):
+            super().__init__()
+
+        def map(self, data: 'Any', item: 'IItem') -> 'Any':
+            return 1
+
+        def reduce(self, all_data: dict) -> 'Any':
+            return sum(all_data.values())
+
+        def reduce_partial(self, accumulator: 'Any', item: 'IItem', data: 'Any') -> 'Any':
+            return (accumulator or 0) + data
+
+        def finalize(self, accumulator: 'Any') -> 'Any':
+            return dict(count=accumulator)
+
+    class CountingAnalyzer(IAnalyzer):
+        map_calls = 0
+
+        def __init__(self, multiplier=1):
+            super().__init__()
+            self.multiplier = multiplier
+
+        def map(self, data: 'Any', item: 'IItem') -> 'Any':
+            type(self).map_calls += 1
+            return self.multiplier
+
+        def reduce(self, all_data: dict) -> 'Any':
+            return sum(all_data.values())
+
     def setUp(self) -> None:
         self.platform = Platform('Test')
         self.platform.cleanup()
@@ -198,3 +231,88 @@ class TestAnalyzeManager(unittest.TestCase):
             actual = [analyzer.working_dir for analyzer in am.analyzers]
             self.assertEqual(actual, expected[force_wd])
 
+    def test_streaming_analyzer(self):
+        test_exp = Experiment()
+        base_sim = Simulation(task=TestTask())
+        for i in range(5):
+            test_exp.simulations.append(copy.deepcopy(base_sim))
+        test_exp.run()
+        self.platform._simulations.set_simulation_status(test_exp.uid, EntityStatus.SUCCEEDED)
+
+        streaming = self.StreamingCountAnalyzer()
+        regular = self.TestAnalyzer()
+        self.assertTrue(streaming.streaming)
+        self.assertFalse(regular.streaming)
+        am = AnalyzeManager(self.platform, ids=[(test_exp.uid, ItemType.EXPERIMENT)], analyzers=[streaming, regular],
+                            executor_type='thread', max_workers=2)
+        # only the regular analyzer should receive mapped data at reduce time
+        reduced = {}
+        original_reduce = am._run_and_wait_for_reducing
+
+        def capture_reduce(executor, results):
+            reduced.update(results)
+            return original_reduce(executor, results)
+
+        am._run_and_wait_for_reducing = capture_reduce
+        self.assertTrue(am.analyze())
+        self.assertEqual(streaming.results, dict(count=5))
+        self.assertEqual(len(reduced), 5)
+        for data in reduced.values():
+            self.assertNotIn(streaming.uid, data)
+            self.assertIn(regular.uid, data)
+
+    def test_map_result_cache(self):
+        test_exp = Experiment()
+        base_sim = Simulation(task=TestTask())
+        for i in range(3):
+            test_exp.simulations.append(copy.deepcopy(base_sim))
+        test_exp.run()
+        self.platform._simulations.set_simulation_status(test_exp.uid, EntityStatus.SUCCEEDED)
+        cache = MapResultCache(directory=tempfile.mkdtemp())
+        self.CountingAnalyzer.map_calls = 0
+
+        def run(analyzer, force_remap=False):
+            am = AnalyzeManager(self.platform, ids=[(test_exp.uid, ItemType.EXPERIMENT)], analyzers=[analyzer],
+                                executor_type='thread', map_cache=cache, force_remap=force_remap)
+            self.assertTrue(am.analyze())
+            return analyzer.results
+
+        self.assertEqual(run(self.CountingAnalyzer()), 3)
+        self.assertEqual(self.CountingAnalyzer.map_calls, 3)
+        # same analyzer configuration: everything comes from the cache
+        self.assertEqual(run(self.CountingAnalyzer()), 3)
+        self.assertEqual(self.CountingAnalyzer.map_calls, 3)
+        # different init arguments invalidate the results
+        self.assertEqual(run(self.CountingAnalyzer(multiplier=2)), 6)
+        self.assertEqual(self.CountingAnalyzer.map_calls, 6)
+        # force remap ignores the cached results
+        self.assertEqual(run(self.CountingAnalyzer(), force_remap=True), 3)
+        self.assertEqual(self.CountingAnalyzer.map_calls, 9)
+        cache.cleanup_cache()
+        shutil.rmtree(cache._cache_directory)
+
+    def test_batch_size(self):
+        am = AnalyzeManager(self.platform, max_workers=2, batch_size=5)
+        self.assertEqual(am._get_batch_size(1000), 5)
+        with self.assertRaises(ValueError):
+            AnalyzeManager(self.platform, batch_size=0)
+        am = AnalyzeManager(self.platform, max_workers=2)
+        am.batch_size = None
+        self.assertEqual(am._get_batch_size(3), 1)
+        self.assertEqual(am._get_batch_size(80), 10)
+        self.assertEqual(am._get_batch_size(100000), 64)
+
+    def test_batched_mapping(self):
+        test_exp = Experiment()
+        base_sim = Simulation(task=TestTask())
+        for i in range(7):
+            test_exp.simulations.append(copy.deepcopy(base_sim))
+        test_exp.run()
+        self.platform._simulations.set_simulation_status(test_exp.uid, EntityStatus.SUCCEEDED)
+        self.CountingAnalyzer.map_calls = 0
+        analyzer = self.CountingAnalyzer()
+        am = AnalyzeManager(self.platform, ids=[(test_exp.uid, ItemType.EXPERIMENT)], analyzers=[analyzer],
+                            executor_type='thread', max_workers=2, batch_size=3)
+        self.assertTrue(am.analyze())
+        self.assertEqual(analyzer.results, 7)
+        self.assertEqual(self.CountingAnalyzer.map_calls, 7)
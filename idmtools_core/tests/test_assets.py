@@ -1,18 +1,26 @@
+import copy
+import hashlib
+import tempfile
+import time
 from pathlib import PurePath
 from unittest.mock import patch, mock_open
 
 import allure
 import json
 import os
+import pickle
 import unittest
 from functools import partial
 import pytest
 from tqdm import tqdm
 from idmtools.assets import Asset, AssetCollection
+from idmtools.assets.asset_collection import MIN_PARALLEL_CHECKSUMS
+from idmtools.assets.checksum_cache import ChecksumCache, MIN_CACHED_FILE_SIZE
 from idmtools.assets.errors import DuplicatedAssetError
 from idmtools.core import FilterMode
 from idmtools.utils.file import content_generator, file_content_to_generator
 from idmtools.utils.filters.asset_filters import asset_in_directory, file_name_is
+from idmtools.utils.hashing import calculate_md5
 from idmtools_test import COMMON_INPUT_PATH
 from idmtools_test.utils.decorators import run_in_temp_dir
 
@@ -353,6 +361,80 @@ class TestAssets(unittest.TestCase):
         ac.add_directory(bd, no_ignore=True)
         self.assertEqual(len(ac), 2)
 
+    @run_in_temp_dir
+    def test_ignore_nested_git(self):
+        bd = PurePath("test_directory")
+        gd = bd.joinpath("sub", ".git")
+        os.makedirs(gd, exist_ok=True)
+        with open(bd.joinpath("sub", "test1.txt"), "w") as fout:
+            fout.write("1")
+        with open(gd.joinpath("test2.txt"), "w") as fout:
+            fout.write("2")
+
+        ac = AssetCollection.from_directory(bd, calculate_checksums=True)
+        self.assertEqual(len(ac), 1)
+        self.assertEqual(ac.assets[0].relative_path, "sub")
+        self.assertEqual(ac.assets[0].checksum, hashlib.md5(b"1").hexdigest())
+
+    def test_asset_index(self):
+        ac = AssetCollection([Asset(filename=f"{i}.txt", content=str(i)) for i in range(10)])
+        self.assertEqual(ac.find_index_of_asset(Asset(filename="5.txt", content="other")), 5)
+        self.assertIsNone(ac.find_index_of_asset(Asset(filename="5.txt", content="other"), deep_compare=True))
+        self.assertRaises(DuplicatedAssetError, ac.add_asset, Asset(filename="5.txt", content="other"))
+
+        # replacing an asset keeps its position
+        replacement = Asset(filename="5.txt", content="other")
+        ac.add_asset(replacement, fail_on_duplicate=False)
+        self.assertEqual(len(ac), 10)
+        self.assertIs(ac.assets[5], replacement)
+
+        # changes made to the list directly are picked up
+        ac.assets.pop(0)
+        self.assertEqual(ac.find_index_of_asset(Asset(filename="5.txt", content="5")), 4)
+        ac.assets = [Asset(filename="a.txt", content="a")]
+        self.assertFalse(ac.has_asset(filename="5.txt"))
+        self.assertTrue(ac.has_asset(filename="a.txt"))
+        ac.assets[0].filename = "b.txt"
+        self.assertTrue(ac.has_asset(filename="b.txt"))
+
+    def test_asset_index_direct_list_changes(self):
+        ac = AssetCollection([Asset(filename=name, content=name) for name in "abc"])
+        self.assertEqual(ac.find_index_of_asset(Asset(filename="a", content="a")), 0)
+
+        # an asset replaced in the list
+        ac.assets[0] = Asset(filename="x", content="9")
+        self.assertEqual(ac.find_index_of_asset(Asset(filename="x", content="9")), 0)
+        self.assertIsNone(ac.find_index_of_asset(Asset(filename="a", content="a")))
+        ac.add_asset(Asset(filename="x", content="9"), fail_on_duplicate=False)
+        self.assertEqual([a.filename for a in ac.assets], ["x", "b", "c"])
+
+        # an asset removed then another appended, keeping the length
+        ac.assets.remove(ac.assets[1])
+        ac.assets.append(Asset(filename="y", content="y"))
+        self.assertIsNone(ac.find_index_of_asset(Asset(filename="b", content="b")))
+        self.assertEqual(ac.find_index_of_asset(Asset(filename="y", content="y")), 2)
+        self.assertRaises(DuplicatedAssetError, ac.add_asset, Asset(filename="y", content="other"))
+
+        # other list operations
+        ac.assets.reverse()
+        self.assertEqual(ac.find_index_of_asset(Asset(filename="x", content="9")), 2)
+        ac.assets.insert(0, Asset(filename="z", content="z"))
+        ac.assets += [Asset(filename="w", content="w")]
+        self.assertEqual(ac.find_index_of_asset(Asset(filename="x", content="9")), 3)
+        self.assertEqual(ac.find_index_of_asset(Asset(filename="w", content="w")), 4)
+        del ac.assets[0]
+        self.assertIsNone(ac.find_index_of_asset(Asset(filename="z", content="z")))
+
+        # a list assigned to the collection is tracked too, and survives a copy
+        ac.assets = [Asset(filename="a", content="a")]
+        ac.assets[0] = Asset(filename="b", content="b")
+        self.assertTrue(ac.has_asset(filename="b"))
+        self.assertFalse(ac.has_asset(filename="a"))
+        ac2 = copy.deepcopy(ac)
+        ac2.assets[0] = Asset(filename="c", content="c")
+        self.assertTrue(ac2.has_asset(filename="c"))
+        self.assertEqual(pickle.loads(pickle.dumps(ac)).assets, ac.assets)
+
     # downloads an asset with absolute path and saves it to destination file
     def test_download_asset_with_absolute_path(self):
         # Initialize the asset object with an absolute path
@@ -528,6 +610,51 @@ class TestAssets(unittest.TestCase):
             assert f.read() == expected_content
         os.remove(os.path.join(os.path.curdir, "example.txt"))
 
+    def test_checksum_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ChecksumCache(directory=os.path.join(tmp, "cache"))
+            filename = os.path.join(tmp, "big.bin")
+            with open(filename, "wb") as f:
+                f.write(os.urandom(MIN_CACHED_FILE_SIZE))
+            expected = hashlib.md5(open(filename, "rb").read()).hexdigest()
+            old = time.time() - 60
+            os.utime(filename, (old, old))
+            with patch('idmtools.assets.checksum_cache.calculate_md5', wraps=calculate_md5) as md5:
+                self.assertEqual(expected, cache.checksum(filename))
+                self.assertEqual(expected, cache.checksum(filename))
+                self.assertEqual(1, md5.call_count)
+                # a modified file is hashed again
+                with open(filename, "r+b") as f:
+                    f.write(b"changed")
+                os.utime(filename, (old + 1, old + 1))
+                self.assertNotEqual(expected, cache.checksum(filename))
+                self.assertEqual(2, md5.call_count)
+                # recently modified files are not cached
+                with open(filename, "r+b") as f:
+                    f.write(b"again")
+                cache.checksum(filename)
+                cache.checksum(filename)
+                self.assertEqual(4, md5.call_count)
+            cache.cleanup_cache()
+
+    def test_calculate_checksums(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for i in range(MIN_PARALLEL_CHECKSUMS * 2):
+                with open(os.path.join(tmp, f"{i}.txt"), "w") as f:
+                    f.write(str(i))
+            ac = AssetCollection.from_directory(tmp)
+            ac.add_asset(Asset(filename="content.txt", content="content"))
+            # checksums stay lazy when the collection is created
+            ac.pre_creation(None)
+            self.assertTrue(all(asset.checksum is None for asset in ac.assets))
+            ac.calculate_checksums()
+            for asset in ac.assets:
+                if asset.absolute_path:
+                    self.assertEqual(hashlib.md5(asset.filename[:-4].encode()).hexdigest(), asset.checksum)
+                else:
+                    # content assets are hashed when needed
+                    self.assertIsNone(asset.checksum)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,42 @@
+import threading
+import time
+import allure
+import pytest
+from unittest import TestCase
+from idmtools.entities.iplatform_ops import utils
+from idmtools.entities.iplatform_ops.utils import batch_create_items
+
+
+@pytest.mark.smoke
+@allure.story("Platforms")
+@allure.suite("idmtools_core")
+class TestBatchCreateItems(TestCase):
+
+    def test_generator_is_consumed_with_backpressure(self):
+        lock = threading.Lock()
+        state = dict(generated=0, created=0, max_ahead=0, kwargs=set())
+
+        def items():
+            for i in range(100):
+                with lock:
+                    state['generated'] += 1
+                    state['max_ahead'] = max(state['max_ahead'], state['generated'] - state['created'])
+                yield i
+
+        def create(item, **kwargs):
+            time.sleep(0.001)
+            with lock:
+                state['created'] += 1
+                state['kwargs'].update(kwargs)
+            return item * 2
+
+        results = batch_create_items(items(), create_func=create, display_progress=False, batch_size=5,
+                                     max_pending_batches=2)
+        self.assertEqual([i * 2 for i in range(100)], results)
+        # two pending batches plus the chunk being built
+        self.assertLessEqual(state['max_ahead'], 3 * 5)
+        self.assertNotIn('max_pending_batches', state['kwargs'])
+
+        self.assertEqual(20, len(utils.BATCH_METRICS))
+        self.assertEqual(list(range(20)), sorted(m.batch for m in utils.BATCH_METRICS))
+        self.assertTrue(all(m.items == 5 and m.run_time > 0 and m.throughput > 0 for m in utils.BATCH_METRICS))
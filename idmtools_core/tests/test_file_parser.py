@@ -0,0 +1,82 @@
+import json
+import allure
+import pytest
+from unittest import TestCase
+from idmtools.analysis.map_worker_entry import _get_mapped_data_for_item
+from idmtools.entities.ianalyzer import IAnalyzer
+from idmtools.utils.file_parser import FileParser
+
+INSET_CHART = json.dumps({
+    "Header": {"Timesteps": 3},
+    "Channels": {
+        "Births": {"Units": "", "Data": [1, 2, 3]},
+        "Deaths": {"Units": "", "Data": [0, 1, 0]},
+        "Infected": {"Units": "", "Data": [0.1, 0.2, 0.3]}
+    }
+}).encode()
+CSV_CONTENT = b"Time, Births, Deaths, Infected\n1, 1, 0, 0.1\n2, 2, 1, 0.2\n3, 3, 0, 0.3\n"
+
+
+class SelectingAnalyzer(IAnalyzer):
+    def __init__(self):
+        super().__init__(filenames=['output\\InsetChart.json', 'output/ReportCsv.csv'],
+                         file_columns={'output\\InsetChart.json': [("Channels", "Births")],
+                                       'output/ReportCsv.csv': {"Time": "int64", "Births": "float64"}})
+
+    def map(self, data, item):
+        return data
+
+    def reduce(self, all_data):
+        return all_data
+
+
+class FakeItem:
+    uid = id = "fake-item"
+    platform = None
+
+
+class FakePlatform:
+    def get_files(self, item, filenames):
+        return {'output/InsetChart.json': INSET_CHART, 'output/ReportCsv.csv': CSV_CONTENT}
+
+
+@pytest.mark.smoke
+@pytest.mark.analysis
+@allure.story("Analyzers")
+@allure.suite("idmtools_core")
+class TestFileParser(TestCase):
+
+    def test_parse_without_selection(self):
+        data = FileParser.parse('InsetChart.json', INSET_CHART)
+        self.assertEqual(json.loads(INSET_CHART), data)
+        df = FileParser.parse('ReportCsv.csv', CSV_CONTENT)
+        self.assertEqual(["Time", "Births", "Deaths", "Infected"], list(df.columns))
+        self.assertEqual(3, len(df))
+
+    def test_json_key_selection(self):
+        data = FileParser.parse('InsetChart.json', INSET_CHART, ["Header", ("Channels", "Births"), ("Channels", "Missing")])
+        self.assertEqual({"Header": {"Timesteps": 3}, "Channels": {"Births": {"Units": "", "Data": [1, 2, 3]}}}, data)
+
+    def test_csv_column_selection(self):
+        df = FileParser.parse('ReportCsv.csv', CSV_CONTENT, ["Time", "Infected"])
+        self.assertEqual(["Time", "Infected"], list(df.columns))
+        self.assertEqual([0.1, 0.2, 0.3], df["Infected"].tolist())
+
+        df = FileParser.parse('ReportCsv.csv', CSV_CONTENT, {"Deaths": "float32"})
+        self.assertEqual(["Deaths"], list(df.columns))
+        self.assertEqual("float32", str(df["Deaths"].dtype))
+
+    def test_csv_initial_space_after_first_rows(self):
+        content = b"Time,Births\n1,1\n2,1\n3, 2\n"
+        for columns in [None, ["Births"]]:
+            df = FileParser.parse('ReportCsv.csv', content, columns)
+            self.assertEqual([1, 1, 2], df["Births"].tolist())
+            self.assertEqual("int64", str(df["Births"].dtype))
+
+    def test_analyzer_file_columns(self):
+        analyzer = SelectingAnalyzer()
+        self.assertIn('output/InsetChart.json', analyzer.file_columns)
+        result = _get_mapped_data_for_item(FakeItem(), [analyzer], FakePlatform())[analyzer.uid]
+        self.assertEqual({"Channels": {"Births": {"Units": "", "Data": [1, 2, 3]}}}, result['output/InsetChart.json'])
+        self.assertEqual(["Time", "Births"], list(result['output/ReportCsv.csv'].columns))
+        self.assertEqual("float64", str(result['output/ReportCsv.csv']["Births"].dtype))
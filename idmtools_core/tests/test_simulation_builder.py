@@ -827,4 +827,24 @@ class TestSimulationBuilder(ITestWithPersistence):
             assert simulation.task.parameters['arg1'].equals(pd.DataFrame(data)['arg1'])
             assert simulation.task.parameters['arg2'].equals(pd.DataFrame(data)['arg2'])
 
-
+    def test_random_access_and_shards(self):
+        self.create_simple_sweep()
+        self.builder.add_sweep_definition(update_parameter_callback, a=[1, 2], b=range(3), c=["x", "y"])
+        combinations = list(self.builder)
+        assert len(combinations) == len(self.builder) == 5 * 3 * 12
+        for i in (0, 7, len(combinations) - 1, -1):
+            assert [f.keywords for f in self.builder[i]] == [f.keywords for f in combinations[i]]
+        with pytest.raises(IndexError):
+            self.builder[len(combinations)]
+
+        sharded = list(itertools.chain(*(self.builder.shard(i, 7) for i in range(7))))
+        assert [[f.keywords for f in c] for c in sharded] == [[f.keywords for f in c] for c in combinations]
+
+    def test_large_sweep_is_lazy(self):
+        self.builder.add_sweep_definition(update_parameter_callback, a=range(1000), b=range(1000), c=range(1000))
+        self.builder.add_sweep_definition(setA, range(10))
+        assert len(self.builder) == 10 ** 10
+        functions = self.builder[123456789]
+        assert functions[0].keywords == dict(a=12, b=345, c=678)
+        assert functions[1].keywords['value'] == 9
+        assert next(iter(self.builder))[0].keywords == dict(a=0, b=0, c=0)
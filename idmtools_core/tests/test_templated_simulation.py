@@ -4,8 +4,10 @@ from unittest import TestCase
 
 import pytest
 
+from idmtools.assets import Asset
 from idmtools.builders import SimulationBuilder
 from idmtools.entities.command_task import CommandTask
+from idmtools.entities.experiment import Experiment
 from idmtools.entities.simulation import Simulation
 from idmtools.entities.templated_simulation import TemplatedSimulations
 
@@ -15,6 +17,12 @@ def print_sweep(simulation: Simulation, value) -> Dict:
     return dict()
 
 
+def set_argument(simulation: Simulation, value) -> Dict:
+    simulation.task.command.add_argument(value)
+    simulation.add_asset(Asset(filename=f'{value}.txt', content=str(value)))
+    return dict(value=value)
+
+
 @pytest.mark.tasks
 @pytest.mark.smoke
 @allure.story("Sweeps")
@@ -36,3 +44,27 @@ class TestTemplatedSimulation(TestCase):
 
         sims = [s for s in ts]
         self.assertEqual(len(sims), total)
+
+    def test_parallel_generation(self):
+        task = CommandTask(command='ls')
+        ts = TemplatedSimulations(base_task=task, generation_workers=2)
+        ts.base_simulation.add_asset(Asset(filename='base.txt', content='base'))
+        builder = SimulationBuilder()
+        builder.add_sweep_definition(set_argument, range(25))
+        ts.add_builder(builder)
+        experiment = Experiment(name='parallel generation')
+        ts.parent = experiment
+
+        sims = list(ts)
+        self.assertEqual(25, len(sims))
+        for i, sim in enumerate(sims):
+            self.assertEqual(dict(value=i), sim.tags)
+            self.assertEqual(f'ls {i}', str(sim.task.command))
+            self.assertEqual(['base.txt', f'{i}.txt'], [a.filename for a in sim.assets])
+            self.assertIs(experiment, sim.parent)
+        self.assertEqual('ls', str(task.command))
+
+        # unpicklable sweep functions are applied in the main process
+        ts.builder = SimulationBuilder()
+        ts.builder.add_sweep_definition(lambda simulation, value: dict(value=value), range(5))
+        self.assertEqual([dict(value=i) for i in range(5)], [s.tags for s in ts])
@@ -2,6 +2,7 @@
 
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
+import copy
 import json
 from dataclasses import dataclass, field, fields
 from functools import partial
@@ -11,6 +12,7 @@ from idmtools.assets import Asset, AssetCollection
 from idmtools.entities.itask import ITask
 from idmtools.entities.simulation import Simulation
 from idmtools.registry.task_specification import TaskSpecification
+from idmtools.utils.collections import CopyOnWriteDict
 if TYPE_CHECKING:  # pragma: no cover
     from idmtools.entities.iplatform import IPlatform
 
@@ -79,13 +81,32 @@ class JSONConfiguredTask(ITask):
             None
         """
         if self.config_file_name is not None:
-            params = {self.envelope: self.parameters} if self.envelope else self.parameters
+            parameters = self.parameters.to_dict() if isinstance(self.parameters, CopyOnWriteDict) else self.parameters
+            params = {self.envelope: parameters} if self.envelope else parameters
             if logger.isEnabledFor(DEBUG):
                 logger.debug('Adding JSON Configured File %s', self.config_file_name)
                 logger.debug(f'Generating {self.config_file_name} as an asset from JSONConfiguredTask')
                 logger.debug('Writing Config %s', json.dumps(params))
             assets.add_or_replace_asset(Asset(filename=self.config_file_name, content=json.dumps(params)))
 
+    def copy_simulation(self, base_simulation: 'Simulation') -> 'Simulation':
+        """
+        Copy a simulation sharing our parameters copy on write instead of deep copying them.
+
+        Sweep callbacks then only copy the parts of the parameters they change.
+
+        Args:
+            base_simulation: Simulation to copy. Its task should be this task
+
+        Returns:
+            New simulation
+        """
+        if base_simulation.task is not self or not isinstance(self.parameters, dict):
+            return super().copy_simulation(base_simulation)
+        # deepcopy returns the memo entry for the parameters instead of copying them
+        memo = {id(self.parameters): CopyOnWriteDict(self.parameters)}
+        return copy.deepcopy(base_simulation, memo)
+
     def set_parameter(self, key: TJSONConfigKeyType, value: TJSONConfigValueType):
         """
         Update a parameter. The type hinting encourages JSON supported types.
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/07efe799-500f-4ec7-8b64-eafb888736e3/Assets/model1.py
\ No newline at end of file
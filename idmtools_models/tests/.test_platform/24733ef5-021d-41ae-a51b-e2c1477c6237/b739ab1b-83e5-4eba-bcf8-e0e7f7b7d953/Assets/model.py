@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/24733ef5-021d-41ae-a51b-e2c1477c6237/Assets/model.py
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/2fb70750-64e1-4db1-ae04-0670a2a0b15a/Assets/model1.py
\ No newline at end of file
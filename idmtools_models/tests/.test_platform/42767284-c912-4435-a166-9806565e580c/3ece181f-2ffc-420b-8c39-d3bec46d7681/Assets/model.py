@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/42767284-c912-4435-a166-9806565e580c/Assets/model.py
\ No newline at end of file
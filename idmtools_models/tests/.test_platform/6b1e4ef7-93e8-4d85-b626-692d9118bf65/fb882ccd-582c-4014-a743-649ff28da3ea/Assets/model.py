@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/6b1e4ef7-93e8-4d85-b626-692d9118bf65/Assets/model.py
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/6d1018ad-f35f-4776-94ba-8a73b42f66f0/Assets/model.py
\ No newline at end of file
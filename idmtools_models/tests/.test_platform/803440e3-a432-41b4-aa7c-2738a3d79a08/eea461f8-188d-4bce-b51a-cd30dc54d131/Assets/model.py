@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/803440e3-a432-41b4-aa7c-2738a3d79a08/Assets/model.py
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/82d96920-3ae4-4631-9c78-7ac4334ddf0a/Assets/model.py
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/8817d45e-f189-4735-8f0b-a252fa986453/Assets/model1.py
\ No newline at end of file
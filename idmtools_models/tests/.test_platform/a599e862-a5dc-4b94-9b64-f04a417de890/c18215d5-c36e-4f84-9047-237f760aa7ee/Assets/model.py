@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/a599e862-a5dc-4b94-9b64-f04a417de890/Assets/model.py
\ No newline at end of file
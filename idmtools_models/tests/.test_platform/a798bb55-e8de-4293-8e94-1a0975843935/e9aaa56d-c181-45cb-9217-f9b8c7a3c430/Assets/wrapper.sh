@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/a798bb55-e8de-4293-8e94-1a0975843935/Assets/wrapper.sh
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/bbc00268-a8ed-4a22-92e4-a6839f3d6329/Assets/wrapper.sh
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/ca8f44f3-2209-440f-be95-3d331e9ded21/Assets/wrapper.sh
\ No newline at end of file
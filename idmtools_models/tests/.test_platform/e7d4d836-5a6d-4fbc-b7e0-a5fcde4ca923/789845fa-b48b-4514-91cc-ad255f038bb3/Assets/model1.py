@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/e7d4d836-5a6d-4fbc-b7e0-a5fcde4ca923/Assets/model1.py
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/f2e7e514-8a4d-461d-b732-595d9648de8e/Assets/model1.py
\ No newline at end of file
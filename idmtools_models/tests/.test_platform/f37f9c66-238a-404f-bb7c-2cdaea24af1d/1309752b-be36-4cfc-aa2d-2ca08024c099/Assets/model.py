@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/f37f9c66-238a-404f-bb7c-2cdaea24af1d/Assets/model.py
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/f5ad4922-e83e-4431-b614-e9cc1ba6c13a/Assets/model.py
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/f70cba11-d9c1-478b-b8f8-d288d97b1457/Assets/model1.py
\ No newline at end of file
@@ -1,4 +1,5 @@
 import allure
+import copy
 import json
 from dataclasses import dataclass, field
 from unittest import TestCase
@@ -7,6 +8,8 @@ from idmtools.core.platform_factory import Platform
 from idmtools.core.task_factory import TaskFactory
 from idmtools.entities import CommandLine
 from idmtools.entities.experiment import Experiment
+from idmtools.entities.templated_simulation import TemplatedSimulations
+from idmtools.utils.collections import CopyOnWriteDict
 from idmtools_models.json_configured_task import JSONConfiguredTask
 
 
@@ -81,6 +84,51 @@ class TestJSONConfiguredTask(TestCase):
         self.assertEqual(str(task.command), 'cat config.json')
         self.assertDictEqual(json.loads(task.transient_assets.assets[0].content), dict(test=values))
 
+    def test_templated_simulations_copy_on_write(self):
+        task = self.get_cat_command_task()
+        task.update_parameters(dict(a=1, nested=dict(b=2, c=[1, 2]), other=dict(d=4)))
+        base = json.loads(json.dumps(task.parameters))
+
+        def update_nested(simulation, value):
+            simulation.task.parameters['nested']['b'] = value
+            simulation.task.parameters['nested']['c'].append(value)
+            return dict(b=value)
+
+        ts = TemplatedSimulations(base_task=task)
+        sims = [ts.new_simulation() for _ in range(3)]
+        for i, sim in enumerate(sims):
+            update_nested(sim, i + 10)
+
+        self.assertEqual(base, task.parameters)
+        for i, sim in enumerate(sims):
+            self.assertIsInstance(sim.task.parameters, CopyOnWriteDict)
+            # untouched values stay shared with the base task
+            self.assertIs(dict.__getitem__(sim.task.parameters, 'other'), task.parameters['other'])
+            sim.task.gather_all_assets()
+            config = json.loads(sim.task.transient_assets.assets[0].content)
+            self.assertEqual(dict(a=1, nested=dict(b=i + 10, c=[1, 2, i + 10]), other=dict(d=4)), config)
+            self.assertEqual(config, sim.task.parameters)
+
+    def test_copy_on_write_copies(self):
+        task = self.get_cat_command_task()
+        task.update_parameters(dict(a=1, nested=dict(b=2, c=[1, 2])))
+        base = json.loads(json.dumps(task.parameters))
+        ts = TemplatedSimulations(base_task=task)
+
+        def update(parameters):
+            parameters['nested']['b'] = 3
+            parameters['nested']['c'].append(3)
+
+        # copies of the parameters made by sweep callbacks do not share their values with the base task
+        update(dict(ts.new_simulation().task.parameters))
+        update({**ts.new_simulation().task.parameters})
+        update(copy.copy(ts.new_simulation().task.parameters))
+        update(ts.new_simulation().task.parameters.copy())
+        (lambda **parameters: update(parameters))(**ts.new_simulation().task.parameters)
+        update(dict(ts.new_simulation().task.parameters.items()))
+        self.assertEqual(base, task.parameters)
+        self.assertEqual(base, json.loads(json.dumps(ts.new_simulation().task.parameters)))
+
     @pytest.mark.timeout(60)
     @pytest.mark.serial
     def test_reload_from_simulation_task(self):
@@ -63,6 +63,8 @@ class CompsPlatformAssetCollectionOperations(IPlatformAssetCollectionOperations)
         Returns:
             COMPSAssetCollection
         """
+        # COMPS identifies files by checksum
+        asset_collection.calculate_checksums()
         ac = COMPSAssetCollection()
         ac_files = set()
         ac_map = dict()
@@ -12,7 +12,7 @@ from dataclasses import dataclass, field
 from COMPS.Data.Simulation import SimulationState
 from functools import partial
 from logging import getLogger, DEBUG
-from typing import Any, List, Dict, Type, Optional, TYPE_CHECKING
+from typing import Any, List, Dict, Type, Optional, Iterable, Union, TYPE_CHECKING
 from uuid import UUID
 from COMPS.Data import Simulation as COMPSSimulation, QueryCriteria, Experiment as COMPSExperiment, SimulationFile, \
     Configuration
@@ -38,6 +38,12 @@ user_logger = getLogger('user')
 # Track commissioning in batches
 COMPS_EXPERIMENT_BATCH_COMMISSION_LOCK = Lock()
 COMPS_EXPERIMENT_BATCH_COMMISSION_TIMESTAMP = 0
+# Number of simulations whose status is fetched in one query
+STATUS_QUERY_PAGE_SIZE = 100
+# Number of status queries running at the same time
+STATUS_QUERY_WORKERS = 4
+# Whether we warned that statuses are queried one by one because pyCOMPS lacks QueryCriteria.where_in
+STATUS_QUERY_FALLBACK_WARNED = False
 
 
 def comps_batch_worker(simulations: List[Simulation], interface: 'CompsPlatformSimulationOperations', executor,
@@ -360,6 +366,70 @@ class CompsPlatformSimulationOperations(IPlatformSimulationOperations):
         s = COMPSSimulation.get(id=simulation.uid, query_criteria=QueryCriteria().select(cols))
         simulation.status = convert_comps_status(s.state)
 
+    def get_statuses(self, simulation_ids: Iterable[Union[str, UUID]]) -> Dict[str, EntityStatus]:
+        """
+        Get the status of many simulations in a few queries.
+
+        Simulations are queried by pages of STATUS_QUERY_PAGE_SIZE ids, loading only their state. Pages are queried on a
+        small thread pool.
+
+        Args:
+            simulation_ids: Ids of the simulations
+
+        Returns:
+            Dict of simulation id (as a string) to status. Simulations not found on COMPS are missing
+        """
+        ids = list(dict.fromkeys(str(sim_id) for sim_id in simulation_ids))
+        pages = [ids[i:i + STATUS_QUERY_PAGE_SIZE] for i in range(0, len(ids), STATUS_QUERY_PAGE_SIZE)]
+        if len(pages) <= 1:
+            results = [self._get_status_page(page) for page in pages]
+        else:
+            with ThreadPoolExecutor(max_workers=min(STATUS_QUERY_WORKERS, len(pages))) as pool:
+                results = list(pool.map(self._get_status_page, pages))
+        return {str(s.id): convert_comps_status(s.state) for page in results for s in page}
+
+    @staticmethod
+    def _get_status_page(simulation_ids: List[str]) -> List[COMPSSimulation]:
+        """
+        Query the state of a page of simulations.
+
+        Args:
+            simulation_ids: Ids of the simulations
+
+        Returns:
+            List of COMPS simulations with their id and state
+        """
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(f"Querying the status of {len(simulation_ids)} simulations")
+        query_criteria = QueryCriteria().select(['id', 'state'])
+        if not hasattr(query_criteria, 'where_in'):
+            # older pyCOMPS, query the simulations one by one
+            global STATUS_QUERY_FALLBACK_WARNED
+            if not STATUS_QUERY_FALLBACK_WARNED:
+                STATUS_QUERY_FALLBACK_WARNED = True
+                logger.warning("This version of pyCOMPS does not support QueryCriteria.where_in, so simulation statuses "
+                               "are queried one simulation at a time. Upgrade pyCOMPS to query them in pages")
+            return [COMPSSimulation.get(id=sim_id, query_criteria=QueryCriteria().select(['id', 'state']))
+                    for sim_id in simulation_ids]
+        return COMPSSimulation.get(query_criteria=query_criteria.where_in('id', simulation_ids))
+
+    def refresh_statuses(self, simulations: List[Simulation]):
+        """
+        Refresh the status of many simulations in a few queries.
+
+        Args:
+            simulations: Simulations to refresh
+
+        Returns:
+            None
+        """
+        simulations = [simulation for simulation in simulations if simulation.uid is not None]
+        statuses = self.get_statuses(simulation.uid for simulation in simulations)
+        for simulation in simulations:
+            status = statuses.get(str(simulation.uid))
+            if status is not None:
+                simulation.status = status
+
     def to_entity(self, simulation: COMPSSimulation, load_task: bool = False, parent: Optional[Experiment] = None,
                   load_parent: bool = False, load_metadata: bool = False, load_cli_from_workorder: bool = False,
                   **kwargs) -> Simulation:
@@ -8,8 +8,10 @@ from uuid import UUID
 from logging import getLogger
 from COMPS.Data import Suite as COMPSSuite, QueryCriteria, Experiment as COMPSExperiment, WorkItem
 from idmtools.core import ItemType
+from idmtools.core.interfaces.entity_container import EntityContainer
 from idmtools.entities import Suite
 from idmtools.entities.iplatform_ops.iplatform_suite_operations import IPlatformSuiteOperations
+from idmtools_platform_comps.comps_operations.simulation_operations import STATUS_QUERY_PAGE_SIZE
 
 if TYPE_CHECKING:  # pragma: no cover
     from idmtools_platform_comps.comps_platform import COMPSPlatform
@@ -106,6 +108,9 @@ class CompsPlatformSuiteOperations(IPlatformSuiteOperations):
         """
         Refresh the status of a suite. On comps, this is done by refreshing all experiments.
 
+        Small experiments cost a query each for only a few simulations: the simulations of those already loaded are
+        refreshed together, in pages. Larger experiments are refreshed one by one.
+
         Args:
             suite: Suite to refresh status of
             **kwargs:
@@ -113,8 +118,16 @@ class CompsPlatformSuiteOperations(IPlatformSuiteOperations):
         Returns:
             None
         """
+        simulations = []
         for experiment in suite.experiments:
-            self.platform.refresh_status(experiment)
+            loaded = experiment.simulations.items
+            if isinstance(loaded, EntityContainer) and 0 < len(loaded) <= STATUS_QUERY_PAGE_SIZE and \
+                    all(sim.uid is not None for sim in loaded):
+                simulations.extend(loaded)
+            else:
+                self.platform.refresh_status(experiment)
+        if simulations:
+            self.platform.refresh_simulation_statuses(simulations)
 
     def to_entity(self, suite: COMPSSuite, children: bool = True, **kwargs) -> Suite:
         """
@@ -5,6 +5,7 @@ Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 # flake8: noqa E402
 import copy
 import logging
+import time
 from uuid import UUID
 
 # fix for comps weird import
@@ -29,11 +30,12 @@ from COMPS.Data import Suite as COMPSSuite
 from COMPS.Data.Simulation import SimulationState
 from COMPS.Data.WorkItem import WorkItemState
 from idmtools.assets.asset_collection import AssetCollection
+from idmtools.core.interfaces.entity_container import EntityContainer
 from idmtools.core.interfaces.ientity import IEntity
 from idmtools.entities.iplatform_default import AnalyzerManagerPlatformDefault, IPlatformDefault
 from idmtools.entities.iworkflow_item import IWorkflowItem
 from dataclasses import dataclass, field
-from typing import Union, Dict, Set
+from typing import Union, Dict, Set, Iterable
 from functools import partial
 from typing import List
 from enum import Enum
@@ -142,6 +144,69 @@ class COMPSPlatform(IPlatform, CacheEnabled):
     def get_asset_collection_link(self, asset_collection: AssetCollection):
         return f"{self.endpoint}/#explore/AssetCollections?filters=Id={asset_collection.uid}"
 
+    def get_simulation_statuses(self, simulation_ids: Iterable[Union[str, UUID]]) -> Dict[str, EntityStatus]:
+        """
+        Get the status of many simulations in a few queries, instead of one query per simulation.
+
+        Args:
+            simulation_ids: Ids of the simulations
+
+        Returns:
+            Dict of simulation id (as a string) to status. Simulations not found on COMPS are missing
+        """
+        return self._simulations.get_statuses(simulation_ids)
+
+    def refresh_simulation_statuses(self, simulations: List[Simulation]):
+        """
+        Refresh the status of many simulations in a few queries, instead of one query per simulation.
+
+        Args:
+            simulations: Simulations to refresh
+
+        Returns:
+            None
+        """
+        self._simulations.refresh_statuses(simulations)
+
+    def refresh_status(self, item: Union[IEntity, List[Simulation]]):
+        """
+        Populate the item with its status.
+
+        Lists of simulations are refreshed in a few queries instead of one query per simulation.
+
+        Args:
+            item: The item or list of simulations to check status for
+        """
+        if isinstance(item, (list, tuple, EntityContainer)):
+            self._simulations.refresh_statuses(list(item))
+        else:
+            super().refresh_status(item)
+
+    def wait_till_done(self, item: Union[IEntity, List[Simulation]], timeout: int = 60 * 60 * 24,
+                       refresh_interval: int = 5, progress: bool = True):
+        """
+        Wait for the item, or all the simulations of a list, to be done.
+
+        Args:
+            item: Experiment/Workitem or list of simulations to wait on
+            refresh_interval: How long to wait between polling.
+            timeout: How long to wait before failing.
+            progress: Should we display progress. Not used for lists of simulations
+
+        Raises:
+            TimeoutError: If a timeout occurs
+        """
+        if not isinstance(item, (list, tuple, EntityContainer)):
+            return super().wait_till_done(item, timeout, refresh_interval, progress)
+        simulations = list(item)
+        start_time = time.time()
+        while time.time() - start_time < timeout:
+            self.refresh_status(simulations)
+            if all(simulation.done for simulation in simulations):
+                return
+            time.sleep(refresh_interval)
+        raise TimeoutError(f"Timeout of {timeout} seconds exceeded")
+
     def get_username(self):
         return Client.auth_manager()._username
 
@@ -3,7 +3,9 @@ idmtools utility.
 
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
-import struct
+import mmap
+import os
+from typing import Iterable, Optional, Union
 import numpy as np
 
 
@@ -25,13 +27,20 @@ class SpatialOutput:
         self.interval = 1
 
     @classmethod
-    def from_bytes(cls, bytes, filtered=False):
+    def from_bytes(cls, bytes, filtered=False, timesteps: Optional[slice] = None, nodes: Optional[Iterable[int]] = None,
+                   copy: bool = True):
         """
         Convert from bytes to class object.
 
+        The buffer is parsed with numpy views and the selection is applied before any copy is made.
+
         Args:
-            bytes: bytes
+            bytes: bytes or any object supporting the buffer protocol(memoryview, mmap)
             filtered: flag for applying filter
+            timesteps: Optional slice of the time steps to keep
+            nodes: Optional node ids to keep. Unknown node ids are ignored
+            copy: Copy node ids and data to writable int64 and float64 arrays. When False, they are read-only uint32 and
+                float32 views over the buffer, which must then stay alive and unchanged while they are in use
         """
         # The header size changes if the file is a filtered one
         headersize = 16 if filtered else 8
@@ -40,29 +49,75 @@ class SpatialOutput:
         so = cls()
 
         # Retrive the number of nodes and number of timesteps
-        so.n_nodes, = struct.unpack('i', bytes[0:4])
-        so.n_tstep, = struct.unpack('i', bytes[4:8])
+        so.n_nodes, so.n_tstep = (int(v) for v in np.frombuffer(bytes, dtype=np.int32, count=2))
 
         # If filtered, retrieve the start and interval
         if filtered:
-            start, = struct.unpack('f', bytes[8:12])
-            interval, = struct.unpack('f', bytes[12:16])
+            start, interval = np.frombuffer(bytes, dtype=np.float32, count=2, offset=8)
             so.start = int(start)
             so.interval = int(interval)
 
         # Get the nodeids
-        so.nodeids = struct.unpack(str(so.n_nodes) + 'I', bytes[headersize:headersize + so.n_nodes * 4])
-        so.nodeids = np.asarray(so.nodeids)
+        so.nodeids = np.frombuffer(bytes, dtype=np.uint32, count=so.n_nodes, offset=headersize)
 
         # Retrieve the data
-        so.data = struct.unpack(str(so.n_nodes * so.n_tstep) + 'f',
-                                bytes[
-                                headersize + so.n_nodes * 4:headersize + so.n_nodes * 4 + so.n_nodes * so.n_tstep * 4])
-        so.data = np.asarray(so.data)
+        so.data = np.frombuffer(bytes, dtype=np.float32, count=so.n_nodes * so.n_tstep,
+                                offset=headersize + so.n_nodes * 4)
         so.data = so.data.reshape(so.n_tstep, so.n_nodes)
 
+        if timesteps is not None or nodes is not None:
+            so.select(timesteps, nodes)
+        if copy:
+            so.nodeids = so.nodeids.astype(np.int64)
+            so.data = so.data.astype(np.float64)
         return so
 
+    @classmethod
+    def from_file(cls, filename: Union[str, os.PathLike], filtered: Optional[bool] = None,
+                  timesteps: Optional[slice] = None, nodes: Optional[Iterable[int]] = None, copy: bool = True):
+        """
+        Load a local spatial report through a memory map so only the pages that are accessed are read.
+
+        Args:
+            filename: Path of the spatial report
+            filtered: flag for applying filter. Defaults to True when the filename contains Filtered
+            timesteps: Optional slice of the time steps to keep
+            nodes: Optional node ids to keep
+            copy: Copy the selected data out of the memory map. When False, the arrays are read-only views over the map
+        """
+        if filtered is None:
+            filtered = 'Filtered' in os.path.basename(filename)
+        with open(filename, 'rb') as f:
+            # views keep a reference to the map so it stays open as long as they are in use
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls.from_bytes(buffer, filtered, timesteps, nodes, copy)
+
+    def select(self, timesteps: Optional[slice] = None, nodes: Optional[Iterable[int]] = None):
+        """
+        Restrict the output to a range of time steps and/or a subset of nodes.
+
+        Slicing time steps keeps data a view when it is one and adjusts start and interval accordingly.
+
+        Args:
+            timesteps: Optional slice of the time steps to keep
+            nodes: Optional node ids to keep. Unknown node ids are ignored
+
+        Returns:
+            self
+        """
+        if timesteps is not None:
+            first, _, step = timesteps.indices(self.n_tstep)
+            self.data = self.data[timesteps]
+            self.n_tstep = self.data.shape[0]
+            self.start += first * self.interval
+            self.interval *= step
+        if nodes is not None:
+            columns = np.flatnonzero(np.isin(self.nodeids, np.fromiter(nodes, dtype=np.int64)))
+            self.nodeids = self.nodeids[columns]
+            self.data = self.data[:, columns]
+            self.n_nodes = len(columns)
+        return self
+
     def to_dict(self):
         """
         Convert to dict.
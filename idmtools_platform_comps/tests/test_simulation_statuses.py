@@ -0,0 +1,137 @@
+import allure
+import unittest
+from functools import partial
+from uuid import uuid4
+from unittest.mock import MagicMock, patch
+from COMPS.Data.Simulation import SimulationState
+from idmtools.core import EntityStatus
+from idmtools.core.interfaces.entity_container import EntityContainer
+from idmtools_platform_comps.comps_operations.simulation_operations import CompsPlatformSimulationOperations, \
+    STATUS_QUERY_PAGE_SIZE
+from idmtools_platform_comps.comps_operations.suite_operations import CompsPlatformSuiteOperations
+from idmtools_platform_comps.comps_platform import COMPSPlatform
+
+SIM_OPS = 'idmtools_platform_comps.comps_operations.simulation_operations'
+
+
+def mock_comps_get(states):
+    """Mock COMPSSimulation.get, answering queries by ids with the states of the simulations."""
+    queried = []
+
+    def get(id=None, query_criteria=None):
+        ids = query_criteria.ids
+        queried.append(list(ids))
+        return [MagicMock(id=sim_id, state=states[sim_id]) for sim_id in ids if sim_id in states]
+
+    return get, queried
+
+
+@allure.story("COMPS")
+@allure.suite("idmtools_platform_comps")
+class TestSimulationStatuses(unittest.TestCase):
+
+    def setUp(self):
+        self.states = {}
+        for i in range(STATUS_QUERY_PAGE_SIZE * 2 + 10):
+            self.states[str(uuid4())] = SimulationState.Succeeded if i % 2 else SimulationState.Running
+
+    @patch(f'{SIM_OPS}.QueryCriteria')
+    @patch(f'{SIM_OPS}.COMPSSimulation')
+    def test_get_statuses(self, mock_comps_simulation, mock_query_criteria):
+        mock_query_criteria.return_value.select.return_value = mock_query_criteria.return_value
+        mock_query_criteria.return_value.where_in.side_effect = lambda field, ids: MagicMock(ids=list(ids))
+        get, queried = mock_comps_get(self.states)
+        mock_comps_simulation.get.side_effect = get
+        ops = CompsPlatformSimulationOperations(platform=MagicMock())
+
+        ids = list(self.states) + [str(uuid4())]
+        statuses = ops.get_statuses(ids)
+
+        # one query per page of ids, selecting only the state
+        self.assertEqual(len(queried), 3)
+        self.assertEqual(sorted(sum(queried, [])), sorted(ids))
+        mock_query_criteria.return_value.select.assert_called_with(['id', 'state'])
+        self.assertEqual(len(statuses), len(self.states))
+        for sim_id, state in self.states.items():
+            expected = EntityStatus.SUCCEEDED if state == SimulationState.Succeeded else EntityStatus.RUNNING
+            self.assertEqual(statuses[sim_id], expected)
+
+        self.assertEqual(ops.get_statuses([]), {})
+
+    @patch(f'{SIM_OPS}.QueryCriteria')
+    @patch(f'{SIM_OPS}.COMPSSimulation')
+    def test_refresh_suite(self, mock_comps_simulation, mock_query_criteria):
+        mock_query_criteria.return_value.select.return_value = mock_query_criteria.return_value
+        mock_query_criteria.return_value.where_in.side_effect = lambda field, ids: MagicMock(ids=list(ids))
+        get, queried = mock_comps_get(self.states)
+        mock_comps_simulation.get.side_effect = get
+        platform = MagicMock()
+        sim_ops = CompsPlatformSimulationOperations(platform=platform)
+        platform.refresh_simulation_statuses.side_effect = sim_ops.refresh_statuses
+
+        # many small experiments are refreshed together
+        ids = list(self.states)
+        experiments = []
+        for i in range(0, STATUS_QUERY_PAGE_SIZE * 2, 20):
+            experiment = MagicMock()
+            experiment.simulations.items = EntityContainer([MagicMock(uid=sim_id, status=None)
+                                                            for sim_id in ids[i:i + 20]])
+            experiments.append(experiment)
+        # simulations not loaded
+        not_loaded = MagicMock()
+        not_loaded.simulations.items = []
+        suite = MagicMock(experiments=experiments + [not_loaded])
+
+        CompsPlatformSuiteOperations(platform=platform).refresh_status(suite)
+
+        self.assertEqual(len(queried), 2)
+        platform.refresh_status.assert_called_once_with(not_loaded)
+        for experiment in experiments:
+            for sim in experiment.simulations.items:
+                self.assertIn(sim.status, (EntityStatus.SUCCEEDED, EntityStatus.RUNNING))
+
+    @patch(f'{SIM_OPS}.STATUS_QUERY_FALLBACK_WARNED', False)
+    @patch(f'{SIM_OPS}.QueryCriteria')
+    @patch(f'{SIM_OPS}.COMPSSimulation')
+    def test_get_statuses_without_where_in(self, mock_comps_simulation, mock_query_criteria):
+        # older pyCOMPS
+        mock_query_criteria.return_value = MagicMock(spec=['select'])
+        mock_query_criteria.return_value.select.return_value = mock_query_criteria.return_value
+        mock_comps_simulation.get.side_effect = lambda id, query_criteria: MagicMock(id=id, state=self.states[id])
+        ops = CompsPlatformSimulationOperations(platform=MagicMock())
+
+        ids = list(self.states)[:5]
+        with self.assertLogs(SIM_OPS, level='WARNING') as logs:
+            statuses = ops.get_statuses(ids)
+        self.assertEqual(1, len(logs.records))
+        self.assertIn('where_in', logs.output[0])
+        self.assertEqual(5, mock_comps_simulation.get.call_count)
+        self.assertEqual(sorted(ids), sorted(statuses))
+
+    @patch(f'{SIM_OPS}.QueryCriteria')
+    @patch(f'{SIM_OPS}.COMPSSimulation')
+    def test_refresh_and_wait_on_simulation_list(self, mock_comps_simulation, mock_query_criteria):
+        mock_query_criteria.return_value.select.return_value = mock_query_criteria.return_value
+        mock_query_criteria.return_value.where_in.side_effect = lambda field, ids: MagicMock(ids=list(ids))
+        get, queried = mock_comps_get(self.states)
+        mock_comps_simulation.get.side_effect = get
+        platform = MagicMock()
+        platform._simulations = CompsPlatformSimulationOperations(platform=platform)
+        platform.refresh_status.side_effect = partial(COMPSPlatform.refresh_status, platform)
+
+        simulations = [MagicMock(uid=sim_id, status=None, done=False) for sim_id in self.states]
+        COMPSPlatform.refresh_status(platform, simulations)
+        self.assertEqual(len(queried), 3)
+        self.assertTrue(all(sim.status is not None for sim in simulations))
+
+        # the running simulations never finish
+        with self.assertRaises(TimeoutError):
+            COMPSPlatform.wait_till_done(platform, simulations, timeout=0.5, refresh_interval=0.1)
+        self.assertTrue(all(len(ids) > 1 for ids in queried))
+        for sim in simulations:
+            sim.done = True
+        COMPSPlatform.wait_till_done(platform, EntityContainer(simulations), refresh_interval=0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
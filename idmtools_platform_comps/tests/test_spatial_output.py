@@ -0,0 +1,59 @@
+import os
+import struct
+import tempfile
+import unittest
+import allure
+import numpy as np
+import pytest
+from idmtools_platform_comps.utils.spatial_output import SpatialOutput
+
+
+def spatial_report_bytes(n_nodes=3, n_tstep=4, filtered=False):
+    header = struct.pack('ii', n_nodes, n_tstep)
+    if filtered:
+        header += struct.pack('ff', 10, 2)
+    nodeids = struct.pack(f'{n_nodes}I', *range(1, n_nodes + 1))
+    return header + nodeids + np.arange(n_nodes * n_tstep, dtype=np.float32).tobytes()
+
+
+@pytest.mark.smoke
+@allure.story("Analyzers")
+@allure.suite("idmtools_platform_comps")
+class TestSpatialOutput(unittest.TestCase):
+
+    def test_from_bytes(self):
+        so = SpatialOutput.from_bytes(spatial_report_bytes())
+        self.assertEqual((3, 4), (so.n_nodes, so.n_tstep))
+        self.assertEqual([1, 2, 3], so.nodeids.tolist())
+        self.assertEqual((4, 3), so.data.shape)
+        self.assertEqual([9, 10, 11], so.data[3].tolist())
+
+    def test_copy(self):
+        buffer = bytearray(spatial_report_bytes())
+        so = SpatialOutput.from_bytes(buffer)
+        self.assertEqual((np.int64, np.float64), (so.nodeids.dtype, so.data.dtype))
+        so.data[0, 0] = 100
+        so.nodeids[0] = 42
+        self.assertEqual(bytes(buffer), spatial_report_bytes())
+
+        view = SpatialOutput.from_bytes(spatial_report_bytes(), copy=False)
+        self.assertEqual((np.uint32, np.float32), (view.nodeids.dtype, view.data.dtype))
+        self.assertFalse(view.data.flags.writeable)
+        self.assertEqual([9, 10, 11], view.data[3].tolist())
+
+    def test_filtered_selection(self):
+        so = SpatialOutput.from_bytes(spatial_report_bytes(filtered=True), True, timesteps=slice(1, None, 2), nodes=[3, 1, 42])
+        self.assertEqual((2, 2), (so.n_nodes, so.n_tstep))
+        self.assertEqual((12, 4), (so.start, so.interval))
+        self.assertEqual([1, 3], so.nodeids.tolist())
+        self.assertEqual([[3, 5], [9, 11]], so.data.tolist())
+
+    def test_from_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'SpatialReport_Filtered_Population.bin')
+            with open(filename, 'wb') as f:
+                f.write(spatial_report_bytes(filtered=True))
+            so = SpatialOutput.from_file(filename)
+            self.assertEqual(10, so.start)
+            self.assertEqual(66, so.data.sum())
+            del so
@@ -14,6 +14,7 @@ from rich.table import Table
 from idmtools.core import ItemType
 from idmtools_platform_container.container_operations.docker_operations import list_running_jobs, find_running_job, \
     is_docker_installed, is_docker_daemon_running, get_working_containers, get_containers, get_container
+from idmtools_platform_container.container_operations.container_agent import run_in_container
 from idmtools_platform_container.utils.job_history import JobHistory
 from idmtools_platform_container.utils.status import summarize_status_files, get_simulation_status
 from idmtools_platform_container.utils.general import convert_byte_size, format_timestamp
@@ -124,11 +125,12 @@ def cancel(item_id: Union[int, str], container_id: str = None):
     job = find_running_job(item_id, container_id)
     if job:
         if job.item_type == ItemType.EXPERIMENT:
-            kill_cmd = f"docker exec {job.container_id} pkill -TERM -g {job.job_id}"
+            kill_cmd = f"pkill -TERM -g {job.job_id}"
         else:
-            kill_cmd = f"docker exec {job.container_id} kill -9 {job.job_id}"
+            kill_cmd = f"kill -9 {job.job_id}"
 
-        result = subprocess.run(kill_cmd, shell=True, stderr=subprocess.PIPE, text=True)  # default: check=False
+        # find_running_job already started the agent of the container
+        result = run_in_container(job.container_id, kill_cmd)
         if result.returncode == 0:
             console.print(f"Successfully killed {job.item_type.name} {job.job_id}")
         else:
@@ -286,14 +288,10 @@ def history(container_id: str = None, limit: int = 10, next: int = 0):
     Returns:
         None
     """
-    data = JobHistory.view_history(container_id)
-
-    start = next * limit
-    end = start + limit
-    data_next = data[start:end]
+    data_next = JobHistory.view_history(container_id, limit=limit, offset=next * limit)
 
     console = Console()
-    console.print(f"There are {len(data)} Experiment cache in history.")
+    console.print(f"There are {JobHistory.count(container_id)} Experiment cache in history.")
     for job in data_next:
         console.print(f"{'':-^100}")
         for k, v in job.items():
@@ -0,0 +1,261 @@
+"""
+Here we implement the agent running commands in a container for ContainerPlatform.
+
+Starting a ``docker exec`` costs hundreds of milliseconds, which adds up when many experiments are submitted, monitored
+or canceled. Instead, a single long-lived ``docker exec -i <container> bash`` process is started per container: the
+agent. It reads one command per line on its stdin, runs it and writes back its stdout, exit code and stderr, framed by
+a marker line.
+
+Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
+"""
+import atexit
+import subprocess
+import threading
+from dataclasses import dataclass
+from typing import List, Dict
+from uuid import uuid4
+from logging import getLogger, DEBUG
+
+logger = getLogger(__name__)
+
+# The agent loop. Each command runs with its stdin closed, so it cannot consume the next commands. Its stdout is
+# followed by a marker line with its exit code, then its stderr and a closing marker line.
+AGENT_SCRIPT = r'''
+marker="$1"
+err="$(mktemp 2>/dev/null || echo /tmp/.idmtools_agent_$$)"
+trap 'rm -f "$err"' EXIT
+while IFS= read -r line; do
+    eval "$line" </dev/null 2>"$err"
+    rc=$?
+    e=''
+    IFS= read -r -d '' e <"$err"
+    printf '\n%s %d\n%s\n%s\n' "$marker" "$rc" "$e" "$marker"
+done
+'''
+
+_agents: Dict[str, 'ContainerAgent'] = {}
+_agents_lock = threading.Lock()
+
+
+class ContainerAgentError(RuntimeError):
+    """The agent stopped or could not be started."""
+
+
+@dataclass
+class AgentResult:
+    """Result of a command run by the agent."""
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+class ContainerAgent:
+    """
+    Long-lived shell running commands in a container.
+    """
+
+    def __init__(self, container_id: str, command: List[str] = None):
+        """
+        Constructor.
+        Args:
+            container_id: container id
+            command: command starting the agent shell. Defaults to docker exec in the container
+        """
+        self.container_id = container_id
+        self._marker = f"__idmtools_agent_{uuid4().hex}__"
+        self._command = command or ['docker', 'exec', '-i', container_id, 'bash', '-c', AGENT_SCRIPT, 'idmtools-agent']
+        self._process = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """
+        Whether the agent process is running.
+        Returns:
+            True/False
+        """
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        """
+        Start the agent process, unless it is running.
+        Returns:
+            None
+        """
+        if self.running:
+            return
+        self._process = subprocess.Popen(self._command + [self._marker], stdin=subprocess.PIPE,
+                                         stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(f"Started agent {self._process.pid} on container {self.container_id}")
+
+    def run(self, command: str) -> AgentResult:
+        """
+        Run a command.
+
+        The agent is restarted once if it stopped before the command could be written, e.g. because the container was
+        restarted. Once the command is written, it is never sent again: the agent may have run it already.
+        Args:
+            command: bash command, on a single line
+        Returns:
+            AgentResult
+        Raises:
+            ValueError: If the command spans several lines
+            ContainerAgentError: If the agent cannot run the command or stopped before answering
+        """
+        if '\n' in command or '\r' in command:
+            raise ValueError(f"The agent only runs single line commands: {command!r}")
+        with self._lock:
+            if self._process is not None and not self.running:
+                logger.debug(f"Agent on container {self.container_id} stopped, restarting it")
+            self.start()
+            try:
+                self._write(command)
+            except ContainerAgentError:
+                # the agent may have died since it was last used
+                self._kill()
+                self.start()
+                self._write(command)
+            try:
+                return self._read_result()
+            except ContainerAgentError:
+                # the next command starts a new agent
+                self._kill()
+                raise
+
+    def close(self) -> None:
+        """
+        Stop the agent. Background processes it started keep running.
+        Returns:
+            None
+        """
+        with self._lock:
+            if self._process is None:
+                return
+            try:
+                self._process.stdin.close()
+                self._process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._kill()
+            self._close_pipes()
+            self._process = None
+
+    def _write(self, command: str) -> None:
+        """
+        Write a command to the agent.
+        Args:
+            command: bash command
+        Returns:
+            None
+        """
+        try:
+            self._process.stdin.write(f"{command}\n".encode())
+            self._process.stdin.flush()
+        except OSError as e:
+            raise ContainerAgentError(f"Agent on container {self.container_id} stopped: {e}")
+
+    def _read_result(self) -> AgentResult:
+        """
+        Read the result of a command.
+        Returns:
+            AgentResult
+        """
+        marker = self._marker.encode()
+        stdout = []
+        while True:
+            line = self._readline()
+            if line.startswith(marker + b' '):
+                returncode = int(line[len(marker):].strip())
+                break
+            stdout.append(line)
+        stderr = []
+        while True:
+            line = self._readline()
+            if line.rstrip(b'\n') == marker:
+                break
+            stderr.append(line)
+        # the agent writes a newline before and after the command output
+        return AgentResult(returncode=returncode, stdout=b''.join(stdout)[:-1].decode(errors='replace'),
+                           stderr=b''.join(stderr)[:-1].decode(errors='replace'))
+
+    def _readline(self) -> bytes:
+        """
+        Read a line from the agent.
+        Returns:
+            line, with its newline
+        """
+        line = self._process.stdout.readline()
+        if not line:
+            error = ''
+            if self._process.poll() is not None:
+                error = self._process.stderr.read().decode(errors='replace').strip()
+            raise ContainerAgentError(f"Agent on container {self.container_id} stopped. {error}".strip())
+        return line
+
+    def _kill(self) -> None:
+        """
+        Kill the agent process.
+        Returns:
+            None
+        """
+        if self._process is None:
+            return
+        if self._process.poll() is None:
+            self._process.kill()
+            self._process.wait()
+        self._close_pipes()
+
+    def _close_pipes(self) -> None:
+        """
+        Close the pipes of the agent process.
+        Returns:
+            None
+        """
+        for pipe in (self._process.stdin, self._process.stdout, self._process.stderr):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+
+def get_container_agent(container_id: str) -> ContainerAgent:
+    """
+    Get the agent of a container, shared by all operations of this process.
+    Args:
+        container_id: container id
+    Returns:
+        ContainerAgent
+    """
+    with _agents_lock:
+        agent = _agents.get(container_id)
+        if agent is None:
+            agent = _agents[container_id] = ContainerAgent(container_id)
+        return agent
+
+
+def run_in_container(container_id: str, command: str) -> AgentResult:
+    """
+    Run a command in a container through its agent.
+    Args:
+        container_id: container id
+        command: bash command
+    Returns:
+        AgentResult
+    """
+    return get_container_agent(container_id).run(command)
+
+
+def close_container_agents() -> None:
+    """
+    Stop the agents of all containers.
+    Returns:
+        None
+    """
+    with _agents_lock:
+        agents = list(_agents.values())
+        _agents.clear()
+    for agent in agents:
+        agent.close()
+
+
+atexit.register(close_container_agents)
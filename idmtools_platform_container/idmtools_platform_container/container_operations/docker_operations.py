@@ -3,14 +3,17 @@ Here we implement the ContainerPlatform docker operations.
 
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
+import os
 import docker
 import platform as sys_platform
 import subprocess
+import threading
 from dataclasses import dataclass
 from typing import List, Dict, NoReturn, Any, Union
 from idmtools.core import ItemType
 from idmtools_platform_container.utils.general import normalize_path, parse_iso8601
 from idmtools_platform_container.utils.job_history import JobHistory
+from idmtools_platform_container.container_operations.container_agent import run_in_container, ContainerAgentError
 from docker.models.containers import Container
 from docker.errors import NotFound as ErrorNotFound
 from docker.errors import APIError as DockerAPIError
@@ -22,6 +25,45 @@ user_logger = getLogger('user')
 # Only consider the containers that can be restarted
 CONTAINER_STATUS = ['exited', 'running', 'paused']
 
+_docker_client = None
+_docker_client_pid = None
+_docker_client_lock = threading.Lock()
+
+
+def get_docker_client() -> docker.DockerClient:
+    """
+    Get the Docker client shared by all operations of this process.
+
+    Creating a client reads the environment and opens a new connection pool to the daemon, so it is created once per
+    process and reused.
+    Returns:
+        Docker client
+    """
+    global _docker_client, _docker_client_pid
+    with _docker_client_lock:
+        # a forked process must not share the connections of its parent
+        if _docker_client is None or _docker_client_pid != os.getpid():
+            _docker_client = docker.from_env()
+            _docker_client_pid = os.getpid()
+        return _docker_client
+
+
+def reset_docker_client() -> NoReturn:
+    """
+    Close the shared Docker client. The next operation creates a new one.
+    Returns:
+        No return
+    """
+    global _docker_client, _docker_client_pid
+    with _docker_client_lock:
+        if _docker_client is not None and _docker_client_pid == os.getpid():
+            try:
+                _docker_client.close()
+            except Exception as ex:
+                logger.debug(f"Error closing Docker client: {ex}")
+        _docker_client = None
+        _docker_client_pid = None
+
 
 def validate_container_running(platform, **kwargs) -> str:
     """
@@ -118,7 +160,7 @@ def get_container(container_id) -> Any:
     Returns:
         container object
     """
-    client = docker.from_env()
+    client = get_docker_client()
 
     try:
         # Retrieve the container
@@ -261,7 +303,7 @@ def get_containers(include_stopped: bool = False) -> Dict:
     Returns:
         dict of containers
     """
-    client = docker.from_env()
+    client = get_docker_client()
     container_found = {}
     # Get all containers
     all_containers = client.containers.list(all=include_stopped)
@@ -348,7 +390,7 @@ def is_docker_daemon_running() -> bool:
         True/False
     """
     try:
-        client = docker.from_env()
+        client = get_docker_client()
         client.ping()
         if logger.isEnabledFor(DEBUG):
             logger.debug("Docker daemon is running.")
@@ -375,7 +417,7 @@ def check_local_image(image_name: str) -> bool:
     Returns:
         True/False
     """
-    client = docker.from_env()
+    client = get_docker_client()
     for image in client.images.list():
         if image_name in image.tags:
             return True
@@ -400,7 +442,7 @@ def pull_docker_image(image_name, tag='latest') -> bool:
     # Pull the image
     user_logger.info(f'Pulling image {full_image_name} ...')
     try:
-        client = docker.from_env()
+        client = get_docker_client()
         client.images.pull(f'{full_image_name}')
         if logger.isEnabledFor(DEBUG):
             logger.debug(f'Successfully pulled {full_image_name}')
@@ -514,8 +556,12 @@ def list_running_jobs(container_id: str, limit: int = None) -> List[Job]:
     Returns:
         list of running jobs
     """
-    command = f'docker exec {container_id} bash -c "({PS_QUERY})"'
-    result = subprocess.run(command, shell=True, check=False, capture_output=True, text=True)
+    try:
+        result = run_in_container(container_id, f"({PS_QUERY})")
+    except ContainerAgentError as ex:
+        logger.error(str(ex))
+        user_logger.error(f"Failed to list the running jobs on container {container_id}")
+        exit(-1)
 
     running_jobs = []
     if result.returncode == 0:
@@ -4,9 +4,8 @@ Here we implement the ContainerPlatform object.
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
 import os
-import docker
+import shlex
 import platform
-import subprocess
 from uuid import uuid4
 from docker.models.containers import Container
 from typing import Union, NoReturn, List, Dict
@@ -17,7 +16,8 @@ from idmtools.entities.experiment import Experiment
 from idmtools.entities.simulation import Simulation
 from idmtools_platform_container.container_operations.docker_operations import validate_container_running, \
     find_container_by_image, compare_mounts, find_running_job, get_container, CONTAINER_STATUS, restart_container, \
-    is_docker_installed, is_docker_daemon_running
+    is_docker_installed, is_docker_daemon_running, get_docker_client
+from idmtools_platform_container.container_operations.container_agent import run_in_container
 from idmtools_platform_container.platform_operations.simulation_operations import ContainerPlatformSimulationOperations
 from idmtools_platform_container.utils.general import map_container_path
 from idmtools_platform_container.utils.job_history import JobHistory
@@ -189,7 +189,7 @@ class ContainerPlatform(FilePlatform):
             container id
         """
         # Create a Docker client
-        client = docker.from_env()
+        client = get_docker_client()
         volumes = self.build_binding_volumes()
 
         # Run the container
@@ -217,17 +217,10 @@ class ContainerPlatform(FilePlatform):
         directory = self.get_container_directory(experiment)
 
         try:
-            commands = [
-                f"cd {directory}",
-                r"sed -i 's/\r//g' batch.sh;sed -i 's/\r//g' run_simulation.sh"
-            ]
-
-            # Constructing the overall command
-            full_command = ["docker", "exec", self.container_id, "bash", "-c", ";".join(commands)]
-            # Execute the command
-            subprocess.run(full_command, stdout=subprocess.PIPE)
-        except subprocess.CalledProcessError as e:
-            user_logger.warning(f"Failed to convert script: {e}")
+            command = f"cd {shlex.quote(str(directory))} && sed -i 's/\\r//g' batch.sh run_simulation.sh"
+            result = run_in_container(self.container_id, command)
+            if result.returncode != 0:
+                user_logger.warning(f"Failed to convert script: {result.stderr.strip()}")
         except Exception as ex:
             user_logger.warning(f"Failed to convert script to Linux: {ex}")
 
@@ -246,22 +239,15 @@ class ContainerPlatform(FilePlatform):
             logger.debug(f"container_id: {self.container_id}")
 
         try:
-            # Commands to change directory and run the script
-            command = f'exec -a "EXPERIMENT:{experiment.id}" bash batch.sh &'
-            # Constructing the overall command
-            full_command = ["docker", "exec", "--workdir", directory, self.container_id, "bash", "-c", command]
-
-            # Execute the command using Popen for handling background processes
-            subprocess.Popen(full_command)
-
-            # Optionally, you can wait for a short period to ensure the command starts
-            # process = subprocess.Popen(full_command)
-            # process.wait(timeout=5)
+            # Run batch.sh in the background, in its own process group (its job id), detached from the agent
+            command = f'cd {shlex.quote(str(directory))} && (set -m; exec -a "EXPERIMENT:{experiment.id}" bash ' \
+                      f'batch.sh </dev/null >>stdout.txt 2>>stderr.txt &)'
+            result = run_in_container(self.container_id, command)
+            if result.returncode != 0:
+                user_logger.error(f"Submit experiment {experiment.id} failed: {result.stderr.strip()}")
+                exit(-1)
 
             logger.debug(f"Submit experiment {experiment.id} successfully")
-        except subprocess.TimeoutExpired:
-            user_logger.error(f"Submit experiment {experiment.id} timed out")
-            exit(-1)
         except Exception as ex:
             user_logger.error(f"Submit experiment {experiment.id} encounter Error: {ex}")
             exit(-1)
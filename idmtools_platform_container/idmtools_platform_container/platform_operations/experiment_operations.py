@@ -4,13 +4,13 @@ Here we implement the ContainerPlatform experiment operations.
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
 import shutil
-import subprocess
 from dataclasses import dataclass
 from typing import NoReturn, Dict
 from idmtools.core import ItemType
 from idmtools.entities.experiment import Experiment
 from idmtools_platform_file.platform_operations.experiment_operations import FilePlatformExperimentOperations
 from idmtools_platform_container.container_operations.docker_operations import find_running_job
+from idmtools_platform_container.container_operations.container_agent import run_in_container
 from logging import getLogger
 
 logger = getLogger(__name__)
@@ -64,8 +64,7 @@ class ContainerPlatformExperimentOperations(FilePlatformExperimentOperations):
         if job:
             logger.debug(
                 f"{job.item_type.name} {experiment_id} is running on Container {job.container_id}.")
-            kill_cmd = f"docker exec {job.container_id} pkill -TERM -g {job.job_id}"
-            result = subprocess.run(kill_cmd, shell=True, stderr=subprocess.PIPE, text=True)
+            result = run_in_container(job.container_id, f"pkill -TERM -g {job.job_id}")
             if result.returncode == 0:
                 logger.debug(f"Successfully killed {job.item_type.name} {experiment_id}")
             else:
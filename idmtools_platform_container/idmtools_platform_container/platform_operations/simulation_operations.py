@@ -3,12 +3,12 @@ Here we implement the ContainerPlatform simulation operations.
 
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
-import subprocess
 from dataclasses import dataclass
 from typing import NoReturn, Dict
 from idmtools.core import ItemType
 from idmtools_platform_file.platform_operations.simulation_operations import FilePlatformSimulationOperations
 from idmtools_platform_container.container_operations.docker_operations import find_running_job
+from idmtools_platform_container.container_operations.container_agent import run_in_container
 from logging import getLogger
 
 logger = getLogger(__name__)
@@ -36,8 +36,7 @@ class ContainerPlatformSimulationOperations(FilePlatformSimulationOperations):
                 pass
             user_logger.debug(
                 f"{job.item_type.name} {sim_id} is running on Container {job.container_id}.")
-            kill_cmd = f"docker exec {job.container_id} kill -9 {job.job_id}"
-            result = subprocess.run(kill_cmd, shell=True, stderr=subprocess.PIPE, text=True)
+            result = run_in_container(job.container_id, f"kill -9 {job.job_id}")
             if result.returncode == 0:
                 print(f"Successfully killed {job.item_type.name} {sim_id}")
             else:
@@ -1,12 +1,16 @@
 """
 idmtools ContainerPlatform JobHistory Utility.
 
+Jobs are stored in a diskcache keyed by experiment id. A SQLite index next to it holds the fields jobs are looked up by
+(container, suite, creation time) and the directories of the simulations, so history commands do not load every job.
+
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
+import sqlite3
 import diskcache
 from pathlib import Path
 from datetime import datetime
-from typing import NoReturn, Dict, Tuple, List
+from typing import NoReturn, Dict, Tuple, List, Optional
 from idmtools.core import ItemType
 from idmtools.entities.experiment import Experiment
 from idmtools_platform_container.utils.general import normalize_path, is_valid_uuid
@@ -16,6 +20,30 @@ logger = getLogger(__name__)
 user_logger = getLogger('user')
 
 JOB_HISTORY_DIR = "idmtools_container_history"
+JOB_HISTORY_INDEX = "history_index.db"
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Length of a simulation id, at the end of its directory name
+UUID_LENGTH = 36
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    experiment_id TEXT PRIMARY KEY,
+    container TEXT,
+    suite_id TEXT,
+    experiment_dir TEXT,
+    created TEXT,
+    simulations_indexed INTEGER DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS jobs_container ON jobs (container);
+CREATE INDEX IF NOT EXISTS jobs_suite ON jobs (suite_id);
+CREATE INDEX IF NOT EXISTS jobs_created ON jobs (created);
+CREATE TABLE IF NOT EXISTS simulations (
+    simulation_id TEXT PRIMARY KEY,
+    experiment_id TEXT,
+    simulation_dir TEXT
+);
+CREATE INDEX IF NOT EXISTS simulations_experiment ON simulations (experiment_id);
+"""
 
 
 def initialize():
@@ -39,6 +67,7 @@ def initialize():
 class JobHistory:
     """Job History Utility for idmtools Container Platform."""
     history = None
+    index = None
     history_path = Path.home().joinpath(".idmtools").joinpath(JOB_HISTORY_DIR)
 
     @classmethod
@@ -47,6 +76,76 @@ class JobHistory:
         if cls.history is None:
             cls.history_path.mkdir(parents=True, exist_ok=True)
             cls.history = diskcache.Cache(str(cls.history_path))
+        if cls.index is None:
+            cls.index = sqlite3.connect(str(cls.history_path.joinpath(JOB_HISTORY_INDEX)), timeout=60,
+                                        isolation_level=None, check_same_thread=False)
+            cls.index.executescript(INDEX_SCHEMA)
+            cls._sync_index()
+
+    @classmethod
+    def _sync_index(cls) -> NoReturn:
+        """
+        Bring the index in sync with the history.
+
+        Jobs added to the history without updating the index (e.g. by an older idmtools) are indexed and jobs deleted
+        from it are removed. Only the keys of the history are read, unless jobs are missing from the index.
+        Returns:
+            NoReturn
+        """
+        cache = cls.history
+        keys = set(cache.iterkeys())
+        indexed = {row[0] for row in cls.index.execute("SELECT experiment_id FROM jobs")}
+        if keys == indexed:
+            return
+        with cls.index:
+            cls.index.execute("BEGIN IMMEDIATE")
+            cls._unindex_jobs(list(indexed - keys))
+            for key in keys - indexed:
+                # an expired job is kept in the index until it is removed from the history
+                cls._index_job(cache.get(key) or {'EXPERIMENT_ID': key})
+        logger.debug(f"Indexed {len(keys - indexed)} jobs and removed {len(indexed - keys)} jobs from the index.")
+
+    @classmethod
+    def _index_job(cls, value: Dict) -> NoReturn:
+        """
+        Add or replace a job in the index. Its simulations are indexed again when they are looked up.
+        Args:
+            value: job data
+        Returns:
+            NoReturn
+        """
+        cls.index.execute("DELETE FROM simulations WHERE experiment_id = ?", (value['EXPERIMENT_ID'],))
+        cls.index.execute("INSERT OR REPLACE INTO jobs (experiment_id, container, suite_id, experiment_dir, created) "
+                          "VALUES (?, ?, ?, ?, ?)",
+                          (value['EXPERIMENT_ID'], value.get('CONTAINER'), value.get('SUITE_ID'),
+                           value.get('EXPERIMENT_DIR'), value.get('CREATED')))
+
+    @classmethod
+    def _unindex_jobs(cls, exp_ids: List[str]) -> NoReturn:
+        """
+        Remove jobs from the index.
+        Args:
+            exp_ids: Experiment IDs
+        Returns:
+            NoReturn
+        """
+        for exp_id in exp_ids:
+            cls.index.execute("DELETE FROM jobs WHERE experiment_id = ?", (exp_id,))
+            cls.index.execute("DELETE FROM simulations WHERE experiment_id = ?", (exp_id,))
+
+    @classmethod
+    @initialize()
+    def rebuild_index(cls) -> NoReturn:
+        """
+        Rebuild the index from the jobs in the history.
+        Returns:
+            NoReturn
+        """
+        with cls.index:
+            cls.index.execute("BEGIN IMMEDIATE")
+            cls.index.execute("DELETE FROM jobs")
+            cls.index.execute("DELETE FROM simulations")
+        cls._sync_index()
 
     @classmethod
     @initialize()
@@ -68,7 +167,7 @@ class JobHistory:
             platform = get_current_platform()
 
         # Get current datetime
-        current_datetime = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        current_datetime = datetime.now().strftime(DATETIME_FORMAT)
         new_item = {"JOB_DIRECTORY": normalize_path(job_dir),
                     "SUITE_ID": experiment.parent_id,
                     "EXPERIMENT_DIR": normalize_path(platform.get_directory(experiment)),
@@ -76,7 +175,10 @@ class JobHistory:
                     "EXPERIMENT_ID": experiment.id,
                     "CONTAINER": container_id,
                     "CREATED": current_datetime}
-        cache.set(experiment.id, new_item)
+        with cls.index:
+            cls.index.execute("BEGIN IMMEDIATE")
+            cache.set(experiment.id, new_item)
+            cls._index_job(new_item)
         cache.close()
 
     @classmethod
@@ -95,13 +197,13 @@ class JobHistory:
         cache = cls.history
         value, expire_time = cache.get(exp_id, expire_time=True)
         if value is None:
-            if exp_id in list(cache):
+            if cls.index.execute("SELECT 1 FROM jobs WHERE experiment_id = ?", (exp_id,)).fetchone():
                 logger.debug(f"Item {exp_id} expired.")
             else:
                 logger.debug(f"Item {exp_id} not found.")
         else:
             local_expire_time = datetime.fromtimestamp(expire_time) if expire_time else None
-            expire_time_str = local_expire_time.strftime('%Y-%m-%d %H:%M:%S') if local_expire_time else None
+            expire_time_str = local_expire_time.strftime(DATETIME_FORMAT) if local_expire_time else None
             if expire_time_str:
                 value['EXPIRE'] = expire_time_str
 
@@ -146,58 +248,119 @@ class JobHistory:
         if item:
             return Path(item['EXPERIMENT_DIR']), ItemType.EXPERIMENT
 
-        for key in cache:
-            value = cache.get(key)
-            suite_id = value.get('SUITE_ID')
-            exp_dir = value.get('EXPERIMENT_DIR')
+        # Consider Suite case
+        row = cls.index.execute("SELECT experiment_dir FROM jobs WHERE suite_id = ? LIMIT 1", (item_id,)).fetchone()
+        if row:
+            return Path(row[0]).parent, ItemType.SUITE
+
+        # Consider Simulation case
+        sim_dir = cls.get_simulation_dir(item_id)
+        if sim_dir is not None:
+            return sim_dir, ItemType.SIMULATION
 
-            # Consider Suite case
-            if suite_id == item_id:
-                return Path(exp_dir).parent, ItemType.SUITE
+        return None
 
-            # Consider Simulation case
-            pattern = f'*{item_id}/metadata.json'
-            for meta_file in Path(exp_dir).glob(pattern=pattern):
-                sim_dir = meta_file.parent
-                return sim_dir, ItemType.SIMULATION
+    @classmethod
+    @initialize()
+    def get_simulation_dir(cls, sim_id: str) -> Optional[Path]:
+        """
+        Get the directory of a simulation from history.
 
+        The simulation directories of an experiment are indexed the first time a simulation is looked up in it.
+        Args:
+            sim_id: Simulation ID
+        Returns:
+            simulation directory or None if not found
+        """
+        row = cls.index.execute("SELECT experiment_id, simulation_dir FROM simulations WHERE simulation_id = ?",
+                                (sim_id,)).fetchone()
+        if row:
+            if Path(row[1]).exists():
+                return Path(row[1])
+            # The experiment was moved or deleted, index its simulations again
+            cls.index.execute("DELETE FROM simulations WHERE experiment_id = ?", (row[0],))
+            cls.index.execute("UPDATE jobs SET simulations_indexed = 0 WHERE experiment_id = ?", (row[0],))
+
+        rows = cls.index.execute("SELECT experiment_id, experiment_dir FROM jobs WHERE simulations_indexed = 0 "
+                                 "ORDER BY created DESC").fetchall()
+        for exp_id, exp_dir in rows:
+            sim_dirs = cls._index_simulations(exp_id, exp_dir)
+            if sim_id in sim_dirs:
+                return sim_dirs[sim_id]
         return None
 
+    @classmethod
+    def _index_simulations(cls, exp_id: str, exp_dir: str) -> Dict[str, Path]:
+        """
+        Index the simulation directories of an experiment.
+        Args:
+            exp_id: Experiment ID
+            exp_dir: experiment directory
+        Returns:
+            dict of simulation id to simulation directory
+        """
+        sim_dirs = {}
+        if exp_dir:
+            for meta_file in Path(exp_dir).glob('*/metadata.json'):
+                # simulation directories are named after the simulation, ending with its id
+                sim_id = meta_file.parent.name[-UUID_LENGTH:]
+                if is_valid_uuid(sim_id):
+                    sim_dirs[sim_id] = meta_file.parent
+        with cls.index:
+            cls.index.execute("BEGIN IMMEDIATE")
+            cls.index.execute("DELETE FROM simulations WHERE experiment_id = ?", (exp_id,))
+            cls.index.executemany("INSERT OR REPLACE INTO simulations (simulation_id, experiment_id, simulation_dir) "
+                                  "VALUES (?, ?, ?)", [(sid, exp_id, str(d)) for sid, d in sim_dirs.items()])
+            cls.index.execute("UPDATE jobs SET simulations_indexed = 1 WHERE experiment_id = ?", (exp_id,))
+        return sim_dirs
+
+    @classmethod
+    def _job_ids(cls, container_id: str = None, limit: int = None, offset: int = 0) -> List[str]:
+        """
+        Experiment IDs in history, most recent first.
+        Args:
+            container_id: Container ID
+            limit: maximum number of ids
+            offset: number of ids skipped
+        Returns:
+            list of Experiment IDs
+        """
+        query = "SELECT experiment_id FROM jobs"
+        params = []
+        if container_id is not None:
+            query += " WHERE container = ?"
+            params.append(container_id)
+        query += " ORDER BY created DESC LIMIT ? OFFSET ?"
+        params.extend([-1 if limit is None else limit, offset])
+        return [row[0] for row in cls.index.execute(query, params)]
+
     @classmethod
     @initialize()
-    def view_history(cls, container_id: str = None) -> List:
+    def view_history(cls, container_id: str = None, limit: int = None, offset: int = 0) -> List:
         """
         View job history.
         Args:
             container_id: Container ID
+            limit: maximum number of jobs to view
+            offset: number of most recent jobs to skip
         Returns:
-            list of job data
+            list of job data, most recent first
         """
         cache = cls.history
         data = []
-        for key in cache:
+        for key in cls._job_ids(container_id, limit, offset):
             value, expire_time = cache.get(key, expire_time=True)
             if value is None:
-                if key in list(cache):
-                    user_logger.info(f"Item {key} expired.")
-                else:
-                    user_logger.info(f"Item {key} not found.")
+                user_logger.info(f"Item {key} expired.")
                 continue
 
             local_expire_time = datetime.fromtimestamp(expire_time) if expire_time else None
-            expire_time_str = local_expire_time.strftime('%Y-%m-%d %H:%M:%S') if local_expire_time else None
+            expire_time_str = local_expire_time.strftime(DATETIME_FORMAT) if local_expire_time else None
             if expire_time_str:
                 value['EXPIRE'] = expire_time_str
+            data.append(value)
 
-            if container_id is not None:
-                if value['CONTAINER'] == container_id:
-                    data.append(value)
-            else:
-                data.append(value)
-
-        # Sort data by datetime
-        sorted_data = sorted(data, key=lambda x: datetime.strptime(x["CREATED"], "%Y-%m-%d %H:%M:%S"), reverse=True)
-        return sorted_data
+        return data
 
     @classmethod
     @initialize()
@@ -210,7 +373,10 @@ class JobHistory:
             NoReturn
         """
         cache = cls.history
-        cache.pop(exp_id)
+        with cls.index:
+            cls.index.execute("BEGIN IMMEDIATE")
+            cache.pop(exp_id)
+            cls._unindex_jobs([exp_id])
         cache.close()
 
     @classmethod
@@ -218,20 +384,32 @@ class JobHistory:
     def expire_history(cls, dt: str = None) -> NoReturn:
         """
         Expire job history based on the input expiration time.
+
+        Jobs whose expiration time passed are removed. When a datetime is given, jobs created before it are removed too.
         Args:
             dt: datetime to expire (format like "2024-07-30 15:12:05")
         Returns:
             NoReturn
         """
-        from datetime import datetime
         # Parse the datetime string into a datetime object
-        dt_object = datetime.strptime(dt, '%Y-%m-%d %H:%M:%S') if dt else None
+        dt_object = datetime.strptime(dt, DATETIME_FORMAT) if dt else None
 
         # Convert the datetime object to a timestamp (seconds since epoch)
         timestamp = dt_object.timestamp() if dt_object else None
 
         cache = cls.history
-        cache.expire(now=timestamp)
+        with cls.index:
+            cls.index.execute("BEGIN IMMEDIATE")
+            cache.expire(now=timestamp)
+            expired = []
+            if dt_object:
+                expired = [row[0] for row in cls.index.execute("SELECT experiment_id FROM jobs WHERE created < ?",
+                                                               (dt_object.strftime(DATETIME_FORMAT),))]
+                for key in expired:
+                    cache.delete(key)
+            # jobs removed by the cache expiration
+            expired.extend(key for key in cls._job_ids() if key not in cache)
+            cls._unindex_jobs(expired)
         cache.close()
 
     @classmethod
@@ -245,16 +423,17 @@ class JobHistory:
             NoReturn
         """
         cache = cls.history
-        if container_id is None:
-            cache.clear()
-        else:
-            for key in cache:
-                value = cache.get(key)
-                if value is None:
-                    user_logger.info(f"key {key} not found in cache")
-                    continue
-                if value['CONTAINER'] == container_id:
+        with cls.index:
+            cls.index.execute("BEGIN IMMEDIATE")
+            if container_id is None:
+                cache.clear()
+                cls.index.execute("DELETE FROM jobs")
+                cls.index.execute("DELETE FROM simulations")
+            else:
+                keys = cls._job_ids(container_id)
+                for key in keys:
                     cache.delete(key)
+                cls._unindex_jobs(keys)
 
         cache.close()
 
@@ -271,14 +450,14 @@ class JobHistory:
         """Sync job history."""
         cache = cls.history
 
-        for key in cache:
-            values = cache.get(key)
-            exp_dir = values.get('EXPERIMENT_DIR')
-
-            root = Path(exp_dir)
-            if not root.exists():
+        rows = cls.index.execute("SELECT experiment_id, experiment_dir FROM jobs").fetchall()
+        removed = [key for key, exp_dir in rows if not exp_dir or not Path(exp_dir).exists()]
+        with cls.index:
+            cls.index.execute("BEGIN IMMEDIATE")
+            for key in removed:
                 cache.pop(key)
                 logger.debug(f"Remove job {key} from job history.")
+            cls._unindex_jobs(removed)
 
         cache.close()
 
@@ -295,19 +474,15 @@ class JobHistory:
         if container_id is None:
             return len(cls.history)
         else:
-            jobs = [key for key in cls.history if cls.history[key]['CONTAINER'] == container_id]
-            return len(jobs)
+            return cls.index.execute("SELECT COUNT(*) FROM jobs WHERE container = ?", (container_id,)).fetchone()[0]
 
     @classmethod
     @initialize()
     def container_history(cls) -> List:
         """List of job containers."""
-        cache = cls.history
         data = {}
 
-        for key in cache:
-            value = cache[key]
-            container_id = value['CONTAINER']
+        for container_id, key in cls.index.execute("SELECT container, experiment_id FROM jobs"):
             if container_id not in data:
                 data[container_id] = []
             data[container_id].append(key)
@@ -318,10 +493,9 @@ class JobHistory:
     @initialize()
     def verify_container(cls, container_id) -> bool:
         """Verify history container."""
-        cache = cls.history
-
-        for key in cache:
-            value = cache[key]
-            if container_id.startswith(value['CONTAINER']):
-                return True
-        return False
+        if not container_id:
+            return False
+        # The history holds short container ids: look up every prefix of the given id
+        prefixes = [container_id[:i] for i in range(1, len(container_id) + 1)]
+        query = f"SELECT 1 FROM jobs WHERE container IN ({','.join('?' * len(prefixes))}) LIMIT 1"
+        return cls.index.execute(query, prefixes).fetchone() is not None
@@ -0,0 +1,100 @@
+import os
+import platform
+import tempfile
+import unittest
+import pytest
+from unittest.mock import patch
+from idmtools_platform_container.container_operations.container_agent import ContainerAgent, ContainerAgentError, \
+    AGENT_SCRIPT, get_container_agent, close_container_agents
+
+
+def local_agent() -> ContainerAgent:
+    # the agent loop runs in a local bash instead of docker exec
+    return ContainerAgent('local', command=['bash', '-c', AGENT_SCRIPT, 'idmtools-agent'])
+
+
+@pytest.mark.skipif(platform.system() == 'Windows', reason="The agent runs in bash")
+class TestContainerAgent(unittest.TestCase):
+
+    def setUp(self):
+        self.agent = local_agent()
+
+    def tearDown(self):
+        self.agent.close()
+
+    def test_run(self):
+        result = self.agent.run("echo hello; echo world")
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout, "hello\nworld\n")
+        self.assertEqual(result.stderr, "")
+
+        result = self.agent.run("printf 'no newline'; echo error >&2; exit_code() { return 3; }; exit_code")
+        self.assertEqual(result.returncode, 3)
+        self.assertEqual(result.stdout, "no newline")
+        self.assertEqual(result.stderr, "error\n")
+
+        # commands do not consume the stdin of the agent
+        result = self.agent.run("cat")
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout, "")
+
+    def test_same_shell(self):
+        pid = self.agent.run("echo $$").stdout.strip()
+        results = [self.agent.run(command) for command in ["echo $$", "false", "(echo a; echo b) | grep -c .",
+                                                           "cd /tmp && pwd"]]
+        self.assertEqual([r.returncode for r in results], [0, 1, 0, 0])
+        # all commands run in the same shell
+        self.assertEqual(results[0].stdout.strip(), pid)
+        self.assertEqual(results[2].stdout, "2\n")
+        self.assertEqual(results[3].stdout, "/tmp\n")
+        self.assertEqual(self.agent.run("pwd").stdout, "/tmp\n")
+
+    def test_background_job(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = os.path.join(tmp, 'out.txt')
+            # a background job in its own process group, like a submitted experiment
+            result = self.agent.run(f"(set -m; exec -a \"EXPERIMENT:test\" bash -c 'ps -o pgid= $$ > {out}' </dev/null &)")
+            self.assertEqual(result.returncode, 0)
+            self.assertEqual(self.agent.run(f"while [ ! -s {out} ]; do sleep 0.1; done; cat {out}").returncode, 0)
+            with open(out) as f:
+                pgid = f.read().strip()
+            agent_pgid = self.agent.run("ps -o pgid= $$").stdout.strip()
+            self.assertNotEqual(pgid, agent_pgid)
+
+    def test_restart(self):
+        self.assertEqual(self.agent.run("echo first").stdout, "first\n")
+        # the agent stops, e.g. the container restarted
+        self.agent._process.kill()
+        self.agent._process.wait()
+        self.assertFalse(self.agent.running)
+        self.assertEqual(self.agent.run("echo second").stdout, "second\n")
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            self.agent.run("echo a\necho b")
+        agent = ContainerAgent('local', command=['bash', '-c', 'exit 1', 'idmtools-agent'])
+        with self.assertRaises(ContainerAgentError):
+            agent.run("echo hello")
+        agent.close()
+
+    def test_no_resend_after_write(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = os.path.join(tmp, 'out.txt')
+            # the agent stops while the command runs
+            with self.assertRaises(ContainerAgentError):
+                self.agent.run(f"echo ran >> {out}; kill -9 $$")
+            self.assertFalse(self.agent.running)
+            with open(out) as f:
+                self.assertEqual(f.read(), "ran\n")
+            # the next command starts a new agent
+            self.assertEqual(self.agent.run("echo next").stdout, "next\n")
+
+    @patch('idmtools_platform_container.container_operations.container_agent.ContainerAgent.close')
+    def test_get_container_agent(self, mock_close):
+        agent = get_container_agent('container1')
+        self.assertIs(get_container_agent('container1'), agent)
+        self.assertIsNot(get_container_agent('container2'), agent)
+        close_container_agents()
+        self.assertEqual(mock_close.call_count, 2)
+        self.assertIsNot(get_container_agent('container1'), agent)
+        close_container_agents()
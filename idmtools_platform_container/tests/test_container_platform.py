@@ -1,10 +1,8 @@
 import os
 import shutil
-import subprocess
 import sys
 import tempfile
 import unittest
-from subprocess import CalledProcessError
 from docker.models.containers import Container
 from unittest.mock import patch, MagicMock
 import pytest
@@ -14,12 +12,18 @@ from idmtools.entities import Suite
 from idmtools.entities.experiment import Experiment
 from idmtools.entities.simulation import Simulation
 from idmtools_platform_container.container_platform import ContainerPlatform
+from idmtools_platform_container.container_operations.container_agent import AgentResult
+from idmtools_platform_container.container_operations.docker_operations import reset_docker_client
 
 
 @pytest.mark.serial
 class TestContainerPlatform(unittest.TestCase):
     def setUp(self):
         IdmConfigParser.clear_instance()
+        reset_docker_client()
+
+    def tearDown(self):
+        reset_docker_client()
     # @classmethod
     # def tearDownClass(cls) -> None:
     #     try:
@@ -139,37 +143,37 @@ class TestContainerPlatform(unittest.TestCase):
         self.assertEqual(container_id, mock_container.short_id)
 
     @patch('idmtools_platform_container.container_platform.user_logger.warning')
-    @patch('subprocess.run')  # Mock subprocess.run
+    @patch('idmtools_platform_container.container_platform.run_in_container')
     @patch.object(ContainerPlatform, 'get_container_directory')
     @patch.object(ContainerPlatform, '__post_init__', lambda x: None)
     def test_convert_scripts_to_linux(self, mock_get_container_directory, mock_run, mock_logger_warning):
         with self.subTest("test_convert_scripts_to_linux_success"):
             mock_get_container_directory.return_value = "/mocked/directory"
+            mock_run.return_value = AgentResult(returncode=0, stdout='', stderr='')
             platform = ContainerPlatform(job_directory="DEST")
             experiment = MagicMock()  # Mock the Experiment object
 
             platform.convert_scripts_to_linux(experiment)
 
-            # Verify subprocess.run was called correctly
+            # Verify the command was run by the container agent
             mock_run.assert_called_once_with(
-                ["docker", "exec", platform.container_id, "bash", "-c",
-                 "cd /mocked/directory;sed -i 's/\\r//g' batch.sh;sed -i 's/\\r//g' run_simulation.sh"],
-                stdout=subprocess.PIPE
+                platform.container_id,
+                "cd /mocked/directory && sed -i 's/\\r//g' batch.sh run_simulation.sh"
             )
+            mock_logger_warning.assert_not_called()
         with self.subTest("test_convert_scripts_to_linux_with_exception"):
             mock_run.side_effect = Exception('General exception')
             mock_experiment = MagicMock(spec=Experiment)
             platform = ContainerPlatform(job_directory="DEST")
             platform.convert_scripts_to_linux(mock_experiment)
             mock_logger_warning.assert_called_with("Failed to convert script to Linux: General exception")
-            # self.assertTrue('Failed to convert script to Linux: General exception', mock_logger.method_calls[0].args[0])
-        with self.subTest("test_convert_scripts_to_linux_with_CalledProcessError"):
-            mock_run.side_effect = CalledProcessError(1, 'command')
+        with self.subTest("test_convert_scripts_to_linux_with_command_failure"):
+            mock_run.side_effect = None
+            mock_run.return_value = AgentResult(returncode=2, stdout='', stderr='sed: can\'t read batch.sh\n')
             mock_experiment = MagicMock(spec=Experiment)
             platform = ContainerPlatform(job_directory="DEST")
             platform.convert_scripts_to_linux(mock_experiment)
-            mock_logger_warning.assert_called_with(
-                "Failed to convert script: Command 'command' returned non-zero exit status 1.")
+            mock_logger_warning.assert_called_with("Failed to convert script: sed: can't read batch.sh")
 
     def test_get_mounts(self):
         container_platform = ContainerPlatform(job_directory="DEST", user_mounts={"src1": "dest1", "src2": "dest2"})
@@ -11,13 +11,19 @@ from idmtools_platform_container.container_operations.docker_operations import s
     validate_container_running, \
     get_container, pull_docker_image, is_docker_daemon_running, check_local_image, find_container_by_image, \
     is_docker_installed, compare_mounts, compare_container_mount, sort_containers_by_start, get_containers, \
-    get_working_containers, list_running_jobs, Job, find_running_job
+    get_working_containers, list_running_jobs, Job, find_running_job, reset_docker_client, get_docker_client
 from idmtools_platform_container.container_platform import ContainerPlatform
 from idmtools_platform_container.utils.general import normalize_path, is_valid_uuid
 
 
 @pytest.mark.serial
 class TestDockerOperations(unittest.TestCase):
+    def setUp(self):
+        # the Docker client is shared, make sure each test creates its own (mocked) client
+        reset_docker_client()
+
+    def tearDown(self):
+        reset_docker_client()
 
     @patch('idmtools_platform_container.container_operations.docker_operations.is_docker_installed')
     @patch('idmtools_platform_container.container_operations.docker_operations.is_docker_daemon_running')
@@ -149,6 +155,7 @@ class TestDockerOperations(unittest.TestCase):
         with self.subTest("test_with_container_id_no_exists"):
             mock_client = MagicMock()
             mock_docker.return_value = mock_client
+            reset_docker_client()  # create the new mocked client
             mock_container = MagicMock()
             mock_client.containers.get.return_value = mock_container
             mock_client.containers.get.side_effect = NotFound('Not found')
@@ -164,6 +171,7 @@ class TestDockerOperations(unittest.TestCase):
         with self.subTest("test_with_container_api_error"):
             mock_client = MagicMock()
             mock_docker.return_value = mock_client
+            reset_docker_client()  # create the new mocked client
             mock_container = MagicMock()
             mock_client.containers.get.return_value = mock_container
             mock_client.containers.get.side_effect = APIError('API error')
@@ -273,7 +281,8 @@ class TestDockerOperations(unittest.TestCase):
             mock_client.ping.side_effect = docker.errors.DockerException('Error')
             mock_docker.return_value = mock_client
             result = is_docker_daemon_running()
-            self.assertEqual(mock_docker.call_count, 2)
+            # the client is created once and reused
+            self.assertEqual(mock_docker.call_count, 1)
             self.assertEqual(mock_client.ping.call_count, 2)
             self.assertFalse(result)
             mock_logger.debug.assert_called_with(f"Error checking Docker daemon: {mock_client.ping.side_effect}")
@@ -284,7 +293,7 @@ class TestDockerOperations(unittest.TestCase):
             mock_client.ping.side_effect = docker.errors.APIError('Error')
             mock_docker.return_value = mock_client
             result = is_docker_daemon_running()
-            self.assertEqual(mock_docker.call_count, 3)
+            self.assertEqual(mock_docker.call_count, 1)
             self.assertEqual(mock_client.ping.call_count, 3)
             self.assertFalse(result)
             mock_logger.debug.assert_called_with(f"Docker daemon is not running: {mock_client.ping.side_effect}")
@@ -337,6 +346,7 @@ class TestDockerOperations(unittest.TestCase):
         with self.subTest("test_with_pull_image_failure"):
             mock_client = MagicMock()
             mock_docker.return_value = mock_client
+            reset_docker_client()  # create the new mocked client
             mock_client.images.pull.side_effect = docker.errors.APIError('Error pulling image')
             result = pull_docker_image('test_image')
             self.assertFalse(result)
@@ -696,12 +706,12 @@ class TestDockerOperations(unittest.TestCase):
             mock_logger.error.assert_called_with(f"Container {mock_container.short_id} not found in History.")
 
 
-    @patch('subprocess.run')
+    @patch('idmtools_platform_container.container_operations.docker_operations.run_in_container')
     @patch('idmtools_platform_container.container_operations.docker_operations.user_logger')
     def test_list_running_jobs(self, mock_user_logger, mock_run):
         mock_container = MagicMock(spec=Container, short_id="container_id")
         with self.subTest("test_list_running_jobs_success"):
-            # Mock subprocess.run to simulate docker command output
+            # Mock the container agent to simulate docker command output
             mock_output = "PID  PPID  PGID CMD\n1234 5678 1234 01:23 EXPERIMENT:exp_id batch.sh\n2345 6789 2345 01:24 SIMULATION:sim_id"
             mock_run.return_value = MagicMock(returncode=0, stdout=mock_output)
             result = list_running_jobs("123")
@@ -710,24 +720,24 @@ class TestDockerOperations(unittest.TestCase):
             self.assertEqual(result[0].item_id, "exp_id")
             self.assertEqual(result[1].item_id, "sim_id")
         with self.subTest("test_list_running_jobs_no_jobs"):
-            # Mock subprocess.run to simulate no jobs running
+            # Mock the container agent to simulate no jobs running
             mock_run.return_value = MagicMock(returncode=0, stdout="")
             result = list_running_jobs(mock_container.short_id)
             self.assertEqual(len(result), 0)    # No jobs running
         with self.subTest("test_list_running_jobs_failure"):
-            # Mock subprocess.run to simulate returncode=1
+            # Mock the container agent to simulate returncode=1
             mock_run.return_value = MagicMock(returncode=1)
             result = list_running_jobs(mock_container.short_id)
             self.assertEqual(len(result), 0)
         with self.subTest("test_list_running_jobs_failure"):
-            # Mock subprocess.run to simulate a failure
+            # Mock the container agent to simulate a failure
             mock_run.return_value = MagicMock(returncode=-1, stderr="Error")
             with self.assertRaises(SystemExit) as ex:
                 result = list_running_jobs(mock_container.short_id)
                 self.assertEqual(len(result), 0)
                 mock_user_logger.error.assert_called_with("Command failed with return code -1")
         with self.subTest("test_list_running_jobs_with_limit"):
-            # Mock subprocess.run to simulate docker command output
+            # Mock the container agent to simulate docker command output
             mock_output = "PID  PPID  PGID STIME CMD\n1234 5678 1234 01:23 EXPERIMENT:exp_id\n2345 6789 2345 01:23 SIMULATION:sim_id"
             mock_run.return_value = MagicMock(returncode=0, stdout=mock_output)
             result = list_running_jobs(mock_container.short_id, limit=1) # expected only get exp_id back
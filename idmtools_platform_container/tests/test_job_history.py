@@ -0,0 +1,123 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from uuid import uuid4
+from unittest.mock import MagicMock
+from idmtools.core import ItemType
+from idmtools_platform_container.utils.job_history import JobHistory
+
+
+class TestJobHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.job_dir = Path(self.tmp, 'jobs')
+        self._history_path = JobHistory.history_path
+        self.reset(Path(self.tmp, 'history'))
+
+    def tearDown(self):
+        self.reset(self._history_path)
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    @staticmethod
+    def reset(history_path):
+        if JobHistory.history is not None:
+            JobHistory.history.close()
+        if JobHistory.index is not None:
+            JobHistory.index.close()
+        JobHistory.history = None
+        JobHistory.index = None
+        JobHistory.history_path = history_path
+
+    def save(self, container_id, suite_id=None, sims=0, created=None):
+        experiment = MagicMock(id=str(uuid4()), parent_id=suite_id or str(uuid4()))
+        experiment.name = 'exp'
+        exp_dir = self.job_dir.joinpath(experiment.parent_id, f"exp_{experiment.id}")
+        platform = MagicMock()
+        platform.get_directory.return_value = exp_dir
+        sim_ids = [str(uuid4()) for _ in range(sims)]
+        for sim_id in sim_ids:
+            exp_dir.joinpath(f"sim_{sim_id}").mkdir(parents=True)
+            exp_dir.joinpath(f"sim_{sim_id}", "metadata.json").write_text(json.dumps({'id': sim_id}))
+        exp_dir.mkdir(parents=True, exist_ok=True)
+        JobHistory.save_job(str(self.job_dir), container_id, experiment, platform)
+        if created:
+            # Back-date the job
+            job = JobHistory.history.get(experiment.id)
+            job['CREATED'] = created
+            JobHistory.history.set(experiment.id, job)
+            JobHistory.rebuild_index()
+        return experiment.id, exp_dir, sim_ids
+
+    def test_lookups(self):
+        suite_id = str(uuid4())
+        exp1, exp_dir1, sims1 = self.save('container1', suite_id=suite_id, sims=3, created='2024-01-01 00:00:00')
+        exp2, exp_dir2, sims2 = self.save('container2', suite_id=suite_id, sims=2)
+        exp3, _, _ = self.save('container1')
+
+        self.assertEqual(JobHistory.count(), 3)
+        self.assertEqual(JobHistory.count('container1'), 2)
+        self.assertEqual(JobHistory.count('container3'), 0)
+        self.assertEqual({k: sorted(v) for k, v in JobHistory.container_history().items()},
+                         {'container1': sorted([exp1, exp3]), 'container2': [exp2]})
+        self.assertTrue(JobHistory.verify_container('container1'))
+        self.assertTrue(JobHistory.verify_container('container1_full_id'))
+        self.assertFalse(JobHistory.verify_container('container'))
+        self.assertFalse(JobHistory.verify_container(''))
+
+        # most recent first, with paging
+        self.assertEqual([j['EXPERIMENT_ID'] for j in JobHistory.view_history()][-1], exp1)
+        self.assertEqual([j['EXPERIMENT_ID'] for j in JobHistory.view_history('container1')], [exp3, exp1])
+        self.assertEqual([j['EXPERIMENT_ID'] for j in JobHistory.view_history('container1', limit=1, offset=1)],
+                         [exp1])
+
+        self.assertEqual(JobHistory.get_item_path(exp2), (exp_dir2, ItemType.EXPERIMENT))
+        self.assertEqual(JobHistory.get_item_path(suite_id), (exp_dir1.parent, ItemType.SUITE))
+        self.assertEqual(JobHistory.get_item_path(sims1[1]), (exp_dir1.joinpath(f"sim_{sims1[1]}"), ItemType.SIMULATION))
+        self.assertIsNone(JobHistory.get_item_path(str(uuid4())))
+        # the simulations of the experiment are cached
+        self.assertEqual(JobHistory.index.execute("SELECT COUNT(*) FROM simulations").fetchone()[0], 5)
+        self.assertEqual(JobHistory.get_simulation_dir(sims2[0]), exp_dir2.joinpath(f"sim_{sims2[0]}"))
+
+        # a moved simulation is looked up again
+        moved = exp_dir2.joinpath(f"moved_{sims2[0]}")
+        os.rename(exp_dir2.joinpath(f"sim_{sims2[0]}"), moved)
+        self.assertEqual(JobHistory.get_simulation_dir(sims2[0]), moved)
+
+    def test_expire_and_clear(self):
+        old, _, _ = self.save('container1', sims=1, created='2024-01-01 00:00:00')
+        new, new_dir, _ = self.save('container1')
+        other, _, _ = self.save('container2')
+
+        JobHistory.expire_history('2024-06-01 00:00:00')
+        self.assertIsNone(JobHistory.get_job(old))
+        self.assertEqual(JobHistory.count(), 2)
+        self.assertEqual(JobHistory.count('container1'), 1)
+
+        shutil.rmtree(new_dir)
+        JobHistory.sync()
+        self.assertIsNone(JobHistory.get_job(new))
+        self.assertEqual(JobHistory.count('container1'), 0)
+
+        JobHistory.clear('container2')
+        self.assertEqual(JobHistory.count(), 0)
+        self.assertEqual(JobHistory.view_history(), [])
+
+    def test_rebuild_index(self):
+        exp1, _, _ = self.save('container1')
+        # the history is changed without the index, e.g. by an older idmtools
+        JobHistory.history.delete(exp1)
+        exp2 = str(uuid4())
+        JobHistory.history.set(exp2, {'EXPERIMENT_ID': exp2, 'CONTAINER': 'container2', 'SUITE_ID': None,
+                                      'EXPERIMENT_DIR': self.tmp, 'CREATED': '2024-01-01 00:00:00'})
+        self.reset(JobHistory.history_path)
+        self.assertEqual(JobHistory.count('container1'), 0)
+        self.assertEqual(JobHistory.count('container2'), 1)
+        self.assertEqual([j['EXPERIMENT_ID'] for j in JobHistory.view_history()], [exp2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,8 +7,9 @@ import os
 import shlex
 import shutil
 from pathlib import Path
+from contextlib import contextmanager
 from logging import getLogger
-from typing import Union, List
+from typing import Union, List, Dict
 from dataclasses import dataclass, field
 from idmtools import IdmConfigParser
 from idmtools.core import ItemType, EntityStatus, TRUTHY_VALUES
@@ -18,14 +19,15 @@ from idmtools.entities.experiment import Experiment
 from idmtools.entities.simulation import Simulation
 from idmtools.entities.iplatform import IPlatform, ITEM_TYPE_TO_OBJECT_INTERFACE
 from idmtools.utils.decorators import check_symlink_capabilities
-from idmtools_platform_file.platform_operations.utils import FILE_MAPS, clean_experiment_name, \
-    validate_file_path_length, validate_folder_files_path_length
+from idmtools_platform_file.platform_operations.utils import clean_experiment_name, validate_file_path_length, \
+    validate_folder_files_path_length, read_job_status, read_job_statuses, to_entity_status, get_simulation_directories
 from idmtools_platform_file.assets import generate_script, generate_simulation_script
 from idmtools_platform_file.platform_operations.asset_collection_operations import FilePlatformAssetCollectionOperations
 from idmtools_platform_file.platform_operations.experiment_operations import FilePlatformExperimentOperations
 from idmtools_platform_file.platform_operations.json_metadata_operations import JSONMetadataOperations
 from idmtools_platform_file.platform_operations.simulation_operations import FilePlatformSimulationOperations
 from idmtools_platform_file.platform_operations.suite_operations import FilePlatformSuiteOperations
+from idmtools_platform_file.platform_operations.status_tracker import SimulationStatusTracker
 from idmtools_platform_file.platform_operations.utils import FileExperiment, FileSimulation, FileSuite
 
 logger = getLogger(__name__)
@@ -52,12 +54,25 @@ class FilePlatform(IPlatform):
     modules: list = field(default_factory=list, metadata=dict(help="Modules to load"))
     # extra packages to install
     extra_packages: list = field(default_factory=list, metadata=dict(help="Extra packages to install"))
+    # track simulation status with file system events while waiting
+    status_watcher: bool = field(default=True, metadata=dict(
+        help="Watch simulation status files while waiting on items (requires watchdog). Unfinished simulations are "
+             "polled otherwise"))
+    status_poll_interval: float = field(default=None, metadata=dict(
+        help="While watching status files, how often (in seconds) unfinished simulations are polled anyway. By default "
+             "they are only polled every 20 refresh intervals as a safety net; set it to the refresh interval on file "
+             "systems which do not report writes, such as NFS"))
+    # stage assets through a content-addressed store
+    asset_store: bool = field(default=False, metadata=dict(
+        help="Stage assets through a content-addressed store in the job directory. Identical assets are written once "
+             "and hard linked into experiment and simulation directories, where they are read-only"))
 
     _suites: FilePlatformSuiteOperations = field(**op_defaults, repr=False, init=False)
     _experiments: FilePlatformExperimentOperations = field(**op_defaults, repr=False, init=False)
     _simulations: FilePlatformSimulationOperations = field(**op_defaults, repr=False, init=False)
     _assets: FilePlatformAssetCollectionOperations = field(**op_defaults, repr=False, init=False)
     _metas: JSONMetadataOperations = field(**op_defaults, repr=False, init=False)
+    _status_tracker: SimulationStatusTracker = field(**op_defaults, repr=False, init=False)
 
     def __post_init__(self):
         self.__init_interfaces()
@@ -128,6 +143,9 @@ class FilePlatform(IPlatform):
         Returns:
             item file directory
         """
+        entry = self._metas.index.get(str(item_id), item_type)
+        if entry is not None:
+            return Path(entry['dir'])
         metas = self._metas.filter(item_type=item_type, property_filter={'id': str(item_id)})
         if len(metas) > 0:
             return Path(metas[0]['dir'])
@@ -294,17 +312,71 @@ class FilePlatform(IPlatform):
         sim_dir = self.get_directory_by_id(sim_id, ItemType.SIMULATION)
 
         # Check process status
-        job_status_path = sim_dir.joinpath('job_status.txt')
-        if job_status_path.exists():
-            status = open(job_status_path).read().strip()
-            if status in ['100', '0', '-1']:
-                status = FILE_MAPS[status]
-            else:
-                status = FILE_MAPS['100']  # To be safe
-        else:
-            status = FILE_MAPS['None']
+        return to_entity_status(read_job_status(sim_dir))
+
+    def get_simulation_statuses(self, experiment: Union[Experiment, FileExperiment], **kwargs) -> Dict[str, EntityStatus]:
+        """
+        Retrieve the status of all simulations of an experiment at once.
+
+        The experiment directory is scanned once and the job status files are read concurrently instead of looking up
+        the directory of each simulation by id. Simulations without a directory are not included in the result.
+        Args:
+            experiment: idmtools Experiment or FileExperiment
+            kwargs: keyword arguments used to expand functionality
+        Returns:
+            Dict of simulation id as key and EntityStatus as value
+        """
+        sim_dirs = self._get_simulation_dirs(experiment)
+        statuses = read_job_statuses(sim_dirs, max_workers=kwargs.get('max_workers'))
+        return {sim_id: to_entity_status(status) for sim_id, status in statuses.items()}
+
+    def _get_simulation_dirs(self, experiment: Union[Experiment, FileExperiment]) -> Dict[str, str]:
+        """
+        Map the simulations of an experiment to their directory with a single scan of the experiment directory.
+        Args:
+            experiment: idmtools Experiment or FileExperiment
+        Returns:
+            Dict of simulation id as key and simulation directory as value
+        """
+        exp_dir = self.get_directory_by_id(experiment.id, ItemType.EXPERIMENT)
+        dir_paths = get_simulation_directories(exp_dir)
+        if isinstance(experiment, Experiment):
+            sim_dirs = {}
+            for sim in experiment.simulations:
+                dir_name = self.entity_display_name(sim)
+                if dir_name in dir_paths:
+                    sim_dirs[sim.id] = dir_paths[dir_name]
+            return sim_dirs
+        # simulation directories are named <id> or <name>_<id>
+        return {dir_name.rsplit('_', 1)[-1]: path for dir_name, path in dir_paths.items()}
+
+    @contextmanager
+    def _track_status(self, item: Union[Suite, Experiment]):
+        """
+        Track the status of the simulations of an item in memory while waiting on it.
 
-        return status
+        Refreshing the status of a tracked experiment only reads the status files which changed and waiting between two
+        refreshes returns as soon as a status file is written.
+        Args:
+            item: Suite or Experiment being waited on
+        Returns:
+            Context manager yielding the function which waits for a status change
+        """
+        if isinstance(item, Experiment):
+            experiments = [item]
+        elif isinstance(item, Suite):
+            experiments = list(item.experiments)
+        else:
+            experiments = []
+        tracker = SimulationStatusTracker(self, use_watcher=self.status_watcher, poll_interval=self.status_poll_interval)
+        try:
+            for experiment in experiments:
+                tracker.add_experiment(experiment)
+            self._status_tracker = tracker
+            yield tracker.wait
+        finally:
+            self._status_tracker = None
+            tracker.stop()
 
     def entity_display_name(self, item: Union[Suite, Experiment, Simulation]) -> str:
         """
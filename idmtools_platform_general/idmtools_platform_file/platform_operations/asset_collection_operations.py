@@ -8,12 +8,13 @@ from uuid import UUID
 from pathlib import Path
 from dataclasses import field, dataclass
 from logging import getLogger
-from typing import TYPE_CHECKING, Type, List, Dict, Union, Optional
+from typing import TYPE_CHECKING, Type, List, Dict, Union, Optional, Tuple
 from idmtools.core import ItemType
 from idmtools.assets import AssetCollection, Asset
 from idmtools.entities.experiment import Experiment
 from idmtools.entities.simulation import Simulation
 from idmtools.entities.iplatform_ops.iplatform_asset_collection_operations import IPlatformAssetCollectionOperations
+from idmtools_platform_file.platform_operations.asset_store import AssetStore, ASSET_STORE_DIRECTORY, link_or_copy
 from idmtools_platform_file.platform_operations.utils import FileSimulation, validate_file_copy_path_length, \
     validate_file_path_length
 
@@ -33,6 +34,20 @@ class FilePlatformAssetCollectionOperations(IPlatformAssetCollectionOperations):
     """
     platform: 'FilePlatform'  # noqa F821
     platform_type: Type = field(default=None)
+    _store: Optional[AssetStore] = field(default=None, init=False, repr=False)
+
+    @property
+    def store(self) -> Optional[AssetStore]:
+        """
+        Content-addressed asset store under the job directory.
+        Returns:
+            AssetStore, or None if the platform does not stage assets through a store
+        """
+        if not self.platform.asset_store:
+            return None
+        if self._store is None:
+            self._store = AssetStore(Path(self.platform.job_directory, ASSET_STORE_DIRECTORY))
+        return self._store
 
     def get(self, asset_collection_id: Optional[UUID], **kwargs) -> AssetCollection:
         """
@@ -69,6 +84,11 @@ class FilePlatformAssetCollectionOperations(IPlatformAssetCollectionOperations):
             common_asset_dir = Path(self.platform.get_directory(simulation.parent), 'Assets')
         link_dir = Path(self.platform.get_directory(simulation), 'Assets')
 
+        if self.store is not None and not self.platform.sym_link:
+            # Hard link the files of the experiment, which come from the store, instead of copying them
+            shutil.copytree(common_asset_dir, link_dir, copy_function=link_or_copy, dirs_exist_ok=True)
+            return
+
         # Copy common assets to simulation directory
         self.platform.link_dir(common_asset_dir, link_dir)
 
@@ -154,6 +174,10 @@ class FilePlatformAssetCollectionOperations(IPlatformAssetCollectionOperations):
             self.pre_create(item.assets)
             exp_asset_dir = Path(self.platform.get_directory(item), 'Assets')
             self.platform.mk_directory(dest=exp_asset_dir)
+            if self.store is not None:
+                self.store.stage(self._staged_files(item.assets, exp_asset_dir, True))
+                self.post_create(item.assets)
+                return
             for asset in item.assets:
                 self.platform.mk_directory(dest=exp_asset_dir.joinpath(asset.relative_path))
                 self.copy_asset(asset, exp_asset_dir.joinpath(asset.relative_path))
@@ -161,8 +185,45 @@ class FilePlatformAssetCollectionOperations(IPlatformAssetCollectionOperations):
         elif isinstance(item, Simulation):
             self.pre_create(item.assets)
             sim_dir = self.platform.get_directory(item)
-            for asset in item.assets:
-                self.copy_asset(asset, sim_dir)
+            if self.store is not None:
+                self.store.stage(self._staged_files(item.assets, sim_dir))
+            else:
+                for asset in item.assets:
+                    self.copy_asset(asset, sim_dir)
             self.post_create(item.assets)
         else:
             raise NotImplementedError(f"dump_assets() for item of type {type(item)} is not supported on FilePlatform.")
+
+    def _staged_files(self, assets: AssetCollection, dest: Path, relative: bool = False) -> List[Tuple[Asset, Path]]:
+        """
+        Destination files of assets, named as copy_asset names them.
+        Args:
+            assets: assets to stage
+            dest: destination folder
+            relative: place assets in their relative path under the destination folder
+        Returns:
+            list of (asset, destination file)
+        """
+        files = []
+        for asset in assets:
+            asset_dir = dest.joinpath(asset.relative_path) if relative else dest
+            if asset.absolute_path:
+                dest_file = asset_dir.joinpath(Path(asset.absolute_path).name)
+            elif asset.content:
+                dest_file = asset_dir.joinpath(asset.filename)
+            else:
+                continue
+            validate_file_path_length(dest_file)
+            if relative:
+                self.platform.mk_directory(dest=asset_dir)
+            files.append((asset, dest_file))
+        return files
+
+    def sync_assets(self) -> None:
+        """
+        Sync the assets stored since the last call to disk.
+        Returns:
+            None
+        """
+        if self._store is not None:
+            self._store.sync()
@@ -92,9 +92,10 @@ class FilePlatformExperimentOperations(IPlatformExperimentOperations):
         """
         sim_list = []
         sim_meta_list = self.platform._metas.get_children(experiment)
+        statuses = self.platform.get_simulation_statuses(experiment) if sim_meta_list else {}
         for meta in sim_meta_list:
             file_sim = FileSimulation(meta)
-            file_sim.status = self.platform.get_simulation_status(file_sim.id)
+            file_sim.status = statuses.get(file_sim.id) or self.platform.get_simulation_status(file_sim.id)
             if raw:
                 sim_list.append(file_sim)
             else:
@@ -116,6 +117,18 @@ class FilePlatformExperimentOperations(IPlatformExperimentOperations):
         else:
             return self.platform._suites.get(experiment.parent_id, raw=True, **kwargs)
 
+    def pre_run_item(self, experiment: Experiment, **kwargs):
+        """
+        Create the experiment and its simulations, then sync their stored assets to disk.
+        Args:
+            experiment: idmtools Experiment
+            kwargs: keyword arguments used to expand functionality
+        Returns:
+            None
+        """
+        super().pre_run_item(experiment, **kwargs)
+        self.platform._assets.sync_assets()
+
     def platform_run_item(self, experiment: Experiment, **kwargs):
         """
         Run experiment.
@@ -219,9 +232,14 @@ class FilePlatformExperimentOperations(IPlatformExperimentOperations):
         Returns:
             Dict of simulation id as key and working dir as value
         """
-        # Refresh status for each simulation
+        # Refresh status of all simulations at once, or only the changed ones while the experiment is being tracked
+        tracker = self.platform._status_tracker
+        if tracker is not None and experiment.id in tracker:
+            statuses = tracker.update(experiment.id)
+        else:
+            statuses = self.platform.get_simulation_statuses(experiment, **kwargs)
         for sim in experiment.simulations:
-            sim.status = self.platform.get_simulation_status(sim.id, **kwargs)
+            sim.status = statuses.get(sim.id) or self.platform.get_simulation_status(sim.id, **kwargs)
 
     def create_sim_directory_map(self, experiment_id: str) -> Dict:
         """
@@ -14,6 +14,7 @@ from idmtools.entities import Suite
 from idmtools.entities.experiment import Experiment
 from idmtools.entities.simulation import Simulation
 from idmtools.utils.json import IDMJSONEncoder
+from idmtools_platform_file.platform_operations.metadata_index import MetadataIndex
 from idmtools_platform_file.platform_operations.utils import FileSuite, FileExperiment
 
 if TYPE_CHECKING:
@@ -28,6 +29,7 @@ class JSONMetadataOperations(imetadata_operations.IMetadataOperations):
     platform: 'FilePlatform'  # noqa: F821
     platform_type: Type = field(default=None)
     metadata_filename: str = field(default='metadata.json')
+    _index: MetadataIndex = field(default=None, init=False, repr=False, compare=False)
 
     @staticmethod
     def _read_from_file(filepath: Union[Path, str]) -> Dict:
@@ -43,6 +45,17 @@ class JSONMetadataOperations(imetadata_operations.IMetadataOperations):
             metadata = json.load(f)
         return metadata
 
+    @property
+    def index(self) -> MetadataIndex:
+        """
+        Persistent id index of the metadata files under the platform job directory.
+        Returns:
+            MetadataIndex
+        """
+        if self._index is None:
+            self._index = MetadataIndex(root=self.platform.job_directory)
+        return self._index
+
     @staticmethod
     def _write_to_file(filepath: Union[Path, str], data: Dict) -> None:
         """
@@ -111,6 +124,7 @@ class JSONMetadataOperations(imetadata_operations.IMetadataOperations):
         dest = self.get_metadata_filepath(item)
         meta = self.get(item)
         self._write_to_file(dest, meta)
+        self.index.add(meta)
         return meta
 
     def load(self, item: Union[Suite, Experiment, Simulation]) -> Dict:
@@ -160,6 +174,10 @@ class JSONMetadataOperations(imetadata_operations.IMetadataOperations):
             meta.update(metadata)
         meta_file = self.get_metadata_filepath(item)
         self._write_to_file(meta_file, meta)
+        if 'id' in meta:
+            self.index.add(meta)
+        else:
+            self.index.remove(item.id)
 
     def clear(self, item: Union[Suite, Experiment, Simulation]) -> None:
         """
@@ -200,6 +218,11 @@ class JSONMetadataOperations(imetadata_operations.IMetadataOperations):
         Returns:
             list of metadata with given item type
         """
+        if item_id:
+            meta = self._get_from_index(item_type, item_id)
+            if meta is not None:
+                return [meta]
+
         if item_type is ItemType.SIMULATION:
             pattern = f"*/*/*{item_id}/{self.metadata_filename}"
         elif item_type is ItemType.EXPERIMENT:
@@ -213,8 +236,42 @@ class JSONMetadataOperations(imetadata_operations.IMetadataOperations):
         for meta_file in root.glob(pattern=pattern):
             meta = self.load_from_file(meta_file)
             item_list.append(meta)
+        self.index.add_many(item_list)
         return item_list
 
+    def _get_from_index(self, item_type: ItemType, item_id: str) -> Union[Dict, None]:
+        """
+        Utility: load the metadata of an item located through the index.
+        Args:
+            item_type: the type of the item
+            item_id: item id
+        Returns:
+            item's metadata or None if the item is not indexed
+        """
+        entry = self.index.get(item_id, item_type)
+        if entry is None:
+            return None
+        meta_file = Path(entry['dir'], self.metadata_filename)
+        if not meta_file.exists():
+            self.index.remove(item_id)
+            return None
+        meta = self.load_from_file(meta_file)
+        if meta.get('id') != item_id:
+            self.index.remove(item_id)
+            return None
+        return meta
+
+    def rebuild_index(self) -> int:
+        """
+        Rebuild the metadata index from the metadata files under the job directory.
+        Returns:
+            number of indexed items
+        """
+        self.index.clear()
+        for item_type in (ItemType.SUITE, ItemType.EXPERIMENT, ItemType.SIMULATION):
+            self.get_all(item_type)
+        return len(self.index)
+
     @staticmethod
     def _match_filter(item: Dict, metadata: Dict, ignore_none=True):
         """
@@ -0,0 +1,176 @@
+"""
+Here we implement the persistent metadata index used by the JSON Metadata operations.
+
+The index lives under the platform job_directory and maps an item id to its type, directory, parent and status,
+so id lookups do not need to glob and parse every metadata.json file of the job directory.
+
+Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
+"""
+from pathlib import Path
+from logging import getLogger
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Union
+from diskcache import Cache
+from idmtools.core import ItemType
+
+logger = getLogger(__name__)
+
+METADATA_INDEX_DIR = '.idmtools_index'
+
+
+@dataclass
+class MetadataIndex:
+    """
+    Persistent id -> (item_type, dir, parent_id, status) index stored under the job directory.
+
+    The index is only a cache of the metadata.json files: it can be rebuilt from them at any time and any error while
+    accessing it is logged and ignored so callers can fall back to scanning the job directory.
+    """
+    root: Union[Path, str]
+    index_dirname: str = field(default=METADATA_INDEX_DIR)
+    _cache: Cache = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def index_directory(self) -> Path:
+        """
+        Location of the index.
+        Returns:
+            index directory
+        """
+        return Path(self.root, self.index_dirname)
+
+    @property
+    def cache(self) -> Optional[Cache]:
+        """
+        Open the index lazily.
+
+        The index is never created for a job directory which does not exist.
+        Returns:
+            diskcache Cache or None if the index could not be opened
+        """
+        if self._cache is None:
+            if not Path(self.root).exists():
+                return None
+            try:
+                self._cache = Cache(str(self.index_directory))
+            except Exception as ex:
+                logger.debug(f"Could not open metadata index at {self.index_directory}: {ex}")
+        return self._cache
+
+    @staticmethod
+    def _to_entry(meta: Dict) -> Dict:
+        """
+        Utility: build an index entry from item's metadata.
+        Args:
+            meta: item's metadata
+        Returns:
+            index entry
+        """
+        return dict(item_type=meta.get('item_type'), dir=meta.get('dir'), parent_id=meta.get('parent_id'),
+                    status=meta.get('status'))
+
+    def add(self, meta: Dict) -> None:
+        """
+        Add or replace the index entry for the given metadata.
+        Args:
+            meta: item's metadata (as written to metadata.json)
+        Returns:
+            None
+        """
+        if not meta or 'id' not in meta or self.cache is None:
+            return
+        try:
+            self.cache.set(str(meta['id']), self._to_entry(meta))
+        except Exception as ex:
+            logger.debug(f"Could not update metadata index for {meta['id']}: {ex}")
+
+    def add_many(self, metas: Iterable[Dict]) -> None:
+        """
+        Add entries for a list of metadata in one transaction.
+        Args:
+            metas: list of metadata
+        Returns:
+            None
+        """
+        if self.cache is None:
+            return
+        try:
+            with self.cache.transact():
+                for meta in metas:
+                    if meta and 'id' in meta:
+                        self.cache.set(str(meta['id']), self._to_entry(meta))
+        except Exception as ex:
+            logger.debug(f"Could not update metadata index: {ex}")
+
+    def remove(self, item_id: str) -> None:
+        """
+        Remove the entry of an item.
+        Args:
+            item_id: item id
+        Returns:
+            None
+        """
+        if self.cache is None:
+            return
+        try:
+            self.cache.delete(str(item_id))
+        except Exception as ex:
+            logger.debug(f"Could not remove {item_id} from metadata index: {ex}")
+
+    def get(self, item_id: str, item_type: ItemType = None) -> Optional[Dict]:
+        """
+        Lookup an item.
+
+        Entries whose directory does not exist anymore are dropped.
+        Args:
+            item_id: item id
+            item_type: optional item type the entry should match
+        Returns:
+            index entry or None if not found
+        """
+        if not item_id or self.cache is None:
+            return None
+        try:
+            entry = self.cache.get(str(item_id))
+        except Exception as ex:
+            logger.debug(f"Could not read metadata index for {item_id}: {ex}")
+            return None
+        if entry is None:
+            return None
+        if item_type is not None and entry['item_type'] != item_type.value:
+            return None
+        if entry['dir'] is None or not Path(entry['dir']).exists():
+            self.remove(item_id)
+            return None
+        return entry
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        Returns:
+            None
+        """
+        if self.cache is None:
+            return
+        try:
+            self.cache.clear()
+        except Exception as ex:
+            logger.debug(f"Could not clear metadata index: {ex}")
+
+    def close(self) -> None:
+        """
+        Close the index.
+        Returns:
+            None
+        """
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+
+    def __len__(self):
+        """
+        Number of entries in the index.
+        Returns:
+            int
+        """
+        return len(self.cache) if self.cache is not None else 0
@@ -0,0 +1,233 @@
+"""
+Here we implement the simulation status tracker used while waiting on File platform items.
+
+The tracker keeps an in-memory table of simulation statuses. File system events on job_status.txt mark the simulations
+to read again, so a refresh only reads the status files which changed. Without watchdog, or when the observer cannot be
+started, the tracker polls the status files of unfinished simulations instead.
+
+Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
+"""
+import os
+import time
+import threading
+from logging import getLogger
+from typing import Dict, Set, TYPE_CHECKING
+from idmtools.core import ItemType, EntityStatus
+from idmtools.entities.experiment import Experiment
+from idmtools_platform_file.platform_operations.utils import JOB_STATUS_FILE, read_job_statuses, to_entity_status
+
+try:
+    from watchdog.events import FileSystemEventHandler, EVENT_TYPE_CREATED, EVENT_TYPE_MODIFIED, EVENT_TYPE_MOVED
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover
+    FileSystemEventHandler = object
+    EVENT_TYPE_CREATED, EVENT_TYPE_MODIFIED, EVENT_TYPE_MOVED = 'created', 'modified', 'moved'
+    Observer = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    from idmtools_platform_file.file_platform import FilePlatform
+
+logger = getLogger(__name__)
+
+DONE_STATES = (EntityStatus.SUCCEEDED, EntityStatus.FAILED)
+# While watching, unfinished simulations are polled anyway every POLL_REFRESH_MULTIPLE refresh intervals by default, as a
+# safety net for missed events
+POLL_REFRESH_MULTIPLE = 20
+# Events which may change the content of job_status.txt
+STATUS_EVENT_TYPES = (EVENT_TYPE_CREATED, EVENT_TYPE_MODIFIED, EVENT_TYPE_MOVED)
+STATUS_FILE_SUFFIX = os.sep + JOB_STATUS_FILE
+
+
+class JobStatusHandler(FileSystemEventHandler):
+    """
+    Forward writes of job_status.txt files to the tracker.
+    """
+
+    def __init__(self, tracker: 'SimulationStatusTracker'):
+        """
+        Constructor.
+        Args:
+            tracker: tracker to notify
+        """
+        super().__init__()
+        self.tracker = tracker
+
+    def on_any_event(self, event):
+        """
+        Handle any file system event.
+
+        The experiment directory is watched recursively, so most events are writes of simulation outputs. They are
+        dropped with a suffix check before any other work.
+        Args:
+            event: watchdog event
+        Returns:
+            None
+        """
+        if event.event_type not in STATUS_EVENT_TYPES or event.is_directory:
+            return
+        path = event.dest_path if event.event_type == EVENT_TYPE_MOVED else event.src_path
+        if isinstance(path, str) and path.endswith(STATUS_FILE_SUFFIX):
+            self.tracker.mark_changed(path[:-len(STATUS_FILE_SUFFIX)])
+
+
+class SimulationStatusTracker:
+    """
+    In-memory status table of the simulations of the experiments being waited on.
+    """
+
+    def __init__(self, platform: 'FilePlatform', use_watcher: bool = True, poll_interval: float = None,
+                 min_interval: float = 0.5):
+        """
+        Constructor.
+        Args:
+            platform: File platform
+            use_watcher: watch status files with watchdog. When False, or when watchdog is not available, unfinished
+                simulations are polled on every refresh
+            poll_interval: while watching, how often (in seconds) unfinished simulations are polled anyway to catch
+                writes the file system did not report (network file systems). Defaults to POLL_REFRESH_MULTIPLE times
+                the refresh interval the caller waits with
+            min_interval: minimum time (in seconds) between two refreshes, so bursts of events are coalesced
+        """
+        self.platform = platform
+        self.use_watcher = use_watcher and Observer is not None
+        self.poll_interval = poll_interval
+        self._refresh_interval = None
+        self.min_interval = min_interval
+        self.statuses: Dict[str, EntityStatus] = {}
+        self._experiments: Dict[str, Set[str]] = {}
+        self._last_poll: Dict[str, float] = {}
+        self._dir_to_sim: Dict[str, str] = {}
+        self._sim_dirs: Dict[str, str] = {}
+        self._changed: Set[str] = set()
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+        self._observer = None
+
+    @property
+    def watching(self) -> bool:
+        """
+        Whether status files are watched.
+        Returns:
+            True if file system events are received
+        """
+        return self._observer is not None
+
+    def __contains__(self, experiment_id: str) -> bool:
+        """
+        Check if an experiment is tracked.
+        Args:
+            experiment_id: experiment id
+        Returns:
+            True if the experiment is tracked
+        """
+        return experiment_id in self._experiments
+
+    def add_experiment(self, experiment: Experiment) -> None:
+        """
+        Start tracking the simulations of an experiment.
+        Args:
+            experiment: idmtools Experiment
+        Returns:
+            None
+        """
+        sim_dirs = self.platform._get_simulation_dirs(experiment)
+        with self._lock:
+            self._sim_dirs.update(sim_dirs)
+            self._dir_to_sim.update({os.path.normpath(sim_dir): sim_id for sim_id, sim_dir in sim_dirs.items()})
+        # watch before reading so writes in between are not missed
+        if self.use_watcher:
+            self._watch(str(self.platform.get_directory_by_id(experiment.id, ItemType.EXPERIMENT)))
+        self.statuses.update({sim_id: to_entity_status(status) for sim_id, status in read_job_statuses(sim_dirs).items()})
+        self._experiments[experiment.id] = set(sim_dirs)
+        self._last_poll[experiment.id] = time.monotonic()
+
+    def _watch(self, exp_dir: str) -> None:
+        """
+        Watch an experiment directory. Fallback to polling if the observer cannot be started.
+        Args:
+            exp_dir: experiment directory
+        Returns:
+            None
+        """
+        try:
+            if self._observer is None:
+                self._observer = Observer()
+                self._observer.start()
+            self._observer.schedule(JobStatusHandler(self), exp_dir, recursive=True)
+        except OSError as ex:
+            # e.g. the inotify watch limit is reached
+            logger.debug(f"Could not watch {exp_dir}, polling simulation status instead: {ex}")
+            self.stop()
+            self.use_watcher = False
+
+    def mark_changed(self, sim_dir: str) -> None:
+        """
+        Mark the status of the simulation in a directory as changed.
+        Args:
+            sim_dir: simulation directory
+        Returns:
+            None
+        """
+        sim_id = self._dir_to_sim.get(os.path.normpath(sim_dir))
+        if sim_id is None:
+            return
+        with self._lock:
+            self._changed.add(sim_id)
+        self._event.set()
+
+    def update(self, experiment_id: str) -> Dict[str, EntityStatus]:
+        """
+        Read the status of the simulations of an experiment which may have changed since the last update.
+        Args:
+            experiment_id: experiment id
+        Returns:
+            Dict of simulation id as key and EntityStatus as value for all tracked simulations
+        """
+        sim_ids = self._experiments[experiment_id]
+        with self._lock:
+            changed = self._changed & sim_ids
+            self._changed -= changed
+        now = time.monotonic()
+        poll_interval = self.poll_interval
+        if poll_interval is None and self._refresh_interval is not None:
+            poll_interval = POLL_REFRESH_MULTIPLE * self._refresh_interval
+        if not self.watching or (poll_interval is not None and now - self._last_poll[experiment_id] >= poll_interval):
+            changed.update(sim_id for sim_id in sim_ids if self.statuses[sim_id] not in DONE_STATES)
+            self._last_poll[experiment_id] = now
+        if changed:
+            statuses = read_job_statuses({sim_id: self._sim_dirs[sim_id] for sim_id in changed})
+            self.statuses.update({sim_id: to_entity_status(status) for sim_id, status in statuses.items()})
+        return self.statuses
+
+    def wait(self, timeout: float) -> None:
+        """
+        Wait until a status changes or the timeout expires.
+        Args:
+            timeout: maximum time to wait in seconds
+        Returns:
+            None
+        """
+        self._refresh_interval = timeout
+        if not self.watching:
+            time.sleep(timeout)
+            return
+        start = time.monotonic()
+        self._event.wait(timeout)
+        self._event.clear()
+        remaining = min(self.min_interval, timeout) - (time.monotonic() - start)
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def stop(self) -> None:
+        """
+        Stop watching the status files.
+        Returns:
+            None
+        """
+        if self._observer is not None:
+            try:
+                self._observer.stop()
+                self._observer.join()
+            except Exception as ex:
+                logger.debug(f"Failed to stop status observer: {ex}")
+            self._observer = None
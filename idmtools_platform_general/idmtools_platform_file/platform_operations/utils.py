@@ -6,7 +6,8 @@ Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 import os
 from pathlib import Path
 from logging import getLogger
-from typing import Dict, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Union
 from idmtools.entities import Suite
 from idmtools.core import ItemType, EntityStatus
 from idmtools.entities.experiment import Experiment
@@ -21,6 +22,10 @@ FILE_MAPS = {
     "None": EntityStatus.CREATED
 }
 
+JOB_STATUS_FILE = 'job_status.txt'
+# below this number of simulations, status files are read serially
+MIN_PARALLEL_STATUS_READS = 64
+
 
 class FileItem:
     """
@@ -108,6 +113,64 @@ def clean_experiment_name(experiment_name: str) -> str:
     return experiment_name.encode("ascii", "ignore").decode('utf8').strip()
 
 
+def read_job_status(sim_dir: Union[Path, str]) -> Optional[str]:
+    """
+    Read the raw job status of a simulation.
+    Args:
+        sim_dir: simulation directory
+    Returns:
+        content of job_status.txt or None if the simulation has not started
+    """
+    try:
+        with open(os.path.join(sim_dir, JOB_STATUS_FILE)) as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def to_entity_status(status: Optional[str]) -> EntityStatus:
+    """
+    Convert a raw job status to EntityStatus.
+    Args:
+        status: content of job_status.txt or None
+    Returns:
+        EntityStatus
+    """
+    if status is None:
+        return FILE_MAPS['None']
+    if status in ['100', '0', '-1']:
+        return FILE_MAPS[status]
+    return FILE_MAPS['100']  # To be safe
+
+
+def get_simulation_directories(exp_dir: Union[Path, str]) -> Dict[str, str]:
+    """
+    List the simulation directories of an experiment with a single directory scan.
+    Args:
+        exp_dir: experiment directory
+    Returns:
+        Dict of directory name as key and directory path as value
+    """
+    with os.scandir(exp_dir) as entries:
+        return {entry.name: entry.path for entry in entries
+                if entry.name != 'Assets' and not entry.name.startswith('.') and entry.is_dir()}
+
+
+def read_job_statuses(sim_dirs: Dict[str, Union[Path, str]], max_workers: int = None) -> Dict[str, Optional[str]]:
+    """
+    Read the raw job status of many simulations, concurrently for large experiments.
+    Args:
+        sim_dirs: Dict of simulation id as key and simulation directory as value
+        max_workers: maximum number of threads reading the status files
+    Returns:
+        Dict of simulation id as key and raw job status (or None) as value
+    """
+    if len(sim_dirs) < MIN_PARALLEL_STATUS_READS:
+        return {sim_id: read_job_status(sim_dir) for sim_id, sim_dir in sim_dirs.items()}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(sim_dirs.keys(), pool.map(read_job_status, sim_dirs.values())))
+
+
 def add_dummy_suite(experiment: Experiment, suite_name: str = None, tags: Dict = None) -> Suite:
     """
     Create Suite parent for given experiment.
@@ -12,7 +12,7 @@ from typing import Dict, List, Tuple, TYPE_CHECKING
 from idmtools.core import ItemType, EntityStatus
 from idmtools.entities.experiment import Experiment
 from idmtools_platform_file.tools.status_report.utils import get_latest_experiment
-from idmtools_platform_file.platform_operations.utils import FILE_MAPS
+from idmtools_platform_file.platform_operations.utils import FILE_MAPS, read_job_statuses
 
 if TYPE_CHECKING:  # pragma: no cover
     from idmtools.entities.iplatform import IPlatform
@@ -80,19 +80,16 @@ class StatusReporter:
         self.platform.refresh_status(self._exp)
 
         # Filter simulations and format the results
-        _simulations = self._exp.simulations
+        _simulations = [sim for sim in self._exp.simulations if sim_filter is None or sim.id in sim_filter]
+        exp_dir = self.platform.get_directory_by_id(self._exp.id, ItemType.EXPERIMENT)
+        sim_dirs = {sim.id: exp_dir.joinpath(self.platform.entity_display_name(sim)) for sim in _simulations}
+        statuses = read_job_statuses(sim_dirs)
         for sim in _simulations:
-            # Apply simulation filter
-            if sim_filter is not None and sim.id not in sim_filter:
-                continue
-
-            sim_dir = self.platform.get_directory(sim)
-            job_status_path = sim_dir.joinpath("job_status.txt")
-            if not job_status_path.exists():
+            status = statuses[sim.id]
+            if status is None:
                 self._pending.append(f"    {sim.id}")
                 continue
 
-            status = open(job_status_path).read().strip()
             # Apply status filter
             if status_filter is not None and status not in status_filter:
                 continue
@@ -100,7 +97,7 @@ class StatusReporter:
             # Format the results
             d = dict(status=status)
             if verbose:
-                d["WorkDir"] = str(self.platform.get_directory(sim))
+                d["WorkDir"] = str(sim_dirs[sim.id])
             self._report[sim.id] = d
 
     @staticmethod
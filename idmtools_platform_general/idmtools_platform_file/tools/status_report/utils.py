@@ -29,7 +29,8 @@ def get_latest_experiment(platform: 'IPlatform') -> Dict:
     """
     try:
         # take the last suite as the search scope
-        last_suite_dir = max(Path(platform.job_directory).glob('*/'), key=os.path.getmtime)
+        last_suite_dir = max([d for d in Path(platform.job_directory).glob('*/') if d.is_dir() and not d.name.startswith('.')],
+                             key=os.path.getmtime)
         batch_dir = max(Path(last_suite_dir).glob('*/batch.sh'), key=os.path.getmtime)
         exp_dir = Path(batch_dir).parent
         exp_id = exp_dir.name
@@ -5,14 +5,18 @@ Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
 import platform
 import subprocess
-from typing import Union, Any
-from dataclasses import dataclass
+import sys
+from typing import Union, Any, Optional, Callable, Dict
+from dataclasses import dataclass, field
 from idmtools.entities.experiment import Experiment
+from idmtools.entities.platform_requirements import PlatformRequirements
 from idmtools.entities.simulation import Simulation
 from idmtools_platform_file.file_platform import FilePlatform
 from idmtools_platform_process.platform_operations.experiment_operations import ProcessPlatformExperimentOperations
+from idmtools_platform_process.scheduler import write_queue
 from logging import getLogger
 
+logger = getLogger(__name__)
 user_logger = getLogger('user')
 
 
@@ -21,6 +25,21 @@ class ProcessPlatform(FilePlatform):
     """
     Process Platform definition.
     """
+    # run simulations with the scheduler instead of batch.sh
+    scheduler: bool = field(default=False, metadata=dict(
+        help="Run the simulations with a scheduler detached from idmtools instead of batch.sh. Submitting returns "
+             "immediately and an interrupted experiment resumes when it is submitted again"))
+    # cpus used by each process of a simulation
+    cpus_per_task: int = field(default=1, metadata=dict(
+        help="Number of CPUs used by each process of a simulation, unless its task declares its cores. With the "
+             "scheduler, simulations are packed in the CPUs of the machine, each using ntasks x cpus_per_task CPUs"))
+    # memory used by each simulation
+    mem: Optional[int] = field(default=None, metadata=dict(
+        help="Memory in MB used by each simulation, unless its task declares its memory. With the scheduler, "
+             "simulations are packed in the memory of the machine"))
+    # pin simulations to the cpus they reserve
+    cpu_affinity: bool = field(default=False, metadata=dict(
+        help="With the scheduler, pin each simulation to the CPUs it reserves. Tasks requiring a GPU are not pinned"))
 
     def __post_init__(self):
         super().__post_init__()
@@ -41,6 +60,11 @@ class ProcessPlatform(FilePlatform):
             exit(-1)
 
         if isinstance(item, Experiment):
+            if self.scheduler:
+                if not self.modules and not self.extra_packages:
+                    return self.submit_to_scheduler(item, **kwargs)
+                user_logger.warning("The scheduler does not load modules or install extra packages, running batch.sh "
+                                    "instead.")
             working_directory = self.get_directory(item)
             result = subprocess.run(['bash', 'batch.sh'], stdout=subprocess.PIPE, cwd=str(working_directory))
             r = result.stdout.decode('utf-8').strip()
@@ -50,3 +74,47 @@ class ProcessPlatform(FilePlatform):
         else:
             raise NotImplementedError(
                 f"Submit job is not implemented for {item.__class__.__name__} on ProcessPlatform.")
+
+    def submit_to_scheduler(self, experiment: Experiment, priority: Callable[[Simulation], int] = None,
+                            **kwargs) -> str:
+        """
+        Queue the simulations of an experiment and start a scheduler running them, detached from idmtools.
+
+        Simulations which already finished are not run again by the scheduler, so submitting an interrupted experiment
+        again resumes it.
+        Args:
+            experiment: idmtools Experiment
+            priority: function giving the priority of a simulation. Simulations with a higher priority run first
+            kwargs: keyword arguments used to expand functionality
+        Returns:
+            Process id of the scheduler
+        """
+        sim_dirs = self._get_simulation_dirs(experiment)
+        simulations = [dict(directory=str(sim_dirs[sim.id]), priority=priority(sim) if priority else 0,
+                            **self.get_simulation_resources(sim))
+                       for sim in experiment.simulations if sim.id in sim_dirs]
+        working_directory = self.get_directory(experiment)
+        write_queue(working_directory, simulations, max_job=1 if self.run_sequence else self.max_job)
+        with open(working_directory.joinpath("stdout.txt"), "ab") as out, \
+                open(working_directory.joinpath("stderr.txt"), "ab") as err:
+            process = subprocess.Popen([sys.executable, '-m', 'idmtools_platform_process.scheduler',
+                                        str(working_directory)], cwd=str(working_directory), stdin=subprocess.DEVNULL,
+                                       stdout=out, stderr=err, start_new_session=True)
+        logger.debug(f"Started scheduler {process.pid} for experiment {experiment.id}")
+        return str(process.pid)
+
+    def get_simulation_resources(self, simulation: Simulation) -> Dict[str, Any]:
+        """
+        Get the resources the scheduler reserves for a simulation.
+
+        The cores and memory declared by the task of the simulation are used, the platform defaults otherwise.
+        Args:
+            simulation: idmtools Simulation
+        Returns:
+            Dict with the *cpus*, *memory* (in MB) and *affinity* of the simulation
+        """
+        task = simulation.task
+        gpu = getattr(task, 'is_gpu', False) or PlatformRequirements.GPU in (getattr(task, 'platform_requirements', None) or ())
+        return dict(cpus=getattr(task, 'cores', None) or self.ntasks * self.cpus_per_task,
+                    memory=getattr(task, 'memory', None) or self.mem,
+                    affinity=self.cpu_affinity and not gpu)
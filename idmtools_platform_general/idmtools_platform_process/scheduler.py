@@ -0,0 +1,322 @@
+"""
+Here we implement the scheduler running the simulations of a ProcessPlatform experiment.
+
+The scheduler runs detached from idmtools, as ``python -m idmtools_platform_process.scheduler <experiment directory>``.
+It reads the queue file written in the experiment directory on submission and starts the _run.sh script of each
+simulation directly, highest priority first. Simulations are packed in the cpus and memory of the machine: when the next
+simulation does not fit, smaller ones behind it start in the cpus and memory left. Simulations may be pinned to the cpus
+they reserve.
+The queue file is kept, so an interrupted experiment resumes by running the scheduler again: finished simulations are
+skipped and the others are run from the start. Only one scheduler runs an experiment at a time.
+
+This module only depends on the standard library, so the scheduler starts quickly.
+
+Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
+"""
+import asyncio
+import json
+import os
+import signal
+import sys
+from logging import getLogger, basicConfig, DEBUG, INFO
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+logger = getLogger(__name__)
+
+SCHEDULER_QUEUE_FILE = 'scheduler_queue.json'
+SCHEDULER_LOCK_FILE = '.scheduler.lock'
+JOB_STATUS_FILE = 'job_status.txt'
+SIMULATION_SCRIPT = '_run.sh'
+DONE_STATUSES = ('0', '-1')
+
+
+def write_atomic(path: Union[Path, str], content: str) -> None:
+    """
+    Write a file atomically: readers see either the previous or the new content, never a partial write.
+    Args:
+        path: file to write
+        content: content of the file
+    Returns:
+        None
+    """
+    path = Path(path)
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    tmp.write_text(content)
+    os.replace(tmp, path)
+
+
+def write_queue(experiment_dir: Union[Path, str], simulations: List[Dict], max_job: int, cpus: int = None,
+                memory: int = None) -> Path:
+    """
+    Write the queue file of an experiment.
+    Args:
+        experiment_dir: experiment directory
+        simulations: list of dict with the simulation *directory*, its *priority*, the *cpus* and *memory* (in MB)
+            it uses and whether it is pinned to its cpus (*affinity*)
+        max_job: maximum number of simulations running at the same time
+        cpus: number of cpus the simulations may use. Defaults to all cpus available to the scheduler
+        memory: memory in MB the simulations may use. Defaults to all memory of the machine
+    Returns:
+        Path of the queue file
+    """
+    queue_file = Path(experiment_dir, SCHEDULER_QUEUE_FILE)
+    write_atomic(queue_file, json.dumps(dict(max_job=max_job, cpus=cpus, memory=memory, simulations=simulations)))
+    return queue_file
+
+
+def available_cpus() -> List[int]:
+    """
+    Cpus the scheduler may run simulations on.
+    Returns:
+        list of cpu ids
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def total_memory() -> Optional[int]:
+    """
+    Physical memory of the machine.
+    Returns:
+        Memory in MB or None if it is not known
+    """
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // 2 ** 20
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def read_status(sim_dir: Union[Path, str]) -> Optional[str]:
+    """
+    Read the raw job status of a simulation.
+    Args:
+        sim_dir: simulation directory
+    Returns:
+        content of job_status.txt or None if the simulation has not started
+    """
+    try:
+        return Path(sim_dir, JOB_STATUS_FILE).read_text().strip()
+    except FileNotFoundError:
+        return None
+
+
+class ProcessScheduler:
+    """
+    Run the simulations of an experiment queue within a cpu and memory budget.
+    """
+
+    def __init__(self, experiment_dir: Union[Path, str]):
+        """
+        Constructor.
+        Args:
+            experiment_dir: experiment directory containing the queue file
+        """
+        self.experiment_dir = Path(experiment_dir)
+        queue = json.loads(self.experiment_dir.joinpath(SCHEDULER_QUEUE_FILE).read_text())
+        self.max_job = max(1, queue.get('max_job') or 1)
+        cpus = available_cpus()
+        self.cpus = cpus[:queue['cpus']] if queue.get('cpus') else cpus
+        self.memory = queue.get('memory') or total_memory()
+        # highest priority first, then in submission order
+        self.simulations = sorted(queue['simulations'], key=lambda s: -(s.get('priority') or 0))
+        self._processes: Dict[str, asyncio.subprocess.Process] = {}
+        self._stopping = False
+
+    def pending(self) -> List[Dict]:
+        """
+        Simulations of the queue which have not finished.
+
+        Simulations left running by an interrupted scheduler are reset, so they show as not started until they run again.
+        Returns:
+            list of queued simulations
+        """
+        pending = []
+        for sim in self.simulations:
+            status = read_status(sim['directory'])
+            if status in DONE_STATUSES:
+                continue
+            if status is not None:
+                Path(sim['directory'], JOB_STATUS_FILE).unlink(missing_ok=True)
+            pending.append(sim)
+        return pending
+
+    @staticmethod
+    def fits(sim: Dict, cpus: List[int], memory: Optional[int]) -> bool:
+        """
+        Whether a simulation fits in the remaining budget.
+        Args:
+            sim: queued simulation
+            cpus: cpus not used by the running simulations
+            memory: memory not used by the running simulations, None if it is not tracked
+        Returns:
+            True if the simulation can start
+        """
+        if (sim.get('cpus') or 1) > len(cpus):
+            return False
+        return memory is None or not sim.get('memory') or sim['memory'] <= memory
+
+    def next_simulations(self, pending: List[Dict], cpus: List[int], memory: Optional[int], running: int) -> List[Dict]:
+        """
+        Pick the pending simulations to start, packing them in the remaining budget.
+
+        Simulations are considered in queue order and each one fitting in what is left starts. A simulation which does
+        not fit is passed over by smaller ones, until it has been passed over by max_job simulations: later ones then
+        wait for it to start, so large simulations are not starved. A simulation larger than the whole budget runs
+        alone.
+        Args:
+            pending: pending simulations in queue order. The simulations picked are removed
+            cpus: cpus not used by the running simulations
+            memory: memory not used by the running simulations, None if it is not tracked
+            running: number of running simulations
+        Returns:
+            simulations to start
+        """
+        picked = []
+        index = 0
+        while index < len(pending) and running + len(picked) < self.max_job:
+            sim = pending[index]
+            if self.fits(sim, cpus, memory) or (running + len(picked) == 0 and index == 0):
+                picked.append(pending.pop(index))
+                cpus = cpus[sim.get('cpus') or 1:]
+                if memory is not None:
+                    memory -= sim.get('memory') or 0
+                # the simulation passes over the blocked simulations ahead of it
+                for blocked in pending[:index]:
+                    blocked['passed_over'] = blocked.get('passed_over', 0) + 1
+                continue
+            if sim.get('passed_over', 0) >= self.max_job:
+                break
+            index += 1
+        return picked
+
+    async def run(self) -> None:
+        """
+        Run the pending simulations, packing them in the cpus and memory of the machine.
+        Returns:
+            None
+        """
+        pending = self.pending()
+        logger.info(f"Running {len(pending)} of {len(self.simulations)} simulations in {self.experiment_dir}")
+        cpus, memory = list(self.cpus), self.memory
+        running = {}
+        while (pending and not self._stopping) or running:
+            if not self._stopping:
+                for sim in self.next_simulations(pending, cpus, memory, len(running)):
+                    # a simulation larger than the whole budget runs on all cpus
+                    reserved, cpus = cpus[:sim.get('cpus') or 1], cpus[sim.get('cpus') or 1:]
+                    if memory is not None:
+                        memory -= sim.get('memory') or 0
+                    running[asyncio.ensure_future(self.run_simulation(sim, reserved))] = (sim, reserved)
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                sim, reserved = running.pop(task)
+                cpus = sorted(cpus + reserved)
+                if memory is not None:
+                    memory += sim.get('memory') or 0
+
+    async def run_simulation(self, sim: Dict, cpus: List[int] = None) -> int:
+        """
+        Run the _run.sh script of a simulation.
+
+        The script writes the status of the simulation. When it could not, because it failed to start or was killed,
+        the scheduler writes the status from the exit code.
+        Args:
+            sim: queued simulation
+            cpus: cpus reserved for the simulation. The simulation is pinned to them when its *affinity* is set
+        Returns:
+            exit code of the simulation
+        """
+        sim_dir = Path(sim['directory'])
+        script = sim_dir.joinpath(SIMULATION_SCRIPT)
+        try:
+            content = script.read_bytes()
+            if b'\r' in content:
+                script.write_bytes(content.replace(b'\r', b''))
+            with open(sim_dir.joinpath('stdout.txt'), 'wb') as out, open(sim_dir.joinpath('stderr.txt'), 'wb') as err:
+                process = await asyncio.create_subprocess_exec('bash', SIMULATION_SCRIPT, cwd=str(sim_dir),
+                                                               stdin=asyncio.subprocess.DEVNULL, stdout=out, stderr=err,
+                                                               preexec_fn=self._pin(sim, cpus))
+        except OSError as e:
+            logger.error(f"Failed to start the simulation in {sim_dir}: {e}")
+            write_atomic(sim_dir.joinpath(JOB_STATUS_FILE), '-1\n')
+            return -1
+        self._processes[str(sim_dir)] = process
+        try:
+            return_code = await process.wait()
+        finally:
+            self._processes.pop(str(sim_dir), None)
+        if read_status(sim_dir) not in DONE_STATUSES:
+            write_atomic(sim_dir.joinpath(JOB_STATUS_FILE), '0\n' if return_code == 0 else '-1\n')
+        logger.debug(f"Simulation in {sim_dir} exited with {return_code}")
+        return return_code
+
+    @staticmethod
+    def _pin(sim: Dict, cpus: Optional[List[int]]):
+        """
+        Function pinning a simulation process to its cpus, run in the process before the script starts.
+        Args:
+            sim: queued simulation
+            cpus: cpus reserved for the simulation
+        Returns:
+            function for preexec_fn or None when the simulation is not pinned
+        """
+        if not sim.get('affinity') or not cpus or not hasattr(os, 'sched_setaffinity'):
+            return None
+        return lambda: os.sched_setaffinity(0, cpus)
+
+    def stop(self) -> None:
+        """
+        Stop starting simulations and terminate the running ones. Their scripts mark them as failed.
+        Returns:
+            None
+        """
+        self._stopping = True
+        for process in list(self._processes.values()):
+            if process.returncode is None:
+                process.terminate()
+
+
+def run_scheduler(experiment_dir: Union[Path, str]) -> bool:
+    """
+    Run the scheduler of an experiment until all its simulations are done, unless a scheduler is already running it.
+    Args:
+        experiment_dir: experiment directory containing the queue file
+    Returns:
+        True if the scheduler ran, False if another scheduler is running the experiment
+    """
+    with open(Path(experiment_dir, SCHEDULER_LOCK_FILE), 'a+') as lock:
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                logger.info(f"A scheduler is already running the experiment in {experiment_dir}")
+                return False
+        lock.seek(0)
+        lock.truncate()
+        lock.write(str(os.getpid()))
+        lock.flush()
+        scheduler = ProcessScheduler(experiment_dir)
+        loop = asyncio.new_event_loop()
+        try:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(sig, scheduler.stop)
+            loop.run_until_complete(scheduler.run())
+        finally:
+            loop.close()
+    return True
+
+
+if __name__ == '__main__':
+    basicConfig(level=DEBUG if os.environ.get('IDMTOOLS_SCHEDULER_DEBUG') else INFO,
+                format='%(asctime)s %(levelname)s %(message)s')
+    if len(sys.argv) != 2:
+        print(f"Usage: {sys.executable} -m idmtools_platform_process.scheduler <experiment directory>", file=sys.stderr)
+        sys.exit(2)
+    sys.exit(0 if run_scheduler(sys.argv[1]) else 1)
@@ -16,7 +16,7 @@ build_requirements = ['flake8', 'coverage', 'bump2version', 'twine', "natsort"]
 test_requirements = ['pytest', 'pytest-runner', 'matplotlib', 'pytest-timeout', 'pytest-cache',
                      'pytest-lazy-fixture'] + build_requirements
 
-extras = dict(test=test_requirements, dev=['Pympler'], packaging=build_requirements)
+extras = dict(test=test_requirements, dev=['Pympler'], packaging=build_requirements, watch=['watchdog'])
 
 authors = [
     ("Ross Carter", "rcarter@idmod.org"),
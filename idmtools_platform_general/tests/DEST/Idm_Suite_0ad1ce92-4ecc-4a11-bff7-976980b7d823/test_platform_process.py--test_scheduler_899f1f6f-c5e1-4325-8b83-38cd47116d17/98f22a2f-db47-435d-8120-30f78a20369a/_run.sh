@@ -0,0 +1,43 @@
+#!/bin/bash
+
+# write the job status atomically, so it is never read partially written
+write_status()
+{
+    echo "$1" > .job_status.txt.tmp && mv -f .job_status.txt.tmp job_status.txt
+}
+
+# define the handler function
+term_handler()
+{
+    # do whatever cleanup you want here
+    write_status "-1"
+    exit -1
+}
+
+# Register cleanup function to handle SIGINT and SIGTERM signals
+trap 'term_handler' SIGINT SIGTERM
+
+n=0
+
+
+until [ "$n" -ge 1 ]
+do
+    write_status "100"
+    
+        exec -a "SIMULATION:98f22a2f-db47-435d-8120-30f78a20369a"  python3 Assets/model3.py --config config.json &
+    
+
+   child_pid=$!
+   echo "Running simulation with PID: $child_pid"
+   # Wait for the child process to complete
+   wait $child_pid
+
+   RESULT=$?
+   if [ $RESULT -eq 0 ]; then
+      write_status "0"
+      exit $RESULT
+   fi
+   n=$((n+1))
+done
+write_status "-1"
+exit $RESULT
\ No newline at end of file
@@ -3,6 +3,9 @@ import json
 import os
 import pathlib
 import shutil
+import subprocess
+import threading
+import time
 from functools import partial
 from typing import Any, Dict
 
@@ -11,13 +14,15 @@ import pandas as pd
 import pytest
 from pathlib import Path
 
+from idmtools.assets import Asset
 from idmtools.builders import SimulationBuilder
-from idmtools.core import ItemType
+from idmtools.core import ItemType, EntityStatus
 from idmtools.core.platform_factory import Platform
 from idmtools.entities import Suite
 from idmtools.entities.experiment import Experiment
 from idmtools.entities.simulation import Simulation
 from idmtools.entities.templated_simulation import TemplatedSimulations
+from idmtools.utils.hashing import calculate_md5
 from idmtools_models.python.json_python_task import JSONConfiguredPythonTask
 
 from idmtools_test import COMMON_INPUT_PATH
@@ -216,6 +221,139 @@ class TestFilePlatform(ITestWithPersistence):
         # cleanup
         os.remove(f"{experiment.id}.csv")
 
+    def test_get_simulation_statuses(self):
+        experiment = self.create_experiment(self.platform, a=9, b=8)
+        sims = list(experiment.simulations)
+        for sim, status in zip(sims, ['0', '-1', '100', 'unknown']):
+            with open(self.platform.get_directory(sim).joinpath('job_status.txt'), 'w') as f:
+                f.write(f"{status}\n")
+        expected = {sim.id: self.platform.get_simulation_status(sim.id) for sim in sims}
+        self.assertEqual([EntityStatus.SUCCEEDED, EntityStatus.FAILED, EntityStatus.RUNNING, EntityStatus.RUNNING],
+                         [expected[sim.id] for sim in sims[:4]])
+        self.assertTrue(all(expected[sim.id] == EntityStatus.CREATED for sim in sims[4:]))
+        self.assertDictEqual(expected, self.platform.get_simulation_statuses(experiment))
+        file_experiment = self.platform.get_item(experiment.id, ItemType.EXPERIMENT, raw=True)
+        self.assertDictEqual(expected, self.platform.get_simulation_statuses(file_experiment))
+
+        self.platform.refresh_status(experiment)
+        self.assertDictEqual(expected, {sim.id: sim.status for sim in experiment.simulations})
+        self.assertEqual(EntityStatus.RUNNING, experiment.status)
+
+    def test_wait_till_done_status_tracking(self):
+        for status_watcher in [True, False]:
+            with self.subTest(status_watcher=status_watcher):
+                self.platform.status_watcher = status_watcher
+                experiment = self.create_experiment(self.platform, a=2, b=2)
+                sim_dirs = [self.platform.get_directory(sim) for sim in experiment.simulations]
+
+                def finish_simulations():
+                    for sim_dir in sim_dirs:
+                        time.sleep(0.2)
+                        with open(sim_dir.joinpath('job_status.txt'), 'w') as f:
+                            f.write("0\n")
+
+                with self.platform._track_status(experiment) as wait_for_change:
+                    tracker = self.platform._status_tracker
+                    self.assertIn(experiment.id, tracker)
+                    self.assertEqual(status_watcher, tracker.watching)
+                    writer = threading.Thread(target=finish_simulations)
+                    writer.start()
+                    start = time.time()
+                    while not experiment.done and time.time() - start < 30:
+                        wait_for_change(1)
+                        self.platform.refresh_status(experiment)
+                    writer.join()
+                self.assertIsNone(self.platform._status_tracker)
+                self.assertTrue(experiment.succeeded)
+
+                # statuses already written are picked up when tracking starts
+                self.platform.wait_till_done(experiment, timeout=10, refresh_interval=1)
+                self.assertTrue(experiment.succeeded)
+
+    def test_status_tracking_without_events(self):
+        from watchdog.events import FileModifiedEvent, FileOpenedEvent
+        from idmtools_platform_file.platform_operations.status_tracker import JobStatusHandler
+        self.platform.status_watcher = True
+        experiment = self.create_experiment(self.platform, a=2)
+        sim_dirs = [self.platform.get_directory(sim) for sim in experiment.simulations]
+        with self.platform._track_status(experiment) as wait_for_change:
+            tracker = self.platform._status_tracker
+            self.assertTrue(tracker.watching)
+            # only writes of job_status.txt mark a simulation
+            handler = JobStatusHandler(tracker)
+            handler.on_any_event(FileModifiedEvent(str(sim_dirs[0].joinpath("output", "result.txt"))))
+            handler.on_any_event(FileOpenedEvent(str(sim_dirs[0].joinpath("job_status.txt"))))
+            self.assertFalse(tracker._changed)
+            handler.on_any_event(FileModifiedEvent(str(sim_dirs[0].joinpath("job_status.txt"))))
+            self.assertEqual({experiment.simulations[0].id}, tracker._changed)
+
+            # without events, unfinished simulations are only polled as a safety net by default
+            tracker._observer.unschedule_all()
+            tracker._changed.clear()
+            for sim_dir in sim_dirs:
+                with open(sim_dir.joinpath('job_status.txt'), 'w') as f:
+                    f.write("0\n")
+            wait_for_change(0.5)
+            self.platform.refresh_status(experiment)
+            self.assertFalse(experiment.done)
+
+            # file systems which do not report writes (NFS) are polled at the status_poll_interval
+            tracker.poll_interval = 0.5
+            start = time.time()
+            while not experiment.done and time.time() - start < 10:
+                wait_for_change(0.5)
+                self.platform.refresh_status(experiment)
+        self.assertTrue(experiment.succeeded)
+
+    def test_asset_store(self):
+        platform = Platform('FILE', job_directory=self.job_directory, asset_store=True, sym_link=False)
+        experiment = self.create_experiment(platform, a=3)
+        store = platform._assets.store
+        exp_assets = platform.get_directory(experiment).joinpath("Assets")
+        for simulation in experiment.simulations:
+            sim_dir = platform.get_directory(simulation)
+            config = sim_dir.joinpath("config.json")
+            asset = simulation.assets.get_one(filename="config.json")
+            self.assertEqual(asset.bytes, config.read_bytes())
+            stored = store.path(asset.checksum)
+            self.assertTrue(os.path.samefile(stored, config))
+            self.assertEqual(0, os.stat(config).st_mode & 0o222)
+            # common assets are hard linked from the experiment instead of copied
+            self.assertFalse(os.path.islink(sim_dir.joinpath("Assets")))
+            for asset in experiment.assets:
+                self.assertTrue(os.path.samefile(exp_assets.joinpath(asset.relative_path, asset.filename),
+                                                 sim_dir.joinpath("Assets", asset.relative_path, asset.filename)))
+        self.assertEqual([], store._unsynced)
+
+        # identical contents are stored once
+        dest = Path(self.job_directory, "staged")
+        dest.mkdir(exist_ok=True)
+        store.stage([(Asset(filename=f"{name}.txt", content="same"), dest.joinpath(f"{name}.txt")) for name in "ab"])
+        self.assertTrue(os.path.samefile(dest.joinpath("a.txt"), dest.joinpath("b.txt")))
+        self.assertEqual(3, os.stat(dest.joinpath("a.txt")).st_nlink)
+        self.assertEqual("same", dest.joinpath("b.txt").read_text())
+
+    @linux_only
+    def test_asset_store_executable(self):
+        platform = Platform('FILE', job_directory=self.job_directory, asset_store=True, sym_link=False)
+        store = platform._assets.store
+        model = Path(self.job_directory, "model.sh")
+        model.write_text("#!/bin/bash\necho model\n")
+        model.chmod(0o755)
+        data = Path(self.job_directory, "data.sh")
+        data.write_text(model.read_text())
+        dest = Path(self.job_directory, "staged")
+        dest.mkdir(exist_ok=True)
+        store.stage([(Asset(absolute_path=str(model)), dest.joinpath("model.sh")),
+                     (Asset(absolute_path=str(data)), dest.joinpath("data.sh"))])
+        # executables keep their exec bits and are stored apart from the same content without them
+        self.assertTrue(os.access(dest.joinpath("model.sh"), os.X_OK))
+        self.assertFalse(os.access(dest.joinpath("data.sh"), os.X_OK))
+        self.assertTrue(os.path.samefile(store.path(calculate_md5(str(model)), executable=True), dest.joinpath("model.sh")))
+        self.assertTrue(os.path.samefile(store.path(calculate_md5(str(model))), dest.joinpath("data.sh")))
+        self.assertEqual("model", subprocess.run([str(dest.joinpath("model.sh"))], capture_output=True,
+                                                 text=True).stdout.strip())
+
     def test_platform_delete_experiment(self):
         experiment = self.create_experiment(self.platform, a=3, b=3)
         suite_dir = self.platform.get_directory(experiment.parent)
@@ -1,6 +1,8 @@
+import asyncio
 import json
 import os
 import pathlib
+import tempfile
 from functools import partial
 from typing import Any, Dict
 
@@ -13,10 +15,15 @@ from idmtools.builders import SimulationBuilder
 from idmtools.core import ItemType
 from idmtools.core.platform_factory import Platform
 from idmtools.entities import Suite
+from idmtools.entities.command_task import CommandTask
 from idmtools.entities.experiment import Experiment
+from idmtools.entities.platform_requirements import PlatformRequirements
 from idmtools.entities.simulation import Simulation
+from idmtools.entities.task_proxy import TaskProxy
 from idmtools.entities.templated_simulation import TemplatedSimulations
 from idmtools_models.python.json_python_task import JSONConfiguredPythonTask
+from idmtools_platform_file.platform_operations.utils import read_job_status
+from idmtools_platform_process.scheduler import ProcessScheduler, SCHEDULER_QUEUE_FILE, run_scheduler, write_queue
 
 from idmtools_test import COMMON_INPUT_PATH
 from idmtools_test.utils.decorators import linux_only
@@ -236,3 +243,107 @@ class TestProcessPlatform(ITestWithPersistence):
         with self.assertRaises(RuntimeError) as context:
             self.platform.get_item(experiment.parent_id, item_type=ItemType.SUITE, raw=True)
         self.assertTrue(f"Not found Suite with id '{experiment.parent_id}'" in str(context.exception.args[0]))
+
+    def test_scheduler(self):
+        platform = Platform('PROCESS', job_directory=self.job_directory, scheduler=True, run_sequence=False, max_job=2)
+        experiment = self.create_experiment(platform=platform, a=3, b=3)
+        self.assertTrue(experiment.succeeded)
+        experiment_dir = platform.get_directory(experiment)
+        with open(experiment_dir.joinpath(SCHEDULER_QUEUE_FILE)) as f:
+            queue = json.load(f)
+        self.assertEqual(queue['max_job'], 2)
+        self.assertEqual(len(queue['simulations']), 9)
+        for simulation in experiment.simulations:
+            simulation_dir = platform.get_directory(simulation)
+            self.assertEqual(read_job_status(simulation_dir), '0')
+            self.assertTrue(simulation_dir.joinpath("output", "result.txt").exists())
+
+    def test_scheduler_resume(self):
+        with tempfile.TemporaryDirectory() as experiment_dir:
+            sims = []
+            for i in range(6):
+                sim_dir = Path(experiment_dir, str(i))
+                sim_dir.mkdir()
+                # simulations write their start order in the experiment directory
+                sim_dir.joinpath("_run.sh").write_text(f'echo {i} >> ../order.txt\necho 0 > job_status.txt\n')
+                sims.append(dict(directory=str(sim_dir), priority=i % 3, cpus=1))
+            # simulation 0 finished and simulation 1 was interrupted in a previous run
+            Path(experiment_dir, "0", "job_status.txt").write_text("0")
+            Path(experiment_dir, "1", "job_status.txt").write_text("100")
+            write_queue(experiment_dir, sims, max_job=1)
+            self.assertTrue(run_scheduler(experiment_dir))
+            with open(Path(experiment_dir, "order.txt")) as f:
+                order = f.read().split()
+            self.assertEqual(order, ['2', '5', '1', '4', '3'])
+            for i in range(6):
+                self.assertEqual(read_job_status(Path(experiment_dir, str(i))), '0')
+
+    def test_scheduler_budget(self):
+        with tempfile.TemporaryDirectory() as experiment_dir:
+            sims = []
+            for i in range(4):
+                sim_dir = Path(experiment_dir, str(i))
+                sim_dir.mkdir()
+                sim_dir.joinpath("_run.sh").write_text('sleep 0.2\nexit 3\n')
+                sims.append(dict(directory=str(sim_dir), cpus=2, memory=100))
+            write_queue(experiment_dir, sims, max_job=4, cpus=4, memory=150)
+            scheduler = ProcessScheduler(experiment_dir)
+            running = []
+            run_simulation = scheduler.run_simulation
+
+            async def track(sim, cpus=None):
+                running.append(len(scheduler._processes))
+                return await run_simulation(sim, cpus)
+
+            scheduler.run_simulation = track
+            asyncio.run(scheduler.run())
+            # the memory budget only fits one simulation at a time
+            self.assertEqual(max(running), 0)
+            for i in range(4):
+                # the scheduler writes the status of simulations exiting without writing it
+                self.assertEqual(read_job_status(Path(experiment_dir, str(i))), '-1')
+
+    def test_scheduler_packing(self):
+        with tempfile.TemporaryDirectory() as experiment_dir:
+            write_queue(experiment_dir, [], max_job=2)
+            scheduler = ProcessScheduler(experiment_dir)
+            large, small = dict(cpus=3), dict(cpus=1)
+            pending = [dict(large, name='a'), dict(large, name='b'), dict(small, name='c'), dict(small, name='d')]
+            # the small simulation fills the cpu left by the large one
+            picked = scheduler.next_simulations(pending, [0, 1, 2, 3], None, 0)
+            self.assertEqual([sim['name'] for sim in picked], ['a', 'c'])
+            self.assertEqual(pending[0]['passed_over'], 1)
+            # once passed over by max_job simulations, the large simulation is not passed over anymore
+            picked = scheduler.next_simulations(pending, [3], None, 1)
+            self.assertEqual([sim['name'] for sim in picked], ['d'])
+            self.assertEqual(pending[0]['passed_over'], 2)
+            pending.append(dict(small, name='e'))
+            self.assertEqual(scheduler.next_simulations(pending, [3], None, 1), [])
+            # a simulation larger than the machine runs alone
+            picked = scheduler.next_simulations([dict(cpus=8), dict(small)], [0, 1, 2, 3], 1000, 0)
+            self.assertEqual(picked, [dict(cpus=8)])
+
+    def test_scheduler_affinity(self):
+        with tempfile.TemporaryDirectory() as experiment_dir:
+            sims = []
+            for i, affinity in enumerate([True, False]):
+                sim_dir = Path(experiment_dir, str(i))
+                sim_dir.mkdir()
+                sim_dir.joinpath("_run.sh").write_text('python3 -c "import os; print(len(os.sched_getaffinity(0)))" > cpus.txt\n')
+                sims.append(dict(directory=str(sim_dir), cpus=1, affinity=affinity))
+            write_queue(experiment_dir, sims, max_job=1)
+            self.assertTrue(run_scheduler(experiment_dir))
+            self.assertEqual(Path(experiment_dir, "0", "cpus.txt").read_text().strip(), '1')
+            self.assertEqual(Path(experiment_dir, "1", "cpus.txt").read_text().strip(), str(len(os.sched_getaffinity(0))))
+
+    def test_simulation_resources(self):
+        platform = Platform('PROCESS', job_directory=self.job_directory, ntasks=2, mem=100, cpu_affinity=True)
+        task = CommandTask(command="python --version")
+        self.assertEqual(platform.get_simulation_resources(Simulation(task=task)), dict(cpus=2, memory=100, affinity=True))
+        task = CommandTask(command="python --version", cores=8, memory=2000)
+        task.add_platform_requirement(PlatformRequirements.GPU)
+        self.assertEqual(platform.get_simulation_resources(Simulation(task=task)), dict(cpus=8, memory=2000, affinity=False))
+        # tasks are replaced by proxies once simulations are created
+        proxy = TaskProxy.from_task(task)
+        self.assertEqual(platform.get_simulation_resources(Simulation(task=proxy)), dict(cpus=8, memory=2000, affinity=False))
+
@@ -3,9 +3,11 @@ SlurmPlatform utilities.
 
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
+import os
+import re
 from pathlib import Path
 from jinja2 import Template
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 from idmtools.entities.experiment import Experiment
 from idmtools_platform_slurm.platform_operations.utils import check_home
 
@@ -14,11 +16,13 @@ if TYPE_CHECKING:
 
 DEFAULT_TEMPLATE_FILE = Path(__file__).parent.joinpath("sbatch.sh.jinja2")
 BATCH_TEMPLATE_FILE = Path(__file__).parent.joinpath("batch.sh.jinja2")
+# Maps the simulation index of an array task to its simulation directory
+MANIFEST_FILE = "simulation_manifest.txt"
 
 
 def generate_batch(platform: 'SlurmPlatform', experiment: Experiment,
                    max_running_jobs: Optional[int] = None, array_batch_size: Optional[int] = None,
-                   dependency: Optional[bool] = None,
+                   dependency: Optional[bool] = None, shared_throttle: Optional[bool] = None,
                    template: Union[Path, str] = BATCH_TEMPLATE_FILE, **kwargs) -> None:
     """
     Generate bash script file batch.sh
@@ -27,13 +31,17 @@ def generate_batch(platform: 'SlurmPlatform', experiment: Experiment,
         experiment: idmtools Experiment
         max_running_jobs: int, how many allowed to run
         array_size: INT, array size for slurm job
-        dependency: bool, determine if Slurm jobs depend on each other
+        dependency: bool, run the array jobs one after the other, each one waiting for the success of the previous one
+        shared_throttle: bool, run the array jobs in lanes sharing max_running_jobs, each one waiting for the end of
+            the previous one in its lane. Defaults to the platform shared_throttle. Overrides dependency
         template: template to be used to build batch file
         kwargs: keyword arguments used to expand functionality
     Returns:
         None
     """
-    template_vars = dict(njobs=experiment.simulation_count)
+    # Each array task runs sims_per_task simulations
+    ntasks = -(-experiment.simulation_count // platform.sims_per_task)
+    template_vars = dict(njobs=ntasks, sims_per_task=platform.sims_per_task)
 
     # Set max_running_jobs
     if max_running_jobs is not None:
@@ -53,19 +61,19 @@ def generate_batch(platform: 'SlurmPlatform', experiment: Experiment,
 
     if platform._max_array_size is not None:
         if platform.array_batch_size is not None:
-            template_vars['array_batch_size'] = min(platform._max_array_size, platform.array_batch_size,
-                                                    experiment.simulation_count)
+            template_vars['array_batch_size'] = min(platform._max_array_size, platform.array_batch_size, ntasks)
         else:
-            template_vars['array_batch_size'] = min(platform._max_array_size, experiment.simulation_count)
+            template_vars['array_batch_size'] = min(platform._max_array_size, ntasks)
     elif platform.array_batch_size is not None:
-        template_vars['array_batch_size'] = min(platform.array_batch_size, experiment.simulation_count)
+        template_vars['array_batch_size'] = min(platform.array_batch_size, ntasks)
     else:
-        template_vars['array_batch_size'] = experiment.simulation_count
+        template_vars['array_batch_size'] = ntasks
 
     # Consider dependency
     if dependency is None:
         dependency = True
     template_vars['dependency'] = dependency
+    template_vars['shared_throttle'] = platform.shared_throttle if shared_throttle is None else shared_throttle
 
     # Update with possible override values
     template_vars.update(kwargs)
@@ -116,6 +124,13 @@ def generate_script(platform: 'SlurmPlatform', experiment: Experiment, max_runni
     if platform.modules:
         template_vars['modules'] = platform.modules
 
+    # Packed simulations of an array task run concurrently on its cpus, MPI simulations run back-to-back
+    template_vars['sims_per_task'] = platform.sims_per_task
+    if platform.ntasks is not None and platform.ntasks > 1:
+        template_vars['task_concurrency'] = 1
+    else:
+        template_vars['task_concurrency'] = min(platform.task_concurrency, platform.cpus_per_task or 1)
+
     with open(template) as file_:
         t = Template(file_.read())
 
@@ -155,3 +170,66 @@ def generate_simulation_script(platform: 'SlurmPlatform', simulation, retries: O
             tout.write(t.render(tvars))
     # Make executable
     platform._op_client.update_script_mode(sim_script)
+
+
+def generate_manifest(platform: 'SlurmPlatform', experiment: Experiment) -> Path:
+    """
+    Generate the manifest simulation_manifest.txt used by run_simulation.sh to find the directory of an array task.
+
+    Line N holds the directory of the simulation with index N. All lines are padded to the same width so a task reads
+    its line at offset (N - 1) * width without listing the experiment directory.
+    Args:
+        platform: Slurm Platform
+        experiment: idmtools Experiment
+    Returns:
+        Path of the manifest
+    """
+    experiment_dir = platform._op_client.get_directory(experiment)
+    with os.scandir(experiment_dir) as entries:
+        sim_dirs = sorted(e.name.encode() for e in entries
+                          if e.is_dir() and e.name != 'Assets' and not e.name.startswith('.'))
+    width = max((len(name) for name in sim_dirs), default=0)
+    output_target = experiment_dir.joinpath(MANIFEST_FILE)
+    with open(output_target, "wb") as tout:
+        tout.write(b''.join(name.ljust(width) + b'\n' for name in sim_dirs))
+    return output_target
+
+
+def get_array_task_directories(experiment_dir: Union[Path, str], job_ids: List[str]) -> Dict[str, List[str]]:
+    """
+    Map the Slurm array tasks of an experiment to their simulation directory.
+
+    batch.sh submits the array jobs listed in job_id.txt in order, each covering array_batch_size simulations of the
+    manifest: task N of the k-th array job is the task k * array_batch_size + N, which runs the sims_per_task
+    simulations following line (k * array_batch_size + N - 1) * sims_per_task of the manifest.
+    Args:
+        experiment_dir: experiment directory
+        job_ids: array job ids, in submission order
+    Returns:
+        Dict of <array job id>_<task id> as key and the simulation directory names as value. Empty without manifest
+    """
+    manifest = Path(experiment_dir, MANIFEST_FILE)
+    if not manifest.exists():
+        return {}
+    with open(manifest) as f:
+        sim_dirs = [line.rstrip() for line in f]
+    batch_size, sims_per_task = None, 1
+    batch_file = Path(experiment_dir, "batch.sh")
+    if batch_file.exists():
+        content = batch_file.read_text()
+        match = re.search(r'^batch_size=(\d+)', content, re.MULTILINE)
+        if match:
+            batch_size = int(match.group(1))
+        match = re.search(r'^sims_per_task=(\d+)', content, re.MULTILINE)
+        if match:
+            sims_per_task = int(match.group(1))
+    ntasks = -(-len(sim_dirs) // sims_per_task)
+    batch_size = batch_size or ntasks
+
+    tasks = {}
+    for k, job_id in enumerate(job_ids):
+        offset = k * batch_size
+        for task_id in range(1, min(batch_size, ntasks - offset) + 1):
+            first = (offset + task_id - 1) * sims_per_task
+            tasks[f"{job_id}_{task_id}"] = sim_dirs[first:first + sims_per_task]
+    return tasks
@@ -0,0 +1,208 @@
+"""
+Here we implement the content-addressed asset store used to stage assets on SlurmPlatform.
+
+Each distinct asset content is written once under the store, named by its md5 checksum. Experiment and simulation
+directories then receive hard links (or reflinks, or copies when neither is supported) to the stored files, so identical
+assets shared by many simulations are written only once. Stored files are read-only, because every hard link shares the
+same content, and keep the exec bits of their source: executable and non executable files with the same content are
+stored separately, as links share their mode. Newly stored files are synced to disk together by :meth:`AssetStore.sync`, once all the items are created.
+
+Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
+"""
+import os
+import shutil
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger, DEBUG
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+from uuid import uuid4
+from idmtools.assets import Asset
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+logger = getLogger(__name__)
+
+ASSET_STORE_DIRECTORY = '.asset_store'
+# ioctl request cloning a file on file systems supporting reflinks (Linux FICLONE)
+FICLONE = 0x40049409
+# Below this number of files, files are staged serially
+MIN_PARALLEL_STAGING = 8
+
+
+def reflink_file(src: Union[Path, str], dest: Union[Path, str]) -> None:
+    """
+    Clone a file, sharing its content until one of the copies is modified.
+    Args:
+        src: source file
+        dest: destination file
+    Returns:
+        None
+    Raises:
+        OSError: If the file system does not support reflinks
+    """
+    if fcntl is None:
+        raise OSError("Reflinks are not supported on this system")
+    with open(src, 'rb') as fin, open(dest, 'wb') as fout:
+        fcntl.ioctl(fout.fileno(), FICLONE, fin.fileno())
+
+
+def link_or_copy(src: Union[Path, str], dest: Union[Path, str]) -> None:
+    """
+    Hard link a file. Fallback to a reflink, then to a copy, when the file system does not support it.
+    Args:
+        src: source file
+        dest: destination file
+    Returns:
+        None
+    """
+    if os.path.lexists(dest):
+        os.unlink(dest)
+    try:
+        os.link(src, dest)
+        return
+    except OSError:
+        pass
+    try:
+        reflink_file(src, dest)
+        shutil.copymode(src, dest)
+    except OSError:
+        shutil.copy(src, dest)
+
+
+def is_executable(asset: Asset) -> bool:
+    """
+    Whether an asset is staged as an executable file, i.e. it is read from a file executable by its owner.
+    Args:
+        asset: asset
+    Returns:
+        True/False
+    """
+    return bool(asset.absolute_path) and bool(os.stat(asset.absolute_path).st_mode & stat.S_IXUSR)
+
+
+class AssetStore:
+    """
+    Content-addressed store of asset files.
+    """
+
+    def __init__(self, directory: Union[Path, str], max_workers: int = None):
+        """
+        Constructor.
+        Args:
+            directory: store directory
+            max_workers: maximum number of files written at the same time
+        """
+        self.directory = Path(directory)
+        self.max_workers = max_workers
+        self._unsynced: List[Path] = []
+        self._lock = threading.Lock()
+
+    def path(self, checksum: str, executable: bool = False) -> Path:
+        """
+        Path of a stored content.
+        Args:
+            checksum: md5 checksum of the content
+            executable: whether the stored file is executable
+        Returns:
+            Path of the stored file
+        """
+        return self.directory.joinpath(checksum[:2], f"{checksum}.x" if executable else checksum)
+
+    def stage(self, assets: List[Tuple[Asset, Path]]) -> None:
+        """
+        Stage assets to their destination files.
+
+        Contents missing from the store are written first, then the destination files are linked to them.
+        Args:
+            assets: list of (asset, destination file)
+        Returns:
+            None
+        """
+        # content is addressed by checksum, hash the assets which do not have one yet in parallel
+        self._map(Asset.calculate_checksum, [asset for asset, _ in assets if not asset.checksum])
+        stored: Dict[Tuple[str, bool], Asset] = {}
+        links = []
+        for asset, dest in assets:
+            key = asset.calculate_checksum(), is_executable(asset)
+            stored.setdefault(key, asset)
+            links.append((self.path(*key), dest))
+
+        written = [path for path in self._map(self._write, stored.items()) if path is not None]
+        with self._lock:
+            self._unsynced.extend(written)
+        self._map(lambda link: link_or_copy(*link), links)
+
+    def sync(self) -> None:
+        """
+        Sync the files stored since the last sync to disk, and each of their directories once.
+        Returns:
+            None
+        """
+        with self._lock:
+            paths, self._unsynced = self._unsynced, []
+        self._map(self._sync_file, paths)
+        if os.name == 'nt':
+            return
+        for directory in set(path.parent for path in paths):
+            fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def _map(self, func, items) -> List:
+        """
+        Apply a function to items, on a thread pool when there are enough items.
+        Args:
+            func: function to apply
+            items: items
+        Returns:
+            Results of the function
+        """
+        items = list(items)
+        if len(items) < MIN_PARALLEL_STAGING:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(func, items))
+
+    def _write(self, item: Tuple[Tuple[str, bool], Asset]) -> Union[Path, None]:
+        """
+        Write a content to the store, unless it is already stored.
+        Args:
+            item: ((checksum, executable), asset)
+        Returns:
+            Path of the stored file, None if it was already stored
+        """
+        (checksum, executable), asset = item
+        path = self.path(checksum, executable)
+        if path.exists():
+            return None
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file and move it in place, so concurrent writers never expose a partial file
+        tmp = path.with_name(f'.{checksum}.{uuid4().hex}.tmp')
+        if asset.absolute_path:
+            shutil.copyfile(asset.absolute_path, tmp)
+        else:
+            tmp.write_bytes(asset.bytes)
+        os.chmod(tmp, 0o555 if executable else 0o444)
+        os.replace(tmp, path)
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(f"Stored {asset.filename} as {path}")
+        return path
+
+    @staticmethod
+    def _sync_file(path: Path) -> None:
+        """
+        Sync a file to disk.
+        Args:
+            path: file
+        Returns:
+            None
+        """
+        with open(path, 'rb') as f:
+            os.fsync(f.fileno())
@@ -14,6 +14,7 @@ from idmtools.core import ItemType
 from idmtools.entities import Suite
 from idmtools.entities.experiment import Experiment
 from idmtools.entities.iplatform_ops.iplatform_experiment_operations import IPlatformExperimentOperations
+from idmtools_platform_slurm.assets import generate_manifest
 from idmtools_platform_slurm.platform_operations.utils import SlurmExperiment, SlurmSimulation, SlurmSuite, \
     add_dummy_suite
 from logging import getLogger
@@ -93,9 +94,10 @@ class SlurmPlatformExperimentOperations(IPlatformExperimentOperations):
         """
         sim_list = []
         sim_meta_list = self.platform._metas.get_children(experiment)
+        statuses = self.platform._op_client.get_simulation_statuses(experiment) if sim_meta_list else {}
         for meta in sim_meta_list:
             slurm_sim = SlurmSimulation(meta)
-            slurm_sim.status = self.platform._op_client.get_simulation_status(slurm_sim.id)
+            slurm_sim.status = statuses.get(slurm_sim.id) or self.platform._op_client.get_simulation_status(slurm_sim.id)
             if raw:
                 sim_list.append(slurm_sim)
             else:
@@ -117,6 +119,18 @@ class SlurmPlatformExperimentOperations(IPlatformExperimentOperations):
         else:
             return self.platform._suites.get(experiment.parent_id, raw=True, **kwargs)
 
+    def pre_run_item(self, experiment: Experiment, **kwargs):
+        """
+        Create the experiment and its simulations, then sync their stored assets to disk.
+        Args:
+            experiment: idmtools Experiment
+            kwargs: keyword arguments used to expand functionality
+        Returns:
+            None
+        """
+        super().pre_run_item(experiment, **kwargs)
+        self.platform._assets.sync_assets()
+
     def platform_run_item(self, experiment: Experiment, dry_run: bool = False, **kwargs):
         """
         Run experiment.
@@ -132,6 +146,8 @@ class SlurmPlatformExperimentOperations(IPlatformExperimentOperations):
         self.platform._metas.dump(experiment.parent)
         # Generate/update metadata
         self.platform._metas.dump(experiment)
+        # Map array task indexes to simulation directories
+        generate_manifest(self.platform, experiment)
         # Commission
         if not dry_run:
             self.platform._op_client.submit_job(experiment, **kwargs)
@@ -232,9 +248,10 @@ class SlurmPlatformExperimentOperations(IPlatformExperimentOperations):
             logger.debug(f'job_id is not available for experiment: {experiment.id}')
             return
 
-        # Refresh status for each simulation
+        # Refresh status of all simulations at once
+        statuses = self.platform._op_client.get_simulation_statuses(experiment, **kwargs)
         for sim in experiment.simulations:
-            sim.status = self.platform._op_client.get_simulation_status(sim.id, **kwargs)
+            sim.status = statuses.get(sim.id) or self.platform._op_client.get_simulation_status(sim.id, **kwargs)
 
     def create_sim_directory_map(self, experiment_id: str) -> Dict:
         """
@@ -5,7 +5,9 @@ Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
 import os
 import subprocess
-from typing import Dict
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Union
 from idmtools.core import ItemType
 from idmtools.entities import Suite
 from idmtools.entities.experiment import Experiment
@@ -13,6 +15,10 @@ from logging import getLogger
 
 logger = getLogger(__name__)
 
+JOB_STATUS_FILE = 'job_status.txt'
+# below this number of simulations, status files are read serially
+MIN_PARALLEL_STATUS_READS = 64
+
 
 class SlurmItem:
     """
@@ -73,6 +79,49 @@ def clean_experiment_name(experiment_name: str) -> str:
     return experiment_name.encode("ascii", "ignore").decode('utf8').strip()
 
 
+def read_job_status(sim_dir: Union[Path, str]) -> Optional[str]:
+    """
+    Read the raw job status of a simulation.
+    Args:
+        sim_dir: simulation directory
+    Returns:
+        content of job_status.txt or None if the simulation has not started
+    """
+    try:
+        with open(os.path.join(sim_dir, JOB_STATUS_FILE)) as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def get_simulation_directories(exp_dir: Union[Path, str]) -> Dict[str, str]:
+    """
+    List the simulation directories of an experiment with a single directory scan.
+    Args:
+        exp_dir: experiment directory
+    Returns:
+        Dict of directory name as key and directory path as value
+    """
+    with os.scandir(exp_dir) as entries:
+        return {entry.name: entry.path for entry in entries
+                if entry.name != 'Assets' and not entry.name.startswith('.') and entry.is_dir()}
+
+
+def read_job_statuses(sim_dirs: Dict[str, Union[Path, str]], max_workers: int = None) -> Dict[str, Optional[str]]:
+    """
+    Read the raw job status of many simulations, concurrently for large experiments.
+    Args:
+        sim_dirs: Dict of simulation id as key and simulation directory as value
+        max_workers: maximum number of threads reading the status files
+    Returns:
+        Dict of simulation id as key and raw job status (or None) as value
+    """
+    if len(sim_dirs) < MIN_PARALLEL_STATUS_READS:
+        return {sim_id: read_job_status(sim_dir) for sim_id, sim_dir in sim_dirs.items()}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(sim_dirs.keys(), pool.map(read_job_status, sim_dirs.values())))
+
+
 def add_dummy_suite(experiment: Experiment, suite_name: str = None, tags: Dict = None) -> Suite:
     """
     Create Suite parent for given experiment
@@ -114,6 +163,45 @@ def get_max_array_size():
     return None
 
 
+def query_job_states(job_ids: List[str]) -> Dict[str, str]:
+    """
+    Query the accounting state of Slurm jobs, including all their array tasks, with a single sacct call.
+    Args:
+        job_ids: Slurm job ids
+    Returns:
+        Dict of job id as key (<array job id>_<task id> for array tasks) and Slurm state as value. Empty if the
+        accounting is not available
+    """
+    if not job_ids:
+        return {}
+    try:
+        output = subprocess.check_output(['sacct', f'--jobs={",".join(job_ids)}', '--noheader', '--parsable2',
+                                          '--format=JobID,State'], stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError) as ex:
+        logger.debug(f"Could not query Slurm accounting: {ex}")
+        return {}
+    return parse_job_states(output.decode())
+
+
+def parse_job_states(output: str) -> Dict[str, str]:
+    """
+    Parse the output of sacct --parsable2 --format=JobID,State.
+
+    Job steps (<job id>.batch, <job id>.0, ...) and pending ranges of array tasks (<job id>_[1-10]) are skipped.
+    Args:
+        output: sacct output
+    Returns:
+        Dict of job id as key and Slurm state (e.g. 'CANCELLED' for 'CANCELLED by 1000') as value
+    """
+    states = {}
+    for line in output.splitlines():
+        job_id, _, state = line.strip().partition('|')
+        if not state or '.' in job_id or '[' in job_id:
+            continue
+        states[job_id] = state.split()[0].rstrip('+')
+    return states
+
+
 def check_home(directory: str) -> bool:
     """
     Check if a directory is under HOME.
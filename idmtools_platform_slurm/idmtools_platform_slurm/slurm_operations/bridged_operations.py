@@ -3,23 +3,361 @@ Here we implement the SlurmPlatform bridged operations.
 
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
+import atexit
 import json
 import os
+import socket
+import threading
 import time
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from logging import getLogger, INFO, DEBUG
 from pathlib import Path
-from typing import Union, Any, List
+from typing import Union, Any, List, Dict, Optional, Tuple
 from uuid import uuid4
 from idmtools.entities.experiment import Experiment
 from idmtools.entities.simulation import Simulation
 from idmtools_platform_slurm.slurm_operations.local_operations import LocalSlurmOperations
 
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover
+    FileSystemEventHandler = object
+    Observer = None
+
 logger = getLogger(__name__)
 
+# Seconds to wait for the bridge to answer, per request of a message
+BRIDGE_TIMEOUT = 15
+# Bounds of the interval between two checks of the results directory
+MIN_POLL_INTERVAL = 0.05
+MAX_POLL_INTERVAL = 1
+# Subdirectory of the bridged jobs directory where job files are written before being moved in place
+PENDING_DIRECTORY = '.pending'
+
+# Watcher and observer of each results directory, shared by all the messages
+_results_watchers: Dict[str, Tuple[Optional['BridgeResultsWatcher'], Any]] = {}
+_results_watchers_lock = threading.Lock()
+# Bridged jobs directories of the bridges answering batched messages with an error, i.e. older bridges
+_unbatched_bridges = set()
+
+
+class BridgeResultsWatcher(FileSystemEventHandler):
+    """
+    Signal when the result files of messages appear in a results directory.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        super().__init__()
+        self._waiting: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def watch(self, result_file: Path) -> threading.Event:
+        """
+        Start waiting for a result file.
+        Args:
+            result_file: result file to wait for
+        Returns:
+            Event set when the result file is written
+        """
+        found = threading.Event()
+        with self._lock:
+            self._waiting[result_file.name] = found
+        return found
+
+    def unwatch(self, result_file: Path) -> None:
+        """
+        Stop waiting for a result file.
+        Args:
+            result_file: result file
+        Returns:
+            None
+        """
+        with self._lock:
+            self._waiting.pop(result_file.name, None)
+
+    def on_any_event(self, event):
+        """
+        Handle any file system event.
+        Args:
+            event: watchdog event
+        Returns:
+            None
+        """
+        path = getattr(event, 'dest_path', None) or event.src_path
+        with self._lock:
+            found = self._waiting.get(os.path.basename(path))
+        if found is not None:
+            found.set()
+
+
+def get_results_watcher(results_directory: Path) -> Optional[BridgeResultsWatcher]:
+    """
+    Get the watcher of a results directory. A single observer thread watches each directory.
+    Args:
+        results_directory: Results directory
+    Returns:
+        Watcher, or None when the directory cannot be watched and results are polled instead
+    """
+    if Observer is None:
+        return None
+    key = str(Path(results_directory).resolve())
+    with _results_watchers_lock:
+        watcher, observer = _results_watchers.get(key, (None, None))
+        if key in _results_watchers and (observer is None or observer.is_alive()):
+            return watcher
+        watcher = BridgeResultsWatcher()
+        try:
+            observer = Observer()
+            observer.schedule(watcher, key, recursive=False)
+            observer.start()
+        except OSError as ex:
+            logger.debug(f"Could not watch {key}, polling bridge results instead: {ex}")
+            watcher = observer = None
+        _results_watchers[key] = watcher, observer
+        return watcher
+
+
+def stop_results_watchers() -> None:
+    """
+    Stop watching the results directories.
+    Returns:
+        None
+    """
+    with _results_watchers_lock:
+        observers = [observer for _, observer in _results_watchers.values() if observer is not None]
+        _results_watchers.clear()
+    for observer in observers:
+        observer.stop()
+    for observer in observers:
+        observer.join()
+
+
+atexit.register(stop_results_watchers)
+
+
+def read_bridge_result(result_file: Path) -> Optional[Dict]:
+    """
+    Read the result of a message.
+    Args:
+        result_file: result file
+    Returns:
+        Result or None if the result is not (fully) written yet
+    """
+    try:
+        with open(result_file, 'r') as rin:
+            return json.load(rin)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def wait_for_bridge_result(result_file: Path, found: threading.Event, timeout: float) -> Optional[Dict]:
+    """
+    Wait for the result of a message.
+
+    The results directory is checked each time a file system event reports the result file, and with a growing interval
+    otherwise, so results are picked up as soon as they are written even when events are not available.
+    Args:
+        result_file: result file
+        found: event set when the result file is written
+        timeout: maximum time to wait in seconds
+    Returns:
+        Result or None if the bridge did not answer in time
+    """
+    deadline = time.monotonic() + timeout
+    interval = MIN_POLL_INTERVAL
+    while True:
+        result = read_bridge_result(result_file)
+        if result is not None:
+            if logger.isEnabledFor(DEBUG):
+                logger.debug(f"Found result job: {result_file}")
+            return result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        found.wait(min(interval, remaining))
+        found.clear()
+        interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+
+def send_bridge_file_message(message: Dict, bridged_jobs_directory, results_directory, timeout: float,
+                             cleanup_results: bool = True) -> Optional[Dict]:
+    """
+    Send a message to the bridge through the bridged jobs directory.
+    Args:
+        message: message to send
+        bridged_jobs_directory: Jobs Directory
+        results_directory: Results directory
+        timeout: maximum time to wait for the result in seconds
+        cleanup_results: Should we clean up results file
+    Returns:
+        Result or None if the bridge did not answer in time
+    """
+    bridged_id = str(uuid4())
+    jn = Path(bridged_jobs_directory).joinpath(f'{bridged_id}.json')
+    rf = Path(results_directory).joinpath(f'{bridged_id}.json.result')
+    rf.parent.mkdir(parents=True, exist_ok=True)
+
+    # watch before writing the job so the result cannot be missed
+    watcher = get_results_watcher(rf.parent)
+    found = watcher.watch(rf) if watcher is not None else threading.Event()
+    try:
+        # write the job next to the jobs directory and move it in place, so the bridge never reads it partially
+        pending = Path(bridged_jobs_directory).joinpath(PENDING_DIRECTORY, jn.name)
+        pending.parent.mkdir(parents=True, exist_ok=True)
+        with open(pending, "w") as jout:
+            if logger.isEnabledFor(DEBUG):
+                logger.debug(f"Requesting job: {jn}")
+            json.dump(message, jout)
+        os.replace(pending, jn)
+        result = wait_for_bridge_result(rf, found, timeout)
+    finally:
+        if watcher is not None:
+            watcher.unwatch(rf)
+
+    if result is not None and cleanup_results:
+        try:
+            if logger.isEnabledFor(DEBUG):
+                logger.debug(f"Removing result: {rf}")
+            os.unlink(rf)
+        except OSError:
+            pass
+    return result
+
+
+def send_bridge_socket_message(message: Dict, socket_path, timeout: float) -> Dict:
+    """
+    Send a message to the bridge through its Unix socket.
+    Args:
+        message: message to send
+        socket_path: Bridge socket
+        timeout: maximum time to wait for the result in seconds
+    Returns:
+        Result or None if the bridge did not answer. The bridge may have received the message, so it must not be sent
+        again
+    Raises:
+        OSError: If the bridge cannot be reached
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        try:
+            sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+            with sock.makefile('rb') as reader:
+                line = reader.readline()
+        except OSError as ex:
+            logger.warning(f"Bridge socket {socket_path} did not answer: {ex}")
+            return None
+    try:
+        return json.loads(line)
+    except ValueError:
+        logger.warning(f"Bridge socket {socket_path} closed without a valid answer: {line[:200]}")
+        return None
+
+
+def send_bridge_message(message: Dict, bridged_jobs_directory, results_directory, socket_path, timeout: float,
+                        cleanup_results: bool = True) -> Optional[Dict]:
+    """
+    Send a message to the bridge.
+
+    The bridge socket is used when it exists. The message goes through the bridged jobs directory otherwise, or when
+    the socket refuses the connection. Once the message went through the socket, it is never sent again.
+    Args:
+        message: message to send
+        bridged_jobs_directory: Jobs Directory
+        results_directory: Results directory
+        socket_path: Bridge socket
+        timeout: maximum time to wait for the result in seconds
+        cleanup_results: Should we clean up results file
+    Returns:
+        Result or None if the bridge did not answer in time
+    """
+    if socket_path and Path(socket_path).is_socket():
+        try:
+            return send_bridge_socket_message(message, socket_path, timeout)
+        except OSError as ex:
+            logger.debug(f"Could not connect to bridge socket {socket_path}, using bridge files instead: {ex}")
+    return send_bridge_file_message(message, bridged_jobs_directory, results_directory, timeout, cleanup_results)
+
+
+def send_bridge_requests(requests: List[Dict], bridged_jobs_directory, results_directory, socket_path=None,
+                         cleanup_results: bool = True) -> Optional[List[Dict]]:
+    """
+    Send requests to the bridge in a single message.
+
+    A single request is sent on its own. Bridges answering a batched message with an error, i.e. bridges from before
+    batched messages, are sent the requests one by one instead.
+    Args:
+        requests: requests to send
+        bridged_jobs_directory: Jobs Directory
+        results_directory: Results directory
+        socket_path: Bridge socket
+        cleanup_results: Should we clean up results file
+    Returns:
+        Result of each request, in order, or None if the bridge never answered
+    """
+    bridge = str(bridged_jobs_directory)
+    if len(requests) > 1 and bridge not in _unbatched_bridges:
+        result = send_bridge_message(dict(requests=requests), bridged_jobs_directory, results_directory, socket_path,
+                                     BRIDGE_TIMEOUT * len(requests), cleanup_results)
+        if result is None:
+            if logger.isEnabledFor(DEBUG):
+                logger.debug("Failed to get result from bridge")
+            return None
+        if isinstance(result.get('results'), list) and len(result['results']) == len(requests):
+            return result['results']
+        logger.warning(f"The bridge does not support batched requests ({result.get('output')}), sending them one by "
+                       f"one. Update idmtools-slurm-utils on the host to send them together.")
+        _unbatched_bridges.add(bridge)
+
+    results = []
+    for request in requests:
+        result = send_bridge_message(request, bridged_jobs_directory, results_directory, socket_path, BRIDGE_TIMEOUT,
+                                     cleanup_results)
+        if result is None:
+            if logger.isEnabledFor(DEBUG):
+                logger.debug("Failed to get result from bridge")
+            return None
+        results.append(result)
+    return results
+
+
+def create_bridged_jobs(working_directories: List, bridged_jobs_directory, results_directory,
+                        cleanup_results: bool = True, socket_path=None) -> List[Dict]:
+    """
+    Creates bridged jobs in a single message.
+
+    Args:
+        working_directories: Work Directories
+        bridged_jobs_directory: Jobs Directory
+        results_directory: Results directory
+        cleanup_results: Should we clean up results file
+        socket_path: Bridge socket
+
+    Returns:
+        Result of each job
+
+    Raises:
+        ValueError: If the bridge never reported the results or could not submit a job
+    """
+    requests = [dict(command='bash', working_directory=str(working_directory))
+                for working_directory in working_directories]
+    results = send_bridge_requests(requests, bridged_jobs_directory, results_directory, socket_path, cleanup_results)
+    if results is None:
+        raise ValueError("FAILED: Bridge never reported result")
+    errors = [f"{working_directory}: {result.get('output')} (return code {result.get('return_code')})"
+              for working_directory, result in zip(working_directories, results) if result.get('status') == 'error']
+    if errors:
+        raise ValueError("FAILED: Bridge could not submit jobs. " + "; ".join(errors))
+    return results
+
 
 def create_bridged_job(working_directory, bridged_jobs_directory, results_directory,
-                       cleanup_results: bool = True) -> None:
+                       cleanup_results: bool = True, socket_path=None) -> None:
     """
     Creates a bridged job.
 
@@ -28,43 +366,16 @@ def create_bridged_job(working_directory, bridged_jobs_directory, results_direct
         bridged_jobs_directory: Jobs Directory
         results_directory: Results directory
         cleanup_results: Should we clean up results file
+        socket_path: Bridge socket
 
     Returns:
         None
     """
-    bridged_id = str(uuid4())
-    jn = Path(bridged_jobs_directory).joinpath(f'{bridged_id}.json')
-    rf = Path(results_directory).joinpath(f'{bridged_id}.json.result')
-    with open(jn, "w") as jout:
-        info = dict(command='bash', working_directory=str(working_directory))
-        if logger.isEnabledFor(DEBUG):
-            logger.debug(f"Requesting job: {jn} in {working_directory}")
-        json.dump(info, jout)
-
-    tries = 0
-    while tries < 15:
-        time.sleep(1)
-        if Path(rf).exists():
-            if logger.isEnabledFor(DEBUG):
-                logger.debug(f"Found result job: {rf}")
-            with open(rf, 'r') as rin:
-                result = json.load(rin)
-            if cleanup_results:
-                try:
-                    if logger.isEnabledFor(DEBUG):
-                        logger.debug(f"Removing result: {rf}")
-                    os.unlink(rf)
-                except:
-                    pass
-            return
-        tries += 1
-    if logger.isEnabledFor(DEBUG):
-        logger.debug(f"Failed to get result from bridge")
-    raise ValueError("FAILED: Bridge never reported result")
+    create_bridged_jobs([working_directory], bridged_jobs_directory, results_directory, cleanup_results, socket_path)
 
 
 def cancel_bridged_job(job_ids: Union[str, List[str]], bridged_jobs_directory, results_directory,
-                       cleanup_results: bool = True) -> Any:
+                       cleanup_results: bool = True, socket_path=None) -> Any:
     """
     Cancel a bridged job.
 
@@ -73,6 +384,7 @@ def cancel_bridged_job(job_ids: Union[str, List[str]], bridged_jobs_directory, r
         bridged_jobs_directory: Work Directory
         results_directory: Results directory
         cleanup_results: Should we clean up results file
+        socket_path: Bridge socket
 
     Returns:
         Result from scancel job
@@ -80,39 +392,16 @@ def cancel_bridged_job(job_ids: Union[str, List[str]], bridged_jobs_directory, r
     if isinstance(job_ids, str):
         job_ids = [job_ids]
 
-    bridged_id = str(uuid4())
-    jn = Path(bridged_jobs_directory).joinpath(f'{bridged_id}.json')
-    rf = Path(results_directory).joinpath(f'{bridged_id}.json.result')
-    with open(jn, "w") as jout:
-        info = dict(command='scancel', job_ids=job_ids)
-        if logger.isEnabledFor(DEBUG):
-            logger.debug(f"Cancel job: {jn}")
-        json.dump(info, jout)
-
-    tries = 0
-    while tries < 15:
-        time.sleep(1)
-        if Path(rf).exists():
-            if logger.isEnabledFor(DEBUG):
-                logger.debug(f"Found result job: {rf}")
-            with open(rf, 'r') as rin:
-                result = json.load(rin)
-            if cleanup_results:
-                try:
-                    if logger.isEnabledFor(DEBUG):
-                        logger.debug(f"Removing result: {rf}")
-                    os.unlink(rf)
-                except:
-                    pass
-            return result['output']
-        tries += 1
-    if logger.isEnabledFor(DEBUG):
-        logger.debug(f"Failed to get result from bridge")
-    return "FAILED: Bridge never reported result"
+    results = send_bridge_requests([dict(command='scancel', job_ids=job_ids)], bridged_jobs_directory,
+                                   results_directory, socket_path, cleanup_results)
+    if results is None:
+        return "FAILED: Bridge never reported result"
+    return results[0]['output']
 
 
 @dataclass
 class BridgedLocalSlurmOperations(LocalSlurmOperations):
+    _pending_submissions: Optional[List[Path]] = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
         if not isinstance(self.platform.bridged_jobs_directory, Path):
@@ -133,8 +422,11 @@ class BridgedLocalSlurmOperations(LocalSlurmOperations):
         """
         if isinstance(item, Experiment):
             working_directory = self.get_directory(item)
-            create_bridged_job(working_directory, self.platform.bridged_jobs_directory,
-                               self.platform.bridged_results_directory)
+            if self._pending_submissions is not None:
+                self._pending_submissions.append(working_directory)
+            else:
+                create_bridged_job(working_directory, self.platform.bridged_jobs_directory,
+                                   self.platform.bridged_results_directory, socket_path=self.platform.bridged_socket)
         elif isinstance(item, Simulation):
             pass
         else:
@@ -150,4 +442,24 @@ class BridgedLocalSlurmOperations(LocalSlurmOperations):
             Any
         """
         return cancel_bridged_job(job_ids, self.platform.bridged_jobs_directory,
-                                  self.platform.bridged_results_directory)
+                                  self.platform.bridged_results_directory, socket_path=self.platform.bridged_socket)
+
+    @contextmanager
+    def batch_submissions(self):
+        """
+        Send the jobs submitted in the context to the bridge in a single message when the context exits.
+        Returns:
+            None
+        """
+        if self._pending_submissions is not None:
+            # already batching
+            yield
+            return
+        self._pending_submissions = []
+        try:
+            yield
+            if self._pending_submissions:
+                create_bridged_jobs(self._pending_submissions, self.platform.bridged_jobs_directory,
+                                    self.platform.bridged_results_directory, socket_path=self.platform.bridged_socket)
+        finally:
+            self._pending_submissions = None
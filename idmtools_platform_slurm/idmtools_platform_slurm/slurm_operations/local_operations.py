@@ -11,15 +11,17 @@ from dataclasses import dataclass
 from logging import getLogger
 from pathlib import Path
 from idmtools import IdmConfigParser
-from typing import Union, Any, List
+from typing import Union, Any, List, Dict, Optional
 from idmtools.core import ItemType, EntityStatus, TRUTHY_VALUES
 from idmtools.entities import Suite
 from idmtools.entities.experiment import Experiment
 from idmtools.entities.simulation import Simulation
-from idmtools_platform_slurm.assets import generate_batch, generate_script, generate_simulation_script
-from idmtools_platform_slurm.platform_operations.utils import clean_experiment_name
+from idmtools_platform_slurm.assets import generate_batch, generate_script, generate_simulation_script, \
+    get_array_task_directories
+from idmtools_platform_slurm.platform_operations.utils import SlurmExperiment, clean_experiment_name, \
+    read_job_status, read_job_statuses, get_simulation_directories, query_job_states
 from idmtools_platform_slurm.slurm_operations.operations_interface import SlurmOperations
-from idmtools_platform_slurm.slurm_operations.slurm_constants import SLURM_MAPS
+from idmtools_platform_slurm.slurm_operations.slurm_constants import SLURM_MAPS, SLURM_ENDED_STATES
 
 from idmtools.utils.decorators import check_symlink_capabilities
 
@@ -98,6 +100,9 @@ class LocalSlurmOperations(SlurmOperations):
         Returns:
             item file directory
         """
+        entry = self.platform._metas.index.get(str(item_id), item_type)
+        if entry is not None:
+            return Path(entry['dir'])
         metas = self.platform._metas.filter(item_type=item_type, property_filter={'id': str(item_id)})
         if len(metas) > 0:
             return Path(metas[0]['dir'])
@@ -204,17 +209,21 @@ class LocalSlurmOperations(SlurmOperations):
             logger.debug(f"Failed to change file mode for executable: {exe}")
 
     def create_batch_file(self, item: Union[Experiment, Simulation], max_running_jobs: int = None, retries: int = None,
-                          array_batch_size: int = None, dependency: bool = True, **kwargs) -> None:
+                          array_batch_size: int = None, dependency: bool = True, shared_throttle: bool = None,
+                          **kwargs) -> None:
         """
         Create batch file.
         Args:
             item: the item to build batch file for
+            shared_throttle: run the array jobs in lanes sharing max_running_jobs. Defaults to the platform one
             kwargs: keyword arguments used to expand functionality.
         Returns:
             None
         """
         if isinstance(item, Experiment):
-            generate_batch(self.platform, item, max_running_jobs, array_batch_size, dependency)
+            if shared_throttle is None:
+                shared_throttle = self.platform.shared_throttle
+            generate_batch(self.platform, item, max_running_jobs, array_batch_size, dependency, shared_throttle)
             generate_script(self.platform, item, max_running_jobs)
         elif isinstance(item, Simulation):
             generate_simulation_script(self.platform, item, retries)
@@ -251,17 +260,86 @@ class LocalSlurmOperations(SlurmOperations):
         sim_dir = self.get_directory_by_id(sim_id, ItemType.SIMULATION)
 
         # Check process status
-        job_status_path = sim_dir.joinpath('job_status.txt')
-        if job_status_path.exists():
-            status = open(job_status_path).read().strip()
-            if status in ['100', '0', '-1']:
-                status = SLURM_MAPS[status]
-            else:
-                status = SLURM_MAPS['100']  # To be safe
+        return self._to_entity_status(read_job_status(sim_dir))
+
+    def get_simulation_statuses(self, experiment: Union[Experiment, SlurmExperiment], **kwargs) -> Dict[str, EntityStatus]:
+        """
+        Retrieve the status of all simulations of an experiment at once.
+
+        The experiment directory is scanned once and the job status files are read concurrently instead of looking up
+        the directory of each simulation by id. Simulations without a directory are not included in the result.
+        Args:
+            experiment: idmtools Experiment or SlurmExperiment
+            kwargs: keyword arguments used to expand functionality
+        Returns:
+            Dict of simulation id as key and EntityStatus as value
+        """
+        exp_dir = self.get_directory_by_id(experiment.id, ItemType.EXPERIMENT)
+        dir_paths = get_simulation_directories(exp_dir)
+        if isinstance(experiment, Experiment):
+            sim_dirs = {}
+            for sim in experiment.simulations:
+                dir_name = self.entity_display_name(sim)
+                if dir_name in dir_paths:
+                    sim_dirs[sim.id] = dir_paths[dir_name]
         else:
-            status = SLURM_MAPS['None']
+            # simulation directories are named <id> or <name>_<id>
+            sim_dirs = {dir_name.rsplit('_', 1)[-1]: path for dir_name, path in dir_paths.items()}
+        statuses = read_job_statuses(sim_dirs, max_workers=kwargs.get('max_workers'))
+        statuses = {sim_id: self._to_entity_status(status) for sim_id, status in statuses.items()}
+        if self.platform.status_backend == 'sacct':
+            self._merge_job_states(exp_dir, sim_dirs, statuses)
+        return statuses
 
-        return status
+    def _merge_job_states(self, exp_dir: Path, sim_dirs: Dict[str, str], statuses: Dict[str, EntityStatus]) -> None:
+        """
+        Fail the unfinished simulations whose array task ended without writing its final job status.
+
+        Tasks which are killed, preempted or run out of memory never write job_status.txt. The state of all array tasks
+        listed in job_id.txt is fetched with one sacct call and merged with the file status. Tasks which may still run,
+        such as suspended or requeued ones, keep their file status.
+        Args:
+            exp_dir: experiment directory
+            sim_dirs: Dict of simulation id as key and simulation directory as value
+            statuses: Dict of simulation id as key and EntityStatus as value, updated in place
+        Returns:
+            None
+        """
+        unfinished = {sim_id for sim_id, status in statuses.items()
+                      if status not in (EntityStatus.SUCCEEDED, EntityStatus.FAILED)}
+        job_id_file = exp_dir.joinpath('job_id.txt')
+        if not unfinished or not job_id_file.exists():
+            return
+        job_ids = job_id_file.read_text().split()
+        tasks = get_array_task_directories(exp_dir, job_ids)
+        dir_to_sim = {Path(sim_dirs[sim_id]).name: sim_id for sim_id in unfinished}
+        ended = {}
+        for task, state in query_job_states(job_ids).items():
+            if state not in SLURM_ENDED_STATES:
+                continue
+            for dir_name in tasks.get(task, []):
+                sim_id = dir_to_sim.get(dir_name)
+                if sim_id is not None:
+                    ended[sim_id] = sim_dirs[sim_id]
+        # job status files are read after sacct so a task which completed normally shows its final status
+        for sim_id, status in read_job_statuses(ended).items():
+            status = self._to_entity_status(status)
+            statuses[sim_id] = status if status in (EntityStatus.SUCCEEDED, EntityStatus.FAILED) else EntityStatus.FAILED
+
+    @staticmethod
+    def _to_entity_status(status: Optional[str]) -> EntityStatus:
+        """
+        Convert a raw job status to EntityStatus.
+        Args:
+            status: content of job_status.txt or None
+        Returns:
+            EntityStatus
+        """
+        if status is None:
+            return SLURM_MAPS['None']
+        if status in ['100', '0', '-1']:
+            return SLURM_MAPS[status]
+        return SLURM_MAPS['100']  # To be safe
 
     def create_file(self, file_path: str, content: str) -> None:
         """
@@ -4,9 +4,10 @@ Here we implement the SlurmPlatform operations interfaces.
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Type, Union, Any
+from typing import Type, Union, Any, Dict
 
 from idmtools.core import ItemType
 from idmtools.core.interfaces.ientity import IEntity
@@ -64,6 +65,10 @@ class SlurmOperations(ABC):
     def get_simulation_status(self, sim_id: str) -> Any:
         pass
 
+    @abstractmethod
+    def get_simulation_statuses(self, experiment: Experiment, **kwargs) -> Dict[str, Any]:
+        pass
+
     @abstractmethod
     def create_file(self, file_path: str, content: str) -> None:
         pass
@@ -75,3 +80,12 @@ class SlurmOperations(ABC):
     @abstractmethod
     def cancel_job(self, job_id: str) -> Any:
         pass
+
+    @contextmanager
+    def batch_submissions(self):
+        """
+        Group the jobs submitted in the context. By default, jobs are submitted immediately.
+        Returns:
+            None
+        """
+        yield
@@ -5,7 +5,7 @@ Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Union, Any
+from typing import Union, Any, Dict
 
 from idmtools.core import ItemType
 from idmtools.core.interfaces.ientity import IEntity
@@ -52,6 +52,9 @@ class RemoteSlurmOperations(SlurmOperations):
     def get_simulation_status(self, sim_id: str) -> Any:
         pass
 
+    def get_simulation_statuses(self, experiment: Experiment, **kwargs) -> Dict[str, Any]:
+        pass
+
     def create_file(self, file_path: str, content: str) -> None:
         pass
 
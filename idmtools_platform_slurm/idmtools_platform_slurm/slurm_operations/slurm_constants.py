@@ -23,6 +23,12 @@ SLURM_STATES = dict(
     SUSPENDED=EntityStatus.FAILED,
     TIMEOUT=EntityStatus.FAILED
 )
+# States of jobs which ended and will not run again. Any other state (PENDING, SUSPENDED, REQUEUED, ...) means the job
+# may still write its job status
+SLURM_ENDED_STATES = frozenset({
+    'BOOT_FAIL', 'CANCELLED', 'COMPLETED', 'DEADLINE', 'FAILED', 'NODE_FAIL', 'OUT_OF_MEMORY', 'PREEMPTED', 'REVOKED',
+    'TIMEOUT'
+})
 SLURM_MAPS = {
     "0": EntityStatus.SUCCEEDED,
     "-1": EntityStatus.FAILED,
@@ -45,6 +45,10 @@ class SlurmPlatform(IPlatform):
     bridged_results_directory: str = field(
         default=Path.home().joinpath(".idmtools").joinpath("singularity-bridge").joinpath("results"),
         metadata=dict(help="Bridged Results Directory"))
+    bridged_socket: Optional[str] = field(
+        default=None,
+        metadata=dict(help="Unix socket of the bridge (idmtools-slurm-bridge --socket). When it exists, requests are "
+                           "sent through it instead of the bridged jobs directory"))
 
     mode: SlurmOperationalMode = field(default=SlurmOperationalMode.LOCAL, metadata=dict(help="Slurm Operational Mode"))
 
@@ -111,6 +115,17 @@ class SlurmPlatform(IPlatform):
     # Set array max size for Slurm job
     array_batch_size: int = field(default=None, metadata=dict(sbatch=False, help="Array batch size"))
 
+    # Run the array jobs of an experiment in lanes sharing max_running_jobs instead of one after the other
+    shared_throttle: bool = field(default=False, metadata=dict(
+        sbatch=False, help="Run the array jobs of an experiment in lanes sharing max_running_jobs"))
+
+    # Number of simulations run by each Slurm array task
+    sims_per_task: int = field(default=1, metadata=dict(sbatch=False, help="Number of simulations run by each array task"))
+
+    # Number of the simulations of an array task running at the same time
+    task_concurrency: int = field(default=1, metadata=dict(
+        sbatch=False, help="Number of the simulations of an array task running at the same time (capped by cpus_per_task)"))
+
     # determine if run script as Slurm job
     run_on_slurm: bool = field(default=False, repr=False, compare=False, metadata=dict(help="Run script as Slurm job"))
 
@@ -120,6 +135,16 @@ class SlurmPlatform(IPlatform):
 
     # endregion
 
+    # where simulation status comes from: job status files only, or merged with the Slurm accounting (sacct)
+    status_backend: Literal['file', 'sacct'] = field(default='file', metadata=dict(
+        sbatch=False, help="Simulation status backend ('file' or 'sacct' to also detect killed, preempted or OOM tasks)"))
+
+    # stage assets through a content-addressed store
+    asset_store: bool = field(default=False, metadata=dict(
+        sbatch=False, help="Stage assets through a content-addressed store in the job directory. Identical assets are "
+                           "written once and hard linked into experiment and simulation directories, where they are "
+                           "read-only"))
+
     _suites: SlurmPlatformSuiteOperations = field(**op_defaults, repr=False, init=False)
     _experiments: SlurmPlatformExperimentOperations = field(**op_defaults, repr=False, init=False)
     _simulations: SlurmPlatformSimulationOperations = field(**op_defaults, repr=False, init=False)
@@ -153,6 +178,10 @@ class SlurmPlatform(IPlatform):
 
         if self.mpi_type.lower() not in {'pmi2', 'pmix', 'mpirun'}:
             raise ValueError(f"Invalid mpi_type '{self.mpi_type}'. Allowed values are 'pmi2', 'pmix', or 'mpirun'.")
+        if self.sims_per_task < 1 or self.task_concurrency < 1:
+            raise ValueError("sims_per_task and task_concurrency must be at least 1.")
+        if self.status_backend not in {'file', 'sacct'}:
+            raise ValueError(f"Invalid status_backend '{self.status_backend}'. Allowed values are 'file' or 'sacct'.")
 
         super().__post_init__()
         self._object_cache_expiration = 600
@@ -181,6 +210,19 @@ class SlurmPlatform(IPlatform):
     def post_setstate(self):
         self.__init_interfaces()
 
+    def run_items(self, items: Union[IEntity, List[IEntity]], **kwargs):
+        """
+        Run items on the platform. Jobs of all the experiments are submitted together (in bridged mode, in a single
+        message to the bridge).
+        Args:
+            items: Items to run
+            kwargs: keyword arguments used to expand functionality
+        Returns:
+            None
+        """
+        with self._op_client.batch_submissions():
+            super().run_items(items, **kwargs)
+
     @property
     def slurm_fields(self):
         """
@@ -14,6 +14,7 @@ from typing import Dict, Tuple, TYPE_CHECKING
 from idmtools.core import ItemType, EntityStatus
 from idmtools.entities.experiment import Experiment
 from idmtools_platform_slurm.slurm_operations.slurm_constants import SLURM_MAPS
+from idmtools_platform_slurm.platform_operations.utils import read_job_statuses
 
 if TYPE_CHECKING:  # pragma: no cover
     from idmtools.entities.iplatform import IPlatform
@@ -54,7 +55,8 @@ class StatusViewer:
         else:
             try:
                 # take the last suite as the search scope
-                last_suite_dir = max(Path(self.platform.job_directory).glob('*/'), key=os.path.getmtime)
+                last_suite_dir = max([d for d in Path(self.platform.job_directory).glob('*/')
+                                     if d.is_dir() and not d.name.startswith('.')], key=os.path.getmtime)
             except:
                 raise FileNotFoundError("Could not find the last Suite!")
             try:
@@ -96,24 +98,22 @@ class StatusViewer:
         self.platform.refresh_status(self._exp)
 
         # Filter simulations and format the results
-        _simulations = self._exp.simulations
+        _simulations = [sim for sim in self._exp.simulations if sim_filter is None or sim.id in sim_filter]
+        exp_dir = self.platform.get_directory_by_id(self._exp.id, ItemType.EXPERIMENT)
+        sim_dirs = {sim.id: exp_dir.joinpath(self.platform._op_client.entity_display_name(sim)) for sim in _simulations}
+        statuses = read_job_statuses(sim_dirs)
         for sim in _simulations:
-            # Apply simulation filter
-            if sim_filter is not None and sim.id not in sim_filter:
-                continue
-
-            sim_dir = self.platform.get_directory(sim)
-            job_status_path = sim_dir.joinpath("job_status.txt")
-            if not job_status_path.exists():
+            status = statuses[sim.id]
+            if status is None:
                 continue
 
+            sim_dir = sim_dirs[sim.id]
             job_id_path = sim_dir.joinpath('job_id.txt')
             if job_id_path.exists():
                 job_id = open(job_id_path).read().strip()
             else:
                 job_id = None
 
-            status = open(job_status_path).read().strip()
             # Apply status filter
             if status_filter is not None and status not in status_filter:
                 continue
@@ -127,13 +127,13 @@ class StatusViewer:
                 # job_id as root
                 d = dict(sim=sim.id, status=status)
                 if verbose:
-                    d["WorkDir"] = str(self.platform.get_directory(sim))
+                    d["WorkDir"] = str(sim_dir)
                 self._report[job_id] = d
             elif root == 'sim':
                 # sim_id as root
                 d = dict(job_id=job_id, status=status)
                 if verbose:
-                    d["WorkDir"] = str(self.platform.get_directory(sim))
+                    d["WorkDir"] = str(sim_dir)
                 self._report[sim.id] = d
 
     @staticmethod
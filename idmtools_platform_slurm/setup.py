@@ -16,7 +16,7 @@ with open('requirements.txt') as requirements_file:
 setup_requirements = []
 test_requirements = ['pytest', 'pytest-runner']
 
-extras = dict(test=test_requirements, dev=['Pympler'])
+extras = dict(test=test_requirements, dev=['Pympler'], watch=['watchdog'])
 
 authors = [
     ("Sharon Chen", "schen@idmod.org"),
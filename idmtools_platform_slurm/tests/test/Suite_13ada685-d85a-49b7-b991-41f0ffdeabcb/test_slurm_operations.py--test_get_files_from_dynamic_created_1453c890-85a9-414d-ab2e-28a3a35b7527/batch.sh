@@ -0,0 +1,68 @@
+#!/bin/bash
+
+# Set the total number of tasks
+total_tasks=1
+
+# Set the number of simulations run by each task
+sims_per_task=1
+
+# Set the number of tasks per array job
+batch_size=1
+
+# Set max running jobs
+max_jobs=100
+
+num_batches=$((total_tasks / batch_size))
+remainder=$((total_tasks % batch_size))
+
+echo "num_batches: $num_batches"
+echo "remainder: $remainder"
+
+
+# All array jobs are submitted at once and share max_jobs, so a slow or failed task does not hold back the other
+# array jobs. Each array job runs at least one task at a time.
+total_batches=$num_batches
+if [ $remainder -gt 0 ]
+then
+    total_batches=$((total_batches + 1))
+fi
+throttle=$((max_jobs / total_batches))
+if [ $throttle -lt 1 ]
+then
+    throttle=1
+fi
+
+
+# Submit the first array job with tasks 1-batch_size
+job_id=$(sbatch --array=1-$batch_size%$throttle sbatch.sh 0 | awk '{print $4}')
+echo $job_id >> job_id.txt
+
+# Submit additional array jobs that depend on the first job
+for (( i=1; i<$num_batches; i+=1 ))
+do
+    # Calculate the task range for the current array job
+    start_task=$((i * $batch_size))
+
+    # Submit the array job with the current task range and a dependency on the previous job
+    
+        new_job_id=$(sbatch --array=1-$batch_size%$throttle sbatch.sh $start_task | awk '{print $4}')
+    
+    echo $new_job_id >> job_id.txt
+
+    # Update the job ID to use as a dependency for the next array job
+    job_id=$new_job_id
+done
+
+# Submit the remaining tasks as a separate batch
+if [ $remainder -gt 0 ]
+then
+    start_task=$(($num_batches * $batch_size))
+
+    # Submit the array job with the current task range and a dependency on the previous job
+    
+        new_job_id=$(sbatch --array=1-$remainder%$throttle sbatch.sh $start_task | awk '{print $4}')
+    
+    echo $new_job_id >> job_id.txt
+fi
+
+wait
\ No newline at end of file
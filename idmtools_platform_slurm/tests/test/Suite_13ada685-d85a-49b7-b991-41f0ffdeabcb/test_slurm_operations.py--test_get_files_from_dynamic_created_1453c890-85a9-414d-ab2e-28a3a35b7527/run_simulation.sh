@@ -0,0 +1,76 @@
+#!/usr/bin/env bash
+# Get the parameters passed from sbatch.sh
+mpi_type="$2"
+# Number of simulations run by this array task and how many of them run at the same time
+sims_per_task="${3:-1}"
+task_concurrency="${4:-1}"
+
+TASK_INDEX=$((${SLURM_ARRAY_TASK_ID} + $1))
+MANIFEST=simulation_manifest.txt
+EXPERIMENT_DIRECTORY=$(pwd)
+
+if [ -s "$MANIFEST" ]; then
+    width=$(head -1 "$MANIFEST" | wc -c)
+    total_simulations=$(($(wc -c < "$MANIFEST") / width))
+else
+    total_simulations=$(find . -type d -maxdepth 1 -mindepth 1 | grep -v Assets | wc -l)
+fi
+
+run_simulation() {
+    SIMULATION_INDEX=$1
+    if [ -s "$MANIFEST" ]; then
+        # All lines of the manifest have the same width: read line SIMULATION_INDEX directly
+        JOB_DIRECTORY=$(dd if="$MANIFEST" bs=$width skip=$((SIMULATION_INDEX - 1)) count=1 2>/dev/null | sed -e 's/[[:space:]]*$//')
+    else
+        # Experiments submitted without a manifest
+        JOB_DIRECTORY=$(find . -type d -maxdepth 1 -mindepth 1  | grep -v Assets | head -$SIMULATION_INDEX | tail -1)
+    fi
+    cd "$JOB_DIRECTORY"
+    current_dir=$(pwd)
+    echo "The script is running from: $current_dir"
+
+    # Packed simulations running at the same time each get their own cpu
+    if [ "$task_concurrency" -gt 1 ]; then
+        srun_options="--exclusive --ntasks=1 --cpus-per-task=1"
+    else
+        srun_options=""
+    fi
+
+    # Run the simulation based on whether MPI is required
+    if [ "$mpi_type" = "no-mpi" ]; then
+        echo "Run without MPI"
+        if [ -n "$srun_options" ]; then
+            srun $srun_options _run.sh 1> stdout.txt 2> stderr.txt
+        else
+            srun _run.sh 1> stdout.txt 2> stderr.txt
+        fi
+    elif [ "$mpi_type" = "mpirun" ]; then
+        echo "Run mpirun"
+        mpirun "$current_dir"/_run.sh 1> stdout.txt 2> stderr.txt
+    elif [ "$mpi_type" = "pmi2" ] || [ "$mpi_type" = "pmix" ]; then # pmi2 or pmix
+        echo "Run MPI with $mpi_type"
+        srun --mpi=$mpi_type _run.sh 1> stdout.txt 2> stderr.txt
+    else
+        echo "Invalid MPI type: $mpi_type"
+    fi
+}
+
+# Array task TASK_INDEX runs simulations (TASK_INDEX - 1) * sims_per_task + 1 to TASK_INDEX * sims_per_task
+first=$(((TASK_INDEX - 1) * sims_per_task + 1))
+last=$((TASK_INDEX * sims_per_task))
+if [ "$last" -gt "$total_simulations" ]; then
+    last=$total_simulations
+fi
+for (( index=first; index<=last; index++ ))
+do
+    if [ "$task_concurrency" -gt 1 ]; then
+        # Keep at most task_concurrency simulations running
+        while [ "$(jobs -rp | wc -l)" -ge "$task_concurrency" ]; do
+            wait -n
+        done
+        (run_simulation $index) &
+    else
+        (run_simulation $index)
+    fi
+done
+wait
@@ -0,0 +1,69 @@
+#!/usr/bin/env bash
+# Share max_running_jobs between the array jobs of an experiment submitted at once (shared_throttle).
+# Run by each array task when it ends, so the slots of finished array jobs are handed to the array jobs with pending
+# tasks. Array jobs left without a slot are held until one frees.
+max_jobs=$(sed -n 's/^max_jobs=\([0-9][0-9]*\)$/\1/p' batch.sh 2> /dev/null)
+
+if [ -z "$max_jobs" ] || [ ! -s job_id.txt ] || ! command -v squeue > /dev/null; then
+    exit 0
+fi
+
+rebalance() {
+    # Pending and running tasks of the array jobs of the experiment, except the task calling us which is ending
+    squeue -h -r -u "$USER" -o "%F %K %t" | awk -v max_jobs="$max_jobs" \
+        -v self_job="${SLURM_ARRAY_JOB_ID:-}" -v self_task="${SLURM_ARRAY_TASK_ID:-}" '
+        FNR == NR { if ($1 != "") { order[++n] = $1; ours[$1] = 1 }; next }
+        !($1 in ours) || ($1 == self_job && $2 == self_task) { next }
+        $3 == "PD" { pending[$1]++; next }
+        { running[$1]++ }
+        END {
+            # Slots used by array jobs without pending tasks cannot be moved
+            available = max_jobs
+            for (i = 1; i <= n; i++) {
+                job = order[i]
+                if (!pending[job]) available -= running[job]
+            }
+            # Fill the array jobs with pending tasks in submission order, never giving one more slots than its tasks
+            do {
+                given = 0
+                hungry = 0
+                for (i = 1; i <= n; i++) {
+                    job = order[i]
+                    if (pending[job] && share[job] < pending[job] + running[job]) hungry++
+                }
+                if (hungry == 0 || available <= 0) break
+                quota = int(available / hungry)
+                if (quota < 1) quota = 1
+                for (i = 1; i <= n && available > 0; i++) {
+                    job = order[i]
+                    if (!pending[job]) continue
+                    add = pending[job] + running[job] - share[job]
+                    if (add > quota) add = quota
+                    if (add > available) add = available
+                    if (add > 0) { share[job] += add; available -= add; given += add }
+                }
+            } while (given > 0)
+            for (i = 1; i <= n; i++) {
+                job = order[i]
+                if (pending[job]) print job, share[job] + 0
+            }
+        }' job_id.txt - | while read -r job share; do
+        if [ "$share" -gt 0 ]; then
+            scontrol update JobId="$job" ArrayTaskThrottle="$share" > /dev/null 2>&1
+            scontrol release "$job" > /dev/null 2>&1
+        else
+            scontrol hold "$job" > /dev/null 2>&1
+        fi
+    done
+}
+
+# Tasks ending at the same time rebalance one after the other
+if command -v flock > /dev/null; then
+    (
+        flock -w 60 9
+        rebalance
+    ) 9> .throttle.lock
+else
+    rebalance
+fi
+exit 0
@@ -411,3 +411,32 @@ class JSONMetadataOperationsTest(unittest.TestCase):
         filtered_meta_list = self.op.filter(item_type=ItemType.SIMULATION)
         # make sure match 3 simulations
         self.assertEqual(len(filtered_meta_list), 3)
+
+    def test_index_updated_on_dump_and_clear(self):
+        _, experiments, simulations = self._initialize_data(self)
+        sim = simulations[0]
+        entry = self.op.index.get(sim.id, ItemType.SIMULATION)
+        self.assertEqual(entry['dir'], str(self.platform.get_directory(sim)))
+        self.assertEqual(entry['parent_id'], experiments[0].id)
+        self.assertEqual(entry['status'], 'CREATED')
+        # wrong item type is not a match
+        self.assertIsNone(self.op.index.get(sim.id, ItemType.EXPERIMENT))
+        self.op.clear(item=sim)
+        self.assertIsNone(self.op.index.get(sim.id, ItemType.SIMULATION))
+
+    def test_get_all_with_id_uses_index(self):
+        _, _, simulations = self._initialize_data(self)
+        sim = simulations[1]
+        meta_list = self.op.get_all(item_type=ItemType.SIMULATION, item_id=sim.id)
+        self.assertEqual(len(meta_list), 1)
+        self.assertEqual(meta_list[0]['id'], sim.id)
+        # a removed directory invalidates the entry
+        shutil.rmtree(self.platform.get_directory(sim))
+        self.assertIsNone(self.op.index.get(sim.id, ItemType.SIMULATION))
+        self.assertEqual(self.op.get_all(item_type=ItemType.SIMULATION, item_id=sim.id), [])
+
+    def test_rebuild_index(self):
+        self._initialize_data(self)
+        self.op.index.clear()
+        self.assertEqual(len(self.op.index), 0)
+        self.assertEqual(self.op.rebuild_index(), 6)
@@ -3,6 +3,7 @@ import json
 import os
 import pathlib
 import shutil
+import subprocess
 from functools import partial
 from typing import Any, Dict
 
@@ -11,7 +12,7 @@ import pandas as pd
 import pytest
 
 from idmtools.builders import SimulationBuilder
-from idmtools.core import ItemType
+from idmtools.core import ItemType, EntityStatus
 from idmtools.core.platform_factory import Platform
 from idmtools.entities import Suite
 from idmtools.entities.experiment import Experiment
@@ -76,7 +77,14 @@ class TestPythonSimulation(ITestWithPersistence):
         for (dirpath, dirnames, filenames) in os.walk(experiment_dir):
             files.extend(filenames)
             break
-        self.assertSetEqual(set(files), set(["metadata.json", "run_simulation.sh", "sbatch.sh", "batch.sh"]))
+        self.assertSetEqual(set(files), set(["metadata.json", "run_simulation.sh", "sbatch.sh", "batch.sh", "simulation_manifest.txt"]))
+
+        # verify the manifest maps each array index to a simulation directory with fixed width lines
+        with open(os.path.join(experiment_dir, 'simulation_manifest.txt'), 'r') as fpr:
+            lines = fpr.read().splitlines()
+        self.assertEqual(len(set(len(line) for line in lines)), 1)
+        self.assertEqual([line.rstrip() for line in lines],
+                         sorted(self.platform.get_directory(s).name for s in experiment.simulations))
 
         # verify all files under simulations
         self.assertEqual(experiment.simulation_count, 9)
@@ -96,6 +104,69 @@ class TestPythonSimulation(ITestWithPersistence):
             self.assertSetEqual(set(files), set(["metadata.json", "_run.sh", "config.json"]))
         self.assertEqual(count, 9)  # make sure we found total 9 symlinks for Assets folder
 
+    def test_packed_array_tasks(self):
+        platform = Platform('SLURM_LOCAL', job_directory=self.job_directory, sims_per_task=2, array_batch_size=2,
+                            cpus_per_task=2, task_concurrency=4)
+        experiment = self.create_experiment(platform=platform, a=5)
+        experiment_dir = platform.get_directory(experiment)
+        with open(os.path.join(experiment_dir, 'batch.sh'), 'r') as fpr:
+            contents = fpr.read()
+        self.assertIn("total_tasks=3\n", contents)
+        self.assertIn("batch_size=2\n", contents)
+        self.assertIn("sims_per_task=2\n", contents)
+        with open(os.path.join(experiment_dir, 'sbatch.sh'), 'r') as fpr:
+            contents = fpr.read()
+        # concurrency is capped by cpus_per_task
+        self.assertIn("task_concurrency=2\n", contents)
+        self.assertIn('bash run_simulation.sh "$1" "no-mpi" "$sims_per_task" "$task_concurrency"', contents)
+
+        # run the first task of both array jobs with a stub srun
+        env = dict(os.environ, PATH=f"{pathlib.Path('input').absolute()}{os.pathsep}{os.environ['PATH']}",
+                   SLURM_ARRAY_TASK_ID="1")
+        for offset in [0, 2]:
+            subprocess.run(['bash', 'run_simulation.sh', str(offset), 'no-mpi', '2', '2'], cwd=experiment_dir, env=env,
+                           check=True, stdout=subprocess.DEVNULL)
+        with open(os.path.join(experiment_dir, 'simulation_manifest.txt')) as f:
+            sim_dirs = [line.strip() for line in f]
+        ran = [os.path.exists(os.path.join(experiment_dir, sim_dir, 'job_status.txt')) for sim_dir in sim_dirs]
+        self.assertEqual([True, True, False, False, True], ran)
+        statuses = platform._op_client.get_simulation_statuses(experiment)
+        self.assertEqual(3, list(statuses.values()).count(EntityStatus.SUCCEEDED))
+
+    def test_batch_submission(self):
+        platform = Platform('SLURM_LOCAL', job_directory=self.job_directory, array_batch_size=2, max_running_jobs=4)
+        experiment = self.create_experiment(platform=platform, a=5)
+        experiment_dir = platform.get_directory(experiment)
+        env = dict(os.environ, PATH=f"{pathlib.Path('input').absolute()}{os.pathsep}{os.environ['PATH']}")
+
+        def submit(**kwargs):
+            platform._op_client.create_batch_file(experiment, **kwargs)
+            for filename in ['sbatch_calls.txt', 'job_id.txt']:
+                experiment_dir.joinpath(filename).unlink(missing_ok=True)
+            subprocess.run(['bash', 'batch.sh'], cwd=experiment_dir, env=env, check=True, stdout=subprocess.DEVNULL)
+            self.assertEqual("101\n102\n103\n", experiment_dir.joinpath('job_id.txt').read_text())
+            return experiment_dir.joinpath('sbatch_calls.txt').read_text().splitlines()
+
+        # by default, each array job waits for the success of the previous one
+        self.assertEqual(["--array=1-2%4 sbatch.sh 0", "--array=1-2%4 --dependency=afterok:101 sbatch.sh 2",
+                          "--array=1-1%4 --dependency=afterok:102 sbatch.sh 4"], submit())
+        self.assertEqual(["--array=1-2%4 sbatch.sh 0", "--array=1-2%4 sbatch.sh 2", "--array=1-1%4 sbatch.sh 4"],
+                         submit(dependency=False))
+
+        # with a shared throttle, the array jobs run in lanes sharing max_running_jobs, whatever the outcome of the
+        # previous array job of their lane
+        self.assertEqual(["--array=1-2%2 sbatch.sh 0", "--array=1-2%2 sbatch.sh 2",
+                          "--array=1-1%2 --dependency=afterany:101 sbatch.sh 4"], submit(shared_throttle=True))
+        self.assertEqual(["--array=1-2%2 sbatch.sh 0", "--array=1-2%2 --dependency=afterany:101 sbatch.sh 2",
+                          "--array=1-1%2 --dependency=afterany:102 sbatch.sh 4"],
+                         submit(shared_throttle=True, max_running_jobs=2))
+        # each array job has a lane when there are enough slots
+        platform.max_running_jobs = 5
+        self.assertEqual(["--array=1-2%2 sbatch.sh 0", "--array=1-2%2 sbatch.sh 2", "--array=1-1%1 sbatch.sh 4"],
+                         submit(shared_throttle=True))
+        self.assertNotIn("trap", experiment_dir.joinpath('sbatch.sh').read_text())
+        self.assertFalse(experiment_dir.joinpath('rebalance_throttle.sh').exists())
+
     def test_scripts(self):
         platform = Platform('SLURM_LOCAL', job_directory=self.job_directory, max_running_jobs=8, retries=5)
         experiment = self.create_experiment(platform=platform, a=5, b=5)
@@ -113,6 +184,7 @@ class TestPythonSimulation(ITestWithPersistence):
             "JOB_DIRECTORY=$(find . -type d -maxdepth 1 -mindepth 1  | grep -v Assets | head -$SIMULATION_INDEX | tail -1)",
             contents)
         self.assertIn("JOB_DIRECTORY", contents)
+        self.assertIn('dd if="$MANIFEST" bs=$width skip=$((SIMULATION_INDEX - 1)) count=1', contents)
         self.assertIn("srun _run.sh 1> stdout.txt 2> stderr.txt", contents)
 
         # verify _run.sh script content under simulation level
@@ -1,14 +1,68 @@
+import json
 import os
+import socket
+import socketserver
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
 
 import pytest
 
 from idmtools import IdmConfigParser
 from idmtools.core.platform_factory import Platform
+from idmtools.entities import Suite
+from idmtools.entities.experiment import Experiment
+from idmtools_models.python.json_python_task import JSONConfiguredPythonTask
+from idmtools_test import COMMON_INPUT_PATH
+from idmtools_platform_slurm.platform_operations.utils import add_dummy_suite
+from idmtools_platform_slurm.slurm_operations.bridged_operations import create_bridged_jobs, get_results_watcher
 from idmtools_platform_slurm.slurm_operations.slurm_constants import SlurmOperationalMode
 from idmtools_test.utils.decorators import linux_only
 from idmtools_test.utils.itest_with_persistence import ITestWithPersistence
 
 
+def answer(message):
+    requests = message.get('requests', [message])
+    results = [dict(status='success', return_code=0, output=f"{request['command']} done") for request in requests]
+    return dict(results=results) if 'requests' in message else results[0]
+
+
+def answer_unbatched(message):
+    # bridges from before batched messages only know single requests
+    if 'command' not in message:
+        return dict(status='error', output="No command specified. You must specify either bash, scancel, or verify")
+    if message['working_directory'].endswith('missing'):
+        return dict(status='error', return_code=-1, output=f"FAILED: No Directory name {message['working_directory']}")
+    return answer(message)
+
+
+def fake_bridge(jobs_directory, results_directory, messages, stop, answer=answer):
+    while not stop.is_set():
+        for job in Path(jobs_directory).glob('*.json'):
+            with open(job, 'r') as jin:
+                message = json.load(jin)
+            messages.append(message)
+            with open(Path(results_directory).joinpath(f'{job.name}.result'), 'w') as rout:
+                json.dump(answer(message), rout)
+            job.unlink()
+        stop.wait(0.01)
+
+
+class FakeBridgeHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            message = json.loads(line)
+            self.server.messages.append(message)
+            self.wfile.write(json.dumps(answer(message)).encode('utf-8') + b'\n')
+
+
+class SlowBridgeHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        self.server.messages.append(json.loads(self.rfile.readline()))
+        self.server.answer.wait(5)
+
+
 @pytest.mark.serial
 @linux_only
 class TestSlurmBridge(ITestWithPersistence):
@@ -29,3 +83,118 @@ class TestSlurmBridge(ITestWithPersistence):
                          os.path.join(os.path.expanduser('~'), ".idmtools", "singularity-bridge"))
         self.assertEqual(platform.bridged_results_directory,
                          os.path.join(os.path.expanduser('~'), ".idmtools", "singularity-bridge", "results"))
+
+    def bridged_platform(self, directory, **kwargs):
+        return Platform('SLURM_BRIDGED', job_directory=os.path.join(directory, "DEST"),
+                        bridged_jobs_directory=os.path.join(directory, "jobs"),
+                        bridged_results_directory=os.path.join(directory, "results"), **kwargs)
+
+    def experiment(self, name):
+        experiment = Experiment(name=name)
+        add_dummy_suite(experiment)
+        return experiment
+
+    def test_batched_submission(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            platform = self.bridged_platform(tmp)
+            messages = []
+            stop = threading.Event()
+            bridge = threading.Thread(target=fake_bridge, args=(platform.bridged_jobs_directory,
+                                                                platform.bridged_results_directory, messages, stop))
+            bridge.start()
+            try:
+                suite = Suite(name='Idm Suite')
+                for i in range(3):
+                    task = JSONConfiguredPythonTask(script_path=os.path.join(COMMON_INPUT_PATH, "python", "model3.py"),
+                                                    parameters=dict(c=i))
+                    suite.add_experiment(Experiment.from_task(task, name=f"test{i}"))
+                suite.run(platform=platform, wait_until_done=False)
+                result = platform._op_client.cancel_job(['1', '2'])
+            finally:
+                stop.set()
+                bridge.join()
+
+            # the jobs of the experiments are submitted in a single message
+            self.assertEqual(2, len(messages))
+            self.assertEqual([dict(command='bash', working_directory=str(platform.get_directory(experiment)))
+                              for experiment in suite.experiments], messages[0]['requests'])
+            self.assertEqual(dict(command='scancel', job_ids=['1', '2']), messages[1])
+            self.assertEqual("scancel done", result)
+            self.assertEqual([], os.listdir(platform.bridged_results_directory))
+            self.assertEqual([], os.listdir(os.path.join(platform.bridged_jobs_directory, ".pending")))
+
+    def test_unbatched_bridge(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            platform = self.bridged_platform(tmp)
+            messages = []
+            stop = threading.Event()
+            bridge = threading.Thread(target=fake_bridge, args=(platform.bridged_jobs_directory,
+                                                                platform.bridged_results_directory, messages, stop,
+                                                                answer_unbatched))
+            bridge.start()
+            try:
+                directories = [os.path.join(tmp, f"exp{i}") for i in range(3)]
+                with self.assertLogs('idmtools_platform_slurm.slurm_operations.bridged_operations', 'WARNING'):
+                    results = create_bridged_jobs(directories, platform.bridged_jobs_directory,
+                                                  platform.bridged_results_directory)
+                # the bridge is then sent requests one by one straight away
+                create_bridged_jobs(directories[:2], platform.bridged_jobs_directory,
+                                    platform.bridged_results_directory)
+                with self.assertRaisesRegex(ValueError, "could not submit jobs.*missing"):
+                    create_bridged_jobs([os.path.join(tmp, "exp"), os.path.join(tmp, "missing")],
+                                        platform.bridged_jobs_directory, platform.bridged_results_directory)
+            finally:
+                stop.set()
+                bridge.join()
+            self.assertEqual(["bash done"] * 3, [result['output'] for result in results])
+            # all the messages share the watcher of the results directory
+            self.assertIs(get_results_watcher(platform.bridged_results_directory),
+                          get_results_watcher(platform.bridged_results_directory))
+            self.assertEqual(1, len([message for message in messages if 'requests' in message]))
+            self.assertEqual(directories + directories[:2] + [os.path.join(tmp, "exp"), os.path.join(tmp, "missing")],
+                             [message['working_directory'] for message in messages if 'command' in message])
+
+    def test_socket_transport(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            socket_path = os.path.join(tmp, "bridge.sock")
+            platform = self.bridged_platform(tmp, bridged_socket=socket_path)
+            # without the socket, the bridge files are used
+            with self.assertRaisesRegex(ValueError, "Bridge never reported result"):
+                with mock.patch('idmtools_platform_slurm.slurm_operations.bridged_operations.BRIDGE_TIMEOUT', 0.2):
+                    platform._op_client.submit_job(self.experiment("test"))
+            self.assertEqual(1, len(list(Path(platform.bridged_jobs_directory).glob('*.json'))))
+
+            with socketserver.ThreadingUnixStreamServer(socket_path, FakeBridgeHandler) as server:
+                server.messages = []
+                threading.Thread(target=server.serve_forever, daemon=True).start()
+                try:
+                    with platform._op_client.batch_submissions():
+                        platform._op_client.submit_job(self.experiment("test1"))
+                        platform._op_client.submit_job(self.experiment("test2"))
+                    result = platform._op_client.cancel_job('1')
+                finally:
+                    server.shutdown()
+            self.assertEqual(2, len(server.messages))
+            self.assertEqual(2, len(server.messages[0]['requests']))
+            self.assertEqual(dict(command='scancel', job_ids=['1']), server.messages[1])
+            self.assertEqual("scancel done", result)
+            self.assertEqual(1, len(list(Path(platform.bridged_jobs_directory).glob('*.json'))))
+
+    def test_socket_no_answer(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            socket_path = os.path.join(tmp, "bridge.sock")
+            platform = self.bridged_platform(tmp, bridged_socket=socket_path)
+            with socketserver.ThreadingUnixStreamServer(socket_path, SlowBridgeHandler) as server:
+                server.messages = []
+                server.answer = threading.Event()
+                threading.Thread(target=server.serve_forever, daemon=True).start()
+                try:
+                    with mock.patch('idmtools_platform_slurm.slurm_operations.bridged_operations.BRIDGE_TIMEOUT', 0.2):
+                        with self.assertRaisesRegex(ValueError, "Bridge never reported result"):
+                            platform._op_client.submit_job(self.experiment("test"))
+                finally:
+                    server.answer.set()
+                    server.shutdown()
+            # the bridge received the message, so it is not sent again through the bridge files
+            self.assertEqual(1, len(server.messages))
+            self.assertEqual([], list(Path(platform.bridged_jobs_directory).glob('*.json')))
@@ -2,6 +2,7 @@ import os
 import tempfile
 from functools import partial
 from pathlib import Path
+from unittest import mock
 
 import pytest
 from idmtools.builders import SimulationBuilder
@@ -18,6 +19,7 @@ from idmtools_test.utils.itest_with_persistence import ITestWithPersistence
 from idmtools.entities.templated_simulation import TemplatedSimulations
 from idmtools_platform_slurm.platform_operations.utils import add_dummy_suite, SlurmExperiment, SlurmSimulation
 from idmtools.assets.asset import Asset
+from idmtools_platform_slurm.platform_operations.asset_store import is_executable
 
 setA = partial(JSONConfiguredPythonTask.set_parameter_sweep_callback, param="a")
 
@@ -126,6 +128,60 @@ class TestSlurmOperations(ITestWithPersistence):
                 self.assertTrue(isinstance(child, SlurmExperiment))
                 self.assertTrue(isinstance(child.uid, str))
 
+    def test_get_simulation_statuses(self):
+        sims = list(self.exp.simulations)
+        with open(self.platform.get_directory(sims[0]).joinpath('job_status.txt'), 'w') as f:
+            f.write("-1\n")
+        op_client = self.platform._op_client
+        expected = {sims[0].id: EntityStatus.FAILED, sims[1].id: EntityStatus.CREATED}
+        self.assertDictEqual(expected, op_client.get_simulation_statuses(self.exp))
+        slurm_experiment = self.platform.get_item(self.exp.uid, ItemType.EXPERIMENT, raw=True)
+        self.assertDictEqual(expected, op_client.get_simulation_statuses(slurm_experiment))
+        children = self.platform.get_children(self.exp.uid, ItemType.EXPERIMENT, raw=True)
+        self.assertDictEqual(expected, {child.id: child.status for child in children})
+
+    def test_get_simulation_statuses_with_sacct(self):
+        platform = Platform('SLURM_LOCAL', job_directory=self.job_directory, status_backend='sacct', array_batch_size=3)
+        task = JSONConfiguredPythonTask(script_path=os.path.join(COMMON_INPUT_PATH, 'python', 'model1.py'))
+        ts = TemplatedSimulations(base_task=task)
+        builder = SimulationBuilder()
+        builder.add_sweep_definition(setA, range(5))
+        ts.add_builder(builder)
+        exp = Experiment(name=self.case_name, simulations=ts)
+        add_dummy_suite(exp).run(platform=platform, wait_until_done=False, dry_run=True)
+
+        exp_dir = platform.get_directory(exp)
+        with open(exp_dir.joinpath('simulation_manifest.txt')) as f:
+            sim_ids = [line.strip() for line in f]
+        # array job 100 runs simulations 1-3 and array job 101 simulations 4-5
+        exp_dir.joinpath('job_id.txt').write_text("100\n101\n")
+        for sim_id, status in zip(sim_ids, ['0', None, '100', '100', None]):
+            if status is not None:
+                exp_dir.joinpath(sim_id, 'job_status.txt').write_text(status)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            sacct_output = Path(tmp, 'sacct.txt')
+            sacct_output.write_text("100_1|COMPLETED\n100_1.batch|COMPLETED\n100_2|OUT_OF_MEMORY\n100_3|RUNNING\n"
+                                    "101_1|CANCELLED by 1000\n101_[2]|PENDING\n")
+            env = dict(PATH=f"{Path('input').absolute()}{os.pathsep}{os.environ['PATH']}",
+                       SACCT_STUB_OUTPUT=str(sacct_output))
+            with mock.patch.dict(os.environ, env):
+                statuses = platform._op_client.get_simulation_statuses(exp)
+                self.assertEqual([EntityStatus.SUCCEEDED, EntityStatus.FAILED, EntityStatus.RUNNING,
+                                  EntityStatus.FAILED, EntityStatus.CREATED], [statuses[sim_id] for sim_id in sim_ids])
+
+                # suspended and requeued tasks may still run
+                sacct_output.write_text("100_1|COMPLETED\n100_2|OUT_OF_MEMORY\n100_3|SUSPENDED\n101_1|REQUEUED\n"
+                                        "101_[2]|PENDING\n")
+                statuses = platform._op_client.get_simulation_statuses(exp)
+                self.assertEqual([EntityStatus.SUCCEEDED, EntityStatus.FAILED, EntityStatus.RUNNING,
+                                  EntityStatus.RUNNING, EntityStatus.CREATED], [statuses[sim_id] for sim_id in sim_ids])
+
+                platform.status_backend = 'file'
+                statuses = platform._op_client.get_simulation_statuses(exp)
+                self.assertEqual([EntityStatus.SUCCEEDED, EntityStatus.CREATED, EntityStatus.RUNNING,
+                                  EntityStatus.RUNNING, EntityStatus.CREATED], [statuses[sim_id] for sim_id in sim_ids])
+
     def test_experiment_list_assets(self):
         with self.subTest('test_list_assets'):
             assets = self.platform._experiments.list_assets(self.exp)
@@ -156,6 +212,40 @@ class TestSlurmOperations(ITestWithPersistence):
             count += 1
         self.assertEqual(count, 2)
 
+    def test_asset_store(self):
+        platform = Platform('SLURM_LOCAL', job_directory=self.job_directory, asset_store=True)
+        suite, exp = self.create_experiment(platform)
+        store = platform._assets.store
+        exp_dir = platform.get_directory(exp)
+        for asset in exp.assets:
+            self.assertTrue(os.path.samefile(store.path(asset.checksum, is_executable(asset)),
+                                             exp_dir.joinpath('Assets', asset.filename)))
+        for sim in exp.simulations:
+            config = platform.get_directory(sim).joinpath('config.json')
+            asset = sim.assets.get_one(filename='config.json')
+            self.assertEqual(asset.bytes, config.read_bytes())
+            self.assertTrue(os.path.samefile(store.path(asset.checksum), config))
+            self.assertEqual(0, os.stat(config).st_mode & 0o222)
+        self.assertEqual([], store._unsynced)
+
+    @linux_only
+    def test_asset_store_executable(self):
+        platform = Platform('SLURM_LOCAL', job_directory=self.job_directory, asset_store=True)
+        store = platform._assets.store
+        script = Path(self.job_directory, 'run.sh')
+        script.write_text('#!/bin/bash\necho run\n')
+        script.chmod(0o755)
+        copy = Path(self.job_directory, 'copy.sh')
+        copy.write_text('#!/bin/bash\necho run\n')
+        dest = Path(self.job_directory, 'staged')
+        dest.mkdir(exist_ok=True)
+        store.stage([(Asset(absolute_path=str(script)), dest.joinpath('run.sh')),
+                     (Asset(absolute_path=str(copy)), dest.joinpath('copy.sh'))])
+        # the executable keeps its exec bits, and is not shared with the same content without them
+        self.assertTrue(os.access(dest.joinpath('run.sh'), os.X_OK))
+        self.assertFalse(os.access(dest.joinpath('copy.sh'), os.X_OK))
+        self.assertFalse(os.path.samefile(dest.joinpath('run.sh'), dest.joinpath('copy.sh')))
+
     def test_to_entity(self):
         slurm_experiment = self.platform.get_item(self.exp.id, item_type=ItemType.EXPERIMENT, raw=True)
         idm_experiment = self.platform._experiments.to_entity(slurm_experiment)
@@ -95,6 +95,8 @@ def main():
     parser.add_argument("--job-directory", default=str(bp))
     parser.add_argument("--status-directory", default=str())
     parser.add_argument("--check-every", type=int, default=5)
+    parser.add_argument("--socket", type=str, default=None,
+                        help="Also serve requests on this Unix socket. It must be in a directory shared with the container")
     parser.add_argument("--console-level", type=str, default='INFO', choices=['INFO', 'DEBUG', 'WARNING', 'ERROR'])
     parser.add_argument("--file-level", type=str, default='DEBUG', choices=['INFO', 'DEBUG', 'WARNING', 'ERROR'])
 
@@ -122,6 +124,8 @@ def main():
     user_logger.info(f"Job Directory: {args.job_directory}")
     user_logger.info(f"Status Directory: {args.status_directory}")
     user_logger.info(f'Refresh Every: {args.check_every}')
+    if args.socket:
+        user_logger.info(f'Socket: {args.socket}')
     user_logger.info('Press Ctrl+C To Stop')
 
     if pid_file.exists():
@@ -132,7 +136,7 @@ def main():
     signal.signal(signal.SIGINT, partial(cleanup, config_directory=args.job_directory))
     with open(pid_file, 'w') as pid_out:
         pid_out.write(str(os.getpid()))
-    w = IdmtoolsJobWatcher(args.job_directory, args.status_directory, args.check_every)
+    w = IdmtoolsJobWatcher(args.job_directory, args.status_directory, args.check_every, args.socket)
     w.run()
     # We shouldn't ever hit here as user has to end process using ctrl+c
     cleanup(config_directory=args.job_directory)
@@ -0,0 +1,79 @@
+"""
+Provides a Unix socket transport for bridge messages.
+
+When idmtools runs in a container sharing a directory with the host, messages can be sent over a Unix socket in that
+directory instead of through job files. Each message is one line of JSON and is answered with one line of JSON.
+
+Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
+"""
+import json
+import os
+import socketserver
+import threading
+from logging import getLogger, DEBUG
+from os import PathLike
+from pathlib import Path
+from idmtools_slurm_utils.utils import get_message_result, ERROR_INVALID_MESSAGE
+
+logger = getLogger()
+
+
+class BridgeRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Answers the messages received on a connection.
+    """
+
+    def handle(self):
+        """
+        Process each line received as a message until the client closes the connection.
+        """
+        for line in self.rfile:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                result = get_message_result(json.loads(line))
+            except ValueError:
+                result = dict(status="error", return_code=-1, output=ERROR_INVALID_MESSAGE)
+            if logger.isEnabledFor(DEBUG):
+                logger.debug(f'Result for socket message: {json.dumps(result, sort_keys=True)}')
+            self.wfile.write(json.dumps(result).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+
+class BridgeSocketServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Serves bridge messages on a Unix socket.
+    """
+    daemon_threads = True
+
+    def __init__(self, socket_path: PathLike):
+        """
+        Creates the server. A stale socket left by a previous run is replaced.
+
+        Args:
+            socket_path: Path of the socket
+        """
+        self.socket_path = Path(socket_path)
+        if self.socket_path.is_socket():
+            self.socket_path.unlink()
+        super().__init__(str(self.socket_path), BridgeRequestHandler)
+        os.chmod(self.socket_path, 0o600)
+
+    def start(self) -> threading.Thread:
+        """
+        Serve messages in a background thread.
+
+        Returns:
+            Thread serving the messages
+        """
+        thread = threading.Thread(target=self.serve_forever, name='idmtools-slurm-bridge-socket', daemon=True)
+        thread.start()
+        return thread
+
+    def server_close(self):
+        """
+        Close the server and remove the socket.
+        """
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
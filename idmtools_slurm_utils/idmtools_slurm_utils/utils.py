@@ -5,9 +5,10 @@ Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from os import PathLike
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 from logging import getLogger, DEBUG
 from idmtools_slurm_utils.bash import command_bash
 from idmtools_slurm_utils.sbatch import command_sbatch
@@ -15,6 +16,10 @@ from idmtools_slurm_utils.scancel import command_scancel
 from idmtools_slurm_utils.verify import command_verify
 
 ERROR_INVALID_COMMAND = "No command specified. You must specify either bash, scancel, or verify"
+ERROR_INVALID_MESSAGE = "Invalid message. A message must be a request or a list of requests under 'requests'"
+
+# Requests of a batched message processed at the same time
+MAX_BATCH_WORKERS = 8
 
 logger = getLogger()
 
@@ -56,39 +61,93 @@ def get_job_result(job_path: PathLike) -> Dict:
     """
     with open(job_path, "r") as jin:
         info = json.load(jin)
-
-        if "command" not in info or info['command'].lower() not in VALID_COMMANDS:
-            result = dict(
-                status="error",
-                output=ERROR_INVALID_COMMAND
-            )
-        else:
-            command = info['command'].lower()
-            if command == "sbatch":
-                result = command_sbatch(info)
-            elif command == "bash":
-                result = command_bash(info)
-            elif command == "verify":
-                result = command_verify(info)
-            elif command == "scancel":
-                result = command_scancel(info)
-            else:
-                result = dict(
-                    status="error",
-                    output=ERROR_INVALID_COMMAND
-                )
+    result = get_message_result(info)
     if logger.isEnabledFor(DEBUG):
         logger.debug(f'Result for {job_path}: {json.dumps(result, indent=4, sort_keys=True)}')
     return result
 
 
+def get_message_result(info: Dict) -> Dict:
+    """
+    Process a message and return its result.
+
+    A message is either a single request or a batch of requests under the *requests* key. The result of a batch holds
+    the result of each request, in order, under the *results* key.
+
+    Args:
+        info: Message
+
+    Returns:
+        Result
+    """
+    if not isinstance(info, dict):
+        return dict(status="error", return_code=-1, output=ERROR_INVALID_MESSAGE)
+    if "requests" in info:
+        if not isinstance(info['requests'], list):
+            return dict(status="error", return_code=-1, output=ERROR_INVALID_MESSAGE)
+        return dict(results=get_batch_results(info['requests']))
+    return get_request_result(info)
+
+
+def get_batch_results(requests: List[Dict]) -> List[Dict]:
+    """
+    Process a batch of requests.
+
+    Args:
+        requests: Requests to process
+
+    Returns:
+        Result of each request, in the order of the requests
+    """
+    if len(requests) <= 1:
+        return [get_request_result(info) for info in requests]
+    with ThreadPoolExecutor(max_workers=min(MAX_BATCH_WORKERS, len(requests))) as pool:
+        return list(pool.map(get_request_result, requests))
+
+
+def get_request_result(info: Dict) -> Dict:
+    """
+    Run a single request.
+
+    Args:
+        info: Request
+
+    Returns:
+        Result
+    """
+    if not isinstance(info, dict) or "command" not in info or info['command'].lower() not in VALID_COMMANDS:
+        return dict(
+            status="error",
+            output=ERROR_INVALID_COMMAND
+        )
+    command = info['command'].lower()
+    if command == "sbatch":
+        result = command_sbatch(info)
+    elif command == "bash":
+        result = command_bash(info)
+    elif command == "verify":
+        result = command_verify(info)
+    elif command == "scancel":
+        result = command_scancel(info)
+    else:
+        result = dict(
+            status="error",
+            output=ERROR_INVALID_COMMAND
+        )
+    return result
+
+
 def write_result(result: Dict, result_name: Path):
     """
     Write the result of a job to a directory.
 
+    The result is written to a temporary file first, so clients notified of the result file never read it partially.
+
     Args:
         result: Result to write
         result_name: Path to write result to.
     """
-    with open(result_name, "w") as rout:
+    tmp_name = Path(result_name).with_name(f'.{Path(result_name).name}.tmp')
+    with open(tmp_name, "w") as rout:
         json.dump(result, rout)
+    os.replace(tmp_name, result_name)
@@ -9,6 +9,7 @@ from os import PathLike
 from watchdog.events import FileSystemEventHandler
 from watchdog_gevent import Observer
 
+from idmtools_slurm_utils.socket_server import BridgeSocketServer
 from idmtools_slurm_utils.utils import process_job
 
 logger = getLogger()
@@ -19,7 +20,8 @@ class IdmtoolsJobWatcher:
     Watches the bridge directory and communicates jobs to slurm.
     """
 
-    def __init__(self, directory_to_watch: PathLike, directory_for_status: PathLike, check_every: int = 5):
+    def __init__(self, directory_to_watch: PathLike, directory_for_status: PathLike, check_every: int = 5,
+                 socket_path: PathLike = None):
         """
         Creates our watcher.
 
@@ -27,11 +29,13 @@ class IdmtoolsJobWatcher:
             directory_to_watch: Directory to sync from
             directory_for_status: Directory for status messages
             check_every: How often should directory be synced
+            socket_path: Optional Unix socket to also serve messages on
         """
         self.observer = Observer()
         self._directory_to_watch = directory_to_watch
         self._directory_for_status = directory_for_status
         self._check_every = check_every
+        self._socket_path = socket_path
 
     def run(self):
         """
@@ -40,12 +44,20 @@ class IdmtoolsJobWatcher:
         event_handler = IdmtoolsJobHandler(self._directory_for_status)
         self.observer.schedule(event_handler, str(self._directory_to_watch), recursive=False)
         self.observer.start()
+        server = None
+        if self._socket_path:
+            server = BridgeSocketServer(self._socket_path)
+            server.start()
         try:
             while True:
                 time.sleep(self._check_every)
         except Exception as e:
             self.observer.stop()
             logger.exception(e)
+        finally:
+            if server is not None:
+                server.shutdown()
+                server.server_close()
         self.observer.join()
 
 
@@ -75,3 +87,13 @@ class IdmtoolsJobHandler(FileSystemEventHandler):
         """
         if str(event.src_path).endswith(".json"):
             process_job(event.src_path, self._directory_for_status, self._cleanup_job)
+
+    def on_moved(self, event):
+        """
+        On Moved events. Clients write jobs to a temporary file and then move it in place.
+
+        Args:
+            event: Event details.
+        """
+        if str(event.dest_path).endswith(".json"):
+            process_job(event.dest_path, self._directory_for_status, self._cleanup_job)
@@ -1,11 +1,16 @@
+import json
+import socket
 from os import PathLike
+from pathlib import Path
 from unittest import mock
 
 import pytest_mock
 
 import idmtools_slurm_utils
 from idmtools_slurm_utils.sbatch import ERROR_NO_WORKING_DIRECTORY
-from idmtools_slurm_utils.utils import get_job_result, ERROR_INVALID_COMMAND
+from idmtools_slurm_utils.socket_server import BridgeSocketServer
+from idmtools_slurm_utils.utils import get_job_result, get_message_result, process_job, ERROR_INVALID_COMMAND, \
+    ERROR_INVALID_MESSAGE
 
 
 def test_command_job(slurm_bridge_command_sbatch_valid: PathLike, mocker: pytest_mock.MockerFixture):
@@ -40,3 +45,56 @@ def test_command_invalid(slurm_bridge_command_invalid: PathLike):
     assert 'status' in result
     assert result['status'] == 'error'
     assert result['output'] == ERROR_INVALID_COMMAND
+
+
+def test_command_batch(slurm_bridge_test_dir: str, mocker: pytest_mock.MockerFixture):
+    mocker.patch('idmtools_slurm_utils.sbatch.run_sbatch', return_value=('Example Output', 0))
+    mocker.patch('idmtools_slurm_utils.scancel.run_cancel', return_value=('success', 0))
+    result = get_message_result(dict(requests=[
+        dict(command='sbatch', working_directory=slurm_bridge_test_dir),
+        dict(command='scancel', job_ids=['1', '2']),
+        dict(command='Invalid command')
+    ]))
+    assert [r['status'] for r in result['results']] == ['success', 'success', 'error']
+    assert result['results'][0]['output'] == "Example Output"
+    assert result['results'][2]['output'] == ERROR_INVALID_COMMAND
+    idmtools_slurm_utils.scancel.run_cancel.assert_called_once_with(['1', '2'])
+
+    result = get_message_result(dict(requests='sbatch'))
+    assert result['output'] == ERROR_INVALID_MESSAGE
+
+
+def test_socket_server(slurm_bridge_test_dir: str, mocker: pytest_mock.MockerFixture):
+    mocker.patch('idmtools_slurm_utils.sbatch.run_sbatch', return_value=('Example Output', 0))
+    socket_path = Path(slurm_bridge_test_dir).joinpath("bridge.sock")
+    server = BridgeSocketServer(socket_path)
+    server.start()
+    results = []
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(10)
+            sock.connect(str(socket_path))
+            with sock.makefile('rwb') as stream:
+                for message in [dict(command='sbatch', working_directory=slurm_bridge_test_dir),
+                                dict(requests=[dict(command='sbatch', working_directory=slurm_bridge_test_dir)] * 2)]:
+                    stream.write(json.dumps(message).encode('utf-8') + b'\n')
+                    stream.flush()
+                    results.append(json.loads(stream.readline()))
+                stream.write(b'not json\n')
+                stream.flush()
+                results.append(json.loads(stream.readline()))
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert results[0]['output'] == "Example Output"
+    assert [r['output'] for r in results[1]['results']] == ["Example Output"] * 2
+    assert results[2]['output'] == ERROR_INVALID_MESSAGE
+    assert not socket_path.exists()
+
+
+def test_process_job_result(slurm_bridge_command_invalid: str, slurm_bridge_test_dir: str):
+    result_dir = Path(slurm_bridge_test_dir).joinpath("results")
+    process_job(slurm_bridge_command_invalid, result_dir)
+    # results are moved in place once written
+    assert [p.name for p in result_dir.iterdir()] == ['job.json.result']
+    assert not Path(slurm_bridge_command_invalid).exists()